@@ -0,0 +1,4 @@
+"""Throughput and latency benchmarks for the repositories and the API.
+
+Not part of the test run; see ``python -m benchmarks --help``.
+"""
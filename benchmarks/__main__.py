@@ -0,0 +1,143 @@
+"""Run the benchmark suite.
+
+Usage: python -m benchmarks [SUITE] [--sizes 0,10000] [--concurrency 1,16]
+       [--requests N] [--ops N] [--fast-json] [--json out.json]
+       [--baseline baseline.json] [--tolerance 0.15]
+
+Suites: micro, memory, queue, contention, dispatch, overhead, load, or all.
+
+Prints one line per measurement, optionally writes them as JSON, and with
+--baseline exits 1 if any measurement regressed beyond the tolerance.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timezone
+from typing import List
+
+
+def _ints(raw: str) -> List[int]:
+    return [int(x) for x in raw.split(",") if x]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "suite",
+        nargs="?",
+        default="all",
+        choices=(
+            "micro",
+            "memory",
+            "queue",
+            "contention",
+            "dispatch",
+            "overhead",
+            "load",
+            "all",
+        ),
+    )
+    parser.add_argument("--only", default="", help="comma-separated benchmark names")
+    parser.add_argument(
+        "--sizes", type=_ints, default=[0, 10_000], help="dataset sizes"
+    )
+    parser.add_argument(
+        "--ops", type=int, default=5_000, help="calls per micro-benchmark"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_ints,
+        default=[1, 16],
+        help="client coroutines per load run, writer threads per contention run",
+    )
+    parser.add_argument(
+        "--requests", type=int, default=2_000, help="requests per load run"
+    )
+    parser.add_argument(
+        "--fast-json",
+        action="store_true",
+        help="run the API with ORCHESTRATOR_FAST_JSON on",
+    )
+    parser.add_argument("--json", dest="json_path", help="write results here")
+    parser.add_argument("--baseline", help="report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.15)
+    args = parser.parse_args(argv)
+
+    if args.fast_json:
+        os.environ["ORCHESTRATOR_FAST_JSON"] = "1"
+    # imported late so --help works without the app importable
+    from benchmarks import (
+        contention,
+        dispatch,
+        load,
+        memory,
+        micro,
+        overhead,
+        task_queue,
+    )
+    from benchmarks.harness import Report, compare, environment, format_result
+
+    only = [n for n in args.only.split(",") if n]
+    report = Report(
+        meta={
+            **environment(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "argv": sys.argv[1:] if argv is None else list(argv),
+        }
+    )
+    if args.suite in ("micro", "all"):
+        names = [n for n in micro.BENCHMARKS if not only or n in only]
+        for result in micro.run(names, args.sizes, args.ops):
+            print(format_result(result), flush=True)
+            report.results.append(result)
+    # suites run whole, unless --only names none of their benchmarks
+    suites = {
+        "memory": (memory.NAMES, lambda: memory.run(args.sizes, args.ops)),
+        "queue": (task_queue.NAMES, lambda: task_queue.run(args.ops)),
+        "contention": (
+            contention.NAMES,
+            lambda: contention.run(args.concurrency, args.ops),
+        ),
+        "dispatch": (dispatch.NAMES, lambda: dispatch.run(args.ops)),
+        "overhead": (overhead.NAMES, lambda: overhead.run(args.ops, args.requests)),
+    }
+    for suite, (suite_names, run) in suites.items():
+        if args.suite not in (suite, "all") or (
+            only and not set(only) & set(suite_names)
+        ):
+            continue
+        for result in run():
+            print(format_result(result), flush=True)
+            report.results.append(result)
+    if args.suite in ("load", "all"):
+        names = [n for n in load.SCENARIOS if not only or n in only]
+        # the app's repositories are process-wide, so load runs at the largest size
+        results = load.run(names, args.concurrency, args.requests, max(args.sizes))
+        for result in results:
+            print(format_result(result), flush=True)
+            report.results.append(result)
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            f.write(report.to_json())
+    if args.baseline:
+        regressions = compare(report, Report.load(args.baseline), args.tolerance)
+        for change in regressions:
+            print(
+                f"REGRESSION {change.key} {change.metric}: "
+                f"{change.baseline:,.1f} -> {change.current:,.1f} "
+                f"({(change.ratio - 1) * 100:+.0f}%)"
+            )
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
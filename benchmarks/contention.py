@@ -0,0 +1,55 @@
+"""Write contention on the in-memory execution repository.
+
+Each of ``writers`` threads creates executions and moves them PENDING ->
+RUNNING; one operation is that create and update pair, timed on the thread
+doing it.
+"""
+
+from __future__ import annotations
+from time import perf_counter_ns
+from typing import List
+import threading
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+
+from benchmarks.harness import Result, summarize
+
+NAMES = ("executions.contention",)
+
+
+def _contend(writers: int, ops: int) -> Result:
+    repo = InMemoryExecutionRepo()
+    per_thread = max(1, ops // writers)
+    barrier = threading.Barrier(writers + 1)
+    latencies: List[List[int]] = []
+
+    def work() -> None:
+        payload = ExecutionCreate(reservation_id="bench")
+        mine = [0] * per_thread
+        latencies.append(mine)
+        barrier.wait()
+        for i in range(per_thread):
+            t0 = perf_counter_ns()
+            ex = repo.create(payload)
+            repo.update(
+                ex.id,
+                expected_status=ExecutionStatus.PENDING,
+                status=ExecutionStatus.RUNNING,
+            )
+            mine[i] = perf_counter_ns() - t0
+
+    threads = [threading.Thread(target=work) for _ in range(writers)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    start = perf_counter_ns()
+    for t in threads:
+        t.join()
+    elapsed = perf_counter_ns() - start
+    merged = [ns for mine in latencies for ns in mine]
+    return summarize(NAMES[0], {"writers": writers}, merged, elapsed)
+
+
+def run(concurrencies: List[int], ops: int) -> List[Result]:
+    return [_contend(writers, ops) for writers in concurrencies]
@@ -0,0 +1,120 @@
+"""Fair, priority-aging dispatch of queued executions.
+
+Replays Poisson arrivals from tenants of very different sizes onto a fixed
+pool of workers on a simulated clock, and reports each tenant's queue wait
+as ``dispatch.wait``. Its latencies are simulated time and it has no
+throughput (0 ops/s), so a baseline comparison flags only longer waits.
+``order=fifo`` replays the same arrivals through one FIFO for everybody, as
+before fair queueing. ``dispatch.pop`` times FairQueue.pop with a large
+backlog.
+"""
+
+from __future__ import annotations
+from collections import deque
+from typing import Deque, Dict, Generic, Iterator, List, Tuple, TypeVar, Union
+import heapq
+import random
+
+from orchestrator.services.fair_queue import FairQueue
+
+from benchmarks.harness import Result, summarize, time_calls
+
+NAMES = ("dispatch.wait", "dispatch.pop")
+# tenant: (weight, share of arrivals, chance a job is high priority)
+TENANTS = {
+    "heavy": (1, 0.70, 0.0),
+    "medium": (1, 0.25, 0.1),
+    "light": (1, 0.04, 0.5),
+    "vip": (2, 0.01, 0.0),
+}
+SERVICE_SECONDS = 60.0
+WORKERS = 16
+LOAD = 1.05  # arrivals per unit of worker capacity: a growing backlog
+SEED = 7
+WARMUP = 100
+
+T = TypeVar("T")
+# (tenant, enqueued at)
+Job = Tuple[str, float]
+
+
+class SimClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FifoQueue(Generic[T]):
+    """Baseline: one FIFO for everybody, as before fair queueing."""
+
+    def __init__(self) -> None:
+        self._q: Deque[T] = deque()
+
+    def __bool__(self) -> bool:
+        return bool(self._q)
+
+    def push(self, key: str, item: T, tenant: str, priority: int) -> None:
+        self._q.append(item)
+
+    def pop(self) -> T:
+        return self._q.popleft()
+
+
+def arrivals(jobs: int) -> Iterator[Tuple[float, str, str, int]]:
+    rng = random.Random(SEED)
+    rate = LOAD * WORKERS / SERVICE_SECONDS
+    names = list(TENANTS)
+    shares = [TENANTS[n][1] for n in names]
+    t = 0.0
+    for i in range(jobs):
+        t += rng.expovariate(rate)
+        tenant = rng.choices(names, shares)[0]
+        priority = 5 if rng.random() < TENANTS[tenant][2] else 0
+        yield t, f"j{i}", tenant, priority
+
+
+def simulate(jobs: int, fifo: bool) -> Dict[str, List[float]]:
+    """Queue waits per tenant, in simulated seconds."""
+    clock = SimClock()
+    weights = {name: spec[0] for name, spec in TENANTS.items()}
+    queue: Union[FifoQueue[Job], FairQueue[Job]] = (
+        FifoQueue() if fifo else FairQueue(weights, clock=clock)
+    )
+    free = [0.0] * WORKERS  # heap of times each worker becomes idle
+    waits: Dict[str, List[float]] = {name: [] for name in TENANTS}
+    pending = list(arrivals(jobs))
+    pending.reverse()
+    while pending or queue:
+        dispatch_at = max(free[0], clock.now)
+        if pending and (not queue or pending[-1][0] <= dispatch_at):
+            t, key, tenant, priority = pending.pop()
+            clock.now = t
+            queue.push(key, (tenant, t), tenant, priority)
+            continue
+        clock.now = dispatch_at
+        tenant, enqueued = queue.pop()
+        waits[tenant].append(dispatch_at - enqueued)
+        heapq.heapreplace(free, dispatch_at + SERVICE_SECONDS)
+    return waits
+
+
+def _pop(backlog: int) -> Result:
+    queue: FairQueue[int] = FairQueue(clock=SimClock())
+    for i in range(backlog + WARMUP):
+        queue.push(f"j{i}", i, f"t{i % 100}", i % 10)
+    return time_calls("dispatch.pop", {"backlog": backlog}, queue.pop, backlog)
+
+
+def run(ops: int) -> List[Result]:
+    jobs = 10 * ops
+    results = []
+    for order in ("fair", "fifo"):
+        waits = simulate(jobs, fifo=order == "fifo")
+        for tenant, values in waits.items():
+            params: Dict[str, object] = {"order": order, "tenant": tenant}
+            waits_ns = [int(wait * 1e9) for wait in values]
+            results.append(summarize("dispatch.wait", params, waits_ns, 0))
+    results.append(_pop(ops))
+    return results
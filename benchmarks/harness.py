@@ -0,0 +1,157 @@
+"""Timing, statistics, JSON reports and baseline comparison."""
+
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Sequence
+import json
+import math
+import platform
+import sys
+
+
+@dataclass
+class Result:
+    """One benchmark at one parameter set."""
+
+    name: str
+    params: Dict[str, object]
+    count: int
+    ops_per_sec: float
+    p50_us: float
+    p95_us: float
+    p99_us: float
+    mean_us: float
+    errors: int = 0
+    # heap held per record, for the memory benchmarks; 0 elsewhere
+    bytes_per_item: float = 0.0
+
+    @property
+    def key(self) -> str:
+        # identifies the same measurement across runs
+        args = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{args}]"
+
+
+def percentile(sorted_ns: Sequence[int], q: float) -> float:
+    """Nearest-rank percentile of ascending nanosecond samples, in us."""
+    if not sorted_ns:
+        return 0.0
+    rank = max(1, math.ceil(q * len(sorted_ns)))
+    return sorted_ns[rank - 1] / 1000
+
+
+def summarize(
+    name: str,
+    params: Dict[str, object],
+    latencies_ns: List[int],
+    elapsed_ns: int,
+    errors: int = 0,
+) -> Result:
+    latencies_ns.sort()
+    count = len(latencies_ns)
+    return Result(
+        name=name,
+        params=params,
+        count=count,
+        ops_per_sec=count / (elapsed_ns / 1e9) if elapsed_ns else 0.0,
+        p50_us=percentile(latencies_ns, 0.50),
+        p95_us=percentile(latencies_ns, 0.95),
+        p99_us=percentile(latencies_ns, 0.99),
+        mean_us=sum(latencies_ns) / count / 1000 if count else 0.0,
+        errors=errors,
+    )
+
+
+def time_calls(
+    name: str,
+    params: Dict[str, object],
+    fn: Callable[[], object],
+    ops: int,
+    warmup: int = 100,
+) -> Result:
+    """Call ``fn`` ``ops`` times on this thread, timing each call."""
+    for _ in range(warmup):
+        fn()
+    latencies = [0] * ops
+    clock = perf_counter_ns
+    start = clock()
+    for i in range(ops):
+        t0 = clock()
+        fn()
+        latencies[i] = clock() - t0
+    return summarize(name, params, latencies, clock() - start)
+
+
+@dataclass
+class Report:
+    results: List[Result] = field(default_factory=list)
+    meta: Dict[str, object] = field(default_factory=dict)
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"meta": self.meta, "results": [asdict(r) for r in self.results]},
+            indent=2,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Report":
+        with open(path) as f:
+            raw = json.load(f)
+        return cls([Result(**r) for r in raw["results"]], raw.get("meta", {}))
+
+
+def environment() -> Dict[str, object]:
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def format_result(r: Result) -> str:
+    line = (
+        f"{r.key:<66} {r.ops_per_sec:>11,.0f} ops/s  "
+        f"p50 {r.p50_us:>9.1f}  p95 {r.p95_us:>9.1f}  p99 {r.p99_us:>9.1f} us"
+    )
+    if r.bytes_per_item:
+        line += f"  {r.bytes_per_item:>8,.0f} B/item"
+    return line + (f"  errors {r.errors}" if r.errors else "")
+
+
+@dataclass
+class Change:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else math.inf
+
+
+def compare(current: Report, baseline: Report, tolerance: float = 0.15) -> List[Change]:
+    """Measurements worse than the baseline by more than ``tolerance``:
+    throughput that fell, or p95 latency or memory per item that rose.
+    Benchmarks missing from either report are skipped."""
+    previous = {r.key: r for r in baseline.results}
+    regressions = []
+    for r in current.results:
+        old: Optional[Result] = previous.get(r.key)
+        if old is None:
+            continue
+        if r.ops_per_sec < old.ops_per_sec * (1 - tolerance):
+            regressions.append(
+                Change(r.key, "ops_per_sec", old.ops_per_sec, r.ops_per_sec)
+            )
+        if r.p95_us > old.p95_us * (1 + tolerance):
+            regressions.append(Change(r.key, "p95_us", old.p95_us, r.p95_us))
+        if old.bytes_per_item and r.bytes_per_item > old.bytes_per_item * (
+            1 + tolerance
+        ):
+            regressions.append(
+                Change(r.key, "bytes_per_item", old.bytes_per_item, r.bytes_per_item)
+            )
+    return regressions
@@ -0,0 +1,212 @@
+"""In-process load generator for the API.
+
+Drives the FastAPI ``app`` through httpx's ASGI transport, so requests run
+the full middleware, routing, validation and threadpool path without a
+socket. ``concurrency`` client coroutines share the request budget; the
+latency of each request is recorded.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+
+import httpx
+
+from orchestrator import deps
+from orchestrator.api.responses import etag
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.models.reservation import ReservationCreate
+
+from benchmarks.harness import Result, summarize
+
+Request = Tuple[str, str, Optional[dict]]
+
+_EPOCH = datetime(2095, 1, 1, tzinfo=timezone.utc)
+_slots = count()
+
+
+def _window() -> Tuple[datetime, datetime]:
+    # every reservation gets its own hour, so none conflict
+    start = _EPOCH + timedelta(hours=next(_slots))
+    return start, start + timedelta(hours=1)
+
+
+class Scenario:
+    """One endpoint under load: ``prepare`` makes whatever the requests
+    need, ``request(i)`` builds the i-th request."""
+
+    name = ""
+    expect = 200
+
+    def prepare(self, requests: int) -> None:
+        pass
+
+    def request(self, i: int) -> Request:
+        raise NotImplementedError
+
+    def headers(self, i: int) -> Optional[Dict[str, str]]:
+        return None
+
+
+class CreateReservation(Scenario):
+    name = "POST /reservations"
+    expect = 201
+
+    def request(self, i: int) -> Request:
+        start, end = _window()
+        body = {
+            "user_id": f"load-{i % 50}",
+            "bench_type": "LOAD",
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        }
+        return "POST", "/reservations", body
+
+
+class CreateExecution(Scenario):
+    name = "POST /executions"
+    expect = 201
+
+    def prepare(self, requests: int) -> None:
+        start, end = _window()
+        self.reservation_id = (
+            deps.get_repo()
+            .create(
+                ReservationCreate(
+                    user_id="load", bench_type="LOAD", start=start, end=end
+                )
+            )
+            .id
+        )
+
+    def request(self, i: int) -> Request:
+        return "POST", "/executions", {"reservation_id": self.reservation_id}
+
+
+class StartExecution(Scenario):
+    name = "POST /executions/{id}/start"
+    expect = 202
+
+    def prepare(self, requests: int) -> None:
+        created = deps.get_execution_repo().create_many(
+            [ExecutionCreate(reservation_id="load") for _ in range(requests)]
+        )
+        self.ids = [ex.id for ex in created]
+
+    def request(self, i: int) -> Request:
+        return "POST", f"/executions/{self.ids[i]}/start", None
+
+
+class GetExecution(Scenario):
+    name = "GET /executions/{id}"
+
+    def prepare(self, requests: int) -> None:
+        created = deps.get_execution_repo().create_many(
+            [ExecutionCreate(reservation_id="load") for _ in range(100)]
+        )
+        self.ids = [ex.id for ex in created]
+
+    def request(self, i: int) -> Request:
+        return "GET", f"/executions/{self.ids[i % len(self.ids)]}", None
+
+
+class PollExecution(GetExecution):
+    """A poller that already has the current ETag of what it polls."""
+
+    name = "GET /executions/{id} If-None-Match"
+    expect = 304
+
+    def prepare(self, requests: int) -> None:
+        super().prepare(requests)
+        repo = deps.get_execution_repo()
+        self.etags = [etag(repo.get(eid)) for eid in self.ids]
+
+    def headers(self, i: int) -> Optional[Dict[str, str]]:
+        return {"If-None-Match": self.etags[i % len(self.etags)]}
+
+
+class ListExecutions(Scenario):
+    name = "GET /executions?limit=1000"
+
+    def prepare(self, requests: int) -> None:
+        repo = deps.get_execution_repo()
+        if len(list(repo.list(limit=1000))) < 1000:
+            repo.create_many(
+                [ExecutionCreate(reservation_id="load") for _ in range(1000)]
+            )
+
+    def request(self, i: int) -> Request:
+        return "GET", "/executions?limit=1000", None
+
+
+SCENARIOS: Dict[str, Callable[[], Scenario]] = {
+    s.name: s
+    for s in (
+        CreateReservation,
+        CreateExecution,
+        StartExecution,
+        GetExecution,
+        PollExecution,
+        ListExecutions,
+    )
+}
+
+
+def preload(size: int) -> None:
+    """Fill the app's repositories with ``size`` reservations and executions."""
+    repo = deps.get_repo()
+    for _ in range(size):
+        start, end = _window()
+        repo.create(
+            ReservationCreate(user_id="seed", bench_type="SEED", start=start, end=end)
+        )
+    deps.get_execution_repo().create_many(
+        [ExecutionCreate(reservation_id="seed") for _ in range(size)]
+    )
+
+
+async def drive(scenario: Scenario, requests: int, concurrency: int) -> Result:
+    scenario.prepare(requests)
+    latencies: List[int] = []
+    errors = 0
+    next_index = count()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as c:
+
+        async def client() -> None:
+            nonlocal errors
+            while True:
+                i = next(next_index)
+                if i >= requests:
+                    return
+                method, url, body = scenario.request(i)
+                t0 = perf_counter_ns()
+                response = await c.request(
+                    method, url, json=body, headers=scenario.headers(i)
+                )
+                latencies.append(perf_counter_ns() - t0)
+                if response.status_code != scenario.expect:
+                    errors += 1
+
+        start = perf_counter_ns()
+        await asyncio.gather(*(client() for _ in range(concurrency)))
+        elapsed = perf_counter_ns() - start
+    params: Dict[str, object] = {"concurrency": concurrency, "requests": requests}
+    return summarize(scenario.name, params, latencies, elapsed, errors)
+
+
+def run(
+    names: List[str], concurrencies: List[int], requests: int, size: int
+) -> List[Result]:
+    preload(size)
+    results = []
+    for name in names:
+        for concurrency in concurrencies:
+            result = asyncio.run(drive(SCENARIOS[name](), requests, concurrency))
+            result.params["size"] = size
+            results.append(result)
+    return results
@@ -0,0 +1,87 @@
+"""Memory held per execution by the in-memory execution repository.
+
+Fills a repository with ``size`` executions (spread over 1000 reservations,
+100 commits and 10 suites, half of them run to completion) and measures the
+Python heap it holds per record, against keeping the same executions as
+pydantic models in a dict. Each is then timed reading a 1000-item page back,
+which for the repository builds the models.
+"""
+
+from __future__ import annotations
+from datetime import datetime
+from itertools import islice
+from typing import Callable, Iterator, List, Optional, Tuple, TypeVar
+import gc
+import tracemalloc
+
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+
+from benchmarks.harness import Result, time_calls
+
+T = TypeVar("T")
+
+NAMES = ("executions.memory", "executions.memory.models")
+PAGE = 1000
+BATCH = 10_000
+
+
+def _payload(i: int) -> ExecutionCreate:
+    return ExecutionCreate(
+        reservation_id=f"res-{i % 1000}",
+        commit_sha=f"{i % 100:040x}",
+        test_suite=f"suite-{i % 10}",
+    )
+
+
+def _fill(size: int) -> InMemoryExecutionRepo:
+    repo = InMemoryExecutionRepo()
+    for first in range(0, size, BATCH):
+        created = repo.create_many(
+            [_payload(i) for i in range(first, min(first + BATCH, size))]
+        )
+        for ex in created[::2]:
+            now = datetime.utcnow()
+            repo.update(ex.id, status=ExecutionStatus.RUNNING, started_at=now)
+            repo.update(ex.id, status=ExecutionStatus.COMPLETED, finished_at=now)
+    return repo
+
+
+def _every(repo: InMemoryExecutionRepo) -> Iterator[Execution]:
+    after: Optional[str] = None
+    while True:
+        page = list(repo.list(limit=PAGE, after=after))
+        if not page:
+            return
+        yield from page
+        after = page[-1].id
+
+
+def held(build: Callable[[], T]) -> Tuple[T, int]:
+    """What ``build`` returns, and the bytes of heap still held for it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()
+        gc.collect()
+        return kept, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(sizes: List[int], ops: int) -> List[Result]:
+    results = []
+    # bytes per record mean nothing for an empty repository
+    for size in [s for s in sizes if s > 0]:
+        repo, size_repo = held(lambda: _fill(size))
+        models, size_models = held(lambda: {ex.id: ex for ex in _every(repo)})
+        ops_by_name = (
+            (size_repo, lambda: list(repo.list(limit=PAGE))),
+            (size_models, lambda: list(islice(models.values(), PAGE))),
+        )
+        for name, (nbytes, op) in zip(NAMES, ops_by_name):
+            result = time_calls(name, {"size": size}, op, ops, warmup=10)
+            result.bytes_per_item = nbytes / size
+            results.append(result)
+    return results
@@ -0,0 +1,174 @@
+"""Micro-benchmarks of the in-memory repositories and the bench scheduler.
+
+Each benchmark is a setup function taking the dataset size, which fills a
+fresh repository with that many records and returns the operation to time.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from typing import Callable, Dict, List
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.models.reservation import ReservationCreate
+from orchestrator.repository.in_memory import InMemoryReservationRepo
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.scheduler import BenchPool, CapacityScheduler
+
+from benchmarks.harness import Result, time_calls
+
+Setup = Callable[[int], Callable[[], object]]
+BENCHMARKS: Dict[str, Setup] = {}
+
+BENCH_TYPES = ("SIL", "HIL", "VIL", "CLOUD")
+POOL = 4000  # benches in the scheduler benchmarks' pool
+HOUR = 3600.0
+_EPOCH = datetime(2090, 1, 1, tzinfo=timezone.utc)
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _reservation(i: int) -> ReservationCreate:
+    # one-hour slots, spread over the bench types so none ever overlap
+    start = _EPOCH + timedelta(hours=i // len(BENCH_TYPES))
+    return ReservationCreate(
+        user_id=f"user-{i % 50}",
+        bench_type=BENCH_TYPES[i % len(BENCH_TYPES)],
+        start=start,
+        end=start + timedelta(hours=1),
+    )
+
+
+def _reservations(size: int):
+    repo = InMemoryReservationRepo()
+    ids = [repo.create(_reservation(i)).id for i in range(size)]
+    return repo, ids
+
+
+def _executions(size: int):
+    repo = InMemoryExecutionRepo()
+    created = repo.create_many(
+        [ExecutionCreate(reservation_id=f"r{i % 1000}") for i in range(size)]
+    )
+    return repo, [ex.id for ex in created]
+
+
+def _cycle(ids: List[str]) -> Callable[[], str]:
+    it = count()
+    return lambda: ids[next(it) % len(ids)]
+
+
+@benchmark("reservations.create")
+def reservations_create(size: int):
+    repo, _ = _reservations(size)
+    n = count(size)
+    return lambda: repo.create(_reservation(next(n)))
+
+
+@benchmark("reservations.get")
+def reservations_get(size: int):
+    repo, ids = _reservations(max(size, 1))
+    pick = _cycle(ids)
+    return lambda: repo.get(pick())
+
+
+@benchmark("reservations.list")
+def reservations_list(size: int):
+    repo, _ = _reservations(size)
+    return lambda: list(repo.list(limit=100, bench_type="SIL"))
+
+
+@benchmark("reservations.find_overlapping")
+def reservations_find_overlapping(size: int):
+    repo, _ = _reservations(size)
+    hours = max(1, size // len(BENCH_TYPES))
+    n = count()
+
+    def find():
+        start = _EPOCH + timedelta(hours=next(n) % hours)
+        return repo.find_overlapping("HIL", start, start + timedelta(hours=3))
+
+    return find
+
+
+@benchmark("executions.create")
+def executions_create(size: int):
+    repo, _ = _executions(size)
+    payload = ExecutionCreate(reservation_id="bench")
+    return lambda: repo.create(payload)
+
+
+@benchmark("executions.get")
+def executions_get(size: int):
+    repo, ids = _executions(max(size, 1))
+    pick = _cycle(ids)
+    return lambda: repo.get(pick())
+
+
+@benchmark("executions.update")
+def executions_update(size: int):
+    # alternate PENDING <-> RUNNING so every update is a real transition
+    repo, ids = _executions(max(size, 1))
+    pick = _cycle(ids)
+    flips = count()
+
+    def update():
+        eid = pick()
+        running = (next(flips) // len(ids)) % 2 == 0
+        return repo.update(
+            eid,
+            expected_status=(
+                ExecutionStatus.PENDING if running else ExecutionStatus.RUNNING
+            ),
+            status=ExecutionStatus.RUNNING if running else ExecutionStatus.PENDING,
+        )
+
+    return update
+
+
+@benchmark("executions.list")
+def executions_list(size: int):
+    repo, _ = _executions(size)
+    return lambda: list(repo.list(limit=100, status=ExecutionStatus.PENDING))
+
+
+def _scheduler(size: int):
+    # `size` one-hour bookings, filling the pool hour by hour
+    sched = CapacityScheduler(BenchPool.of_size({"SIL": POOL}))
+    for i in range(size):
+        start = (i // POOL) * HOUR
+        sched.assign("SIL", start, start + HOUR, f"r{i}")
+    return sched, -(-size // POOL) * HOUR
+
+
+@benchmark("scheduler.assign")
+def scheduler_assign(size: int):
+    # book (and free again) the hour after the last bookings end
+    sched, horizon = _scheduler(size)
+
+    def assign():
+        bench_id = sched.assign("SIL", horizon, horizon + HOUR, "next")
+        return sched.release("SIL", bench_id, horizon, "next")
+
+    return assign
+
+
+@benchmark("scheduler.next_slot")
+def scheduler_next_slot(size: int):
+    sched, horizon = _scheduler(size)
+    return lambda: sched.next_slot("SIL", HOUR, horizon - HOUR)
+
+
+def run(names: List[str], sizes: List[int], ops: int) -> List[Result]:
+    results = []
+    for name in names:
+        for size in sizes:
+            op = BENCHMARKS[name](size)
+            results.append(time_calls(name, {"size": size}, op, ops))
+    return results
@@ -0,0 +1,182 @@
+"""Cost of the metrics and logging instrumentation.
+
+Times the metric primitives (counter inc, histogram observe, timed vs bare
+lock) and logger calls on the calling thread, with the queued JSON setup
+against a JSON handler writing inline, both to /dev/null. Then calls a tiny
+FastAPI route and a no-op ASGI app straight through ASGI, bare and wrapped
+in each middleware; the no-op app isolates a middleware from the
+framework's own jitter.
+"""
+
+from __future__ import annotations
+from threading import Lock
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Tuple
+import asyncio
+import logging
+import os
+
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from orchestrator.api.middleware import CorrelationIdMiddleware, MetricsMiddleware
+from orchestrator.observability import log
+from orchestrator.observability.log import JsonFormatter, correlation_id
+from orchestrator.observability.metrics import Counter, Histogram, Registry
+from orchestrator.repository.striped import TimedLock
+
+from benchmarks.harness import Result, summarize, time_calls
+
+NAMES = ("overhead.primitive", "overhead.logging", "overhead.asgi")
+
+_SCOPE: Scope = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "path": "/items/42",
+    "raw_path": b"/items/42",
+    "root_path": "",
+    "query_string": b"",
+    "headers": [(b"host", b"bench")],
+    "server": ("bench", 80),
+    "client": ("bench", 1234),
+}
+
+
+def primitives(ops: int) -> List[Result]:
+    registry = Registry()
+    counter = Counter("c", "c", ("route",), registry=registry).labels("/x")
+    histogram = Histogram("h", "h", ("route",), registry=registry).labels("/x")
+    labelled = Histogram("l", "l", ("a", "b", "c"), registry=registry)
+    bare, timed = Lock(), TimedLock(lambda waited: None)
+
+    def with_bare() -> None:
+        with bare:
+            pass
+
+    def with_timed() -> None:
+        with timed:
+            pass
+
+    ops_by_name: Dict[str, Callable[[], object]] = {
+        "counter.inc": lambda: counter.inc(),
+        "histogram.observe": lambda: histogram.observe(0.0042),
+        "labels.observe": lambda: labelled.labels("GET", "/x", "200").observe(1),
+        "lock.bare": with_bare,
+        "lock.timed": with_timed,
+    }
+    return [
+        time_calls("overhead.primitive", {"op": name}, op, ops)
+        for name, op in ops_by_name.items()
+    ]
+
+
+def logging_cost(ops: int) -> List[Result]:
+    logger = logging.getLogger("bench")
+    root = logging.getLogger()
+    handlers, level = root.handlers, root.level
+    token = correlation_id.set("01HBENCHBENCHBENCHBENCHBEN")
+    try:
+        with open(os.devnull, "w") as sink:
+            inline = logging.StreamHandler(sink)
+            inline.setFormatter(JsonFormatter())
+            root.handlers = [inline]
+            root.setLevel(logging.INFO)
+
+            def info() -> None:
+                logger.info("run %s started", "x")
+
+            def debug() -> None:
+                logger.debug("detail %s", "x")
+
+            results = [time_calls("overhead.logging", {"call": "inline"}, info, ops)]
+            log.configure(level=logging.DEBUG, debug_sample_rate=0.0, stream=sink)
+            try:
+                results += [
+                    time_calls("overhead.logging", {"call": "queued"}, info, ops),
+                    time_calls("overhead.logging", {"call": "sampled-out"}, debug, ops),
+                ]
+            finally:
+                log.shutdown()  # waits for the listener to drain
+    finally:
+        root.handlers, root.level = handlers, level
+        correlation_id.reset(token)
+    return results
+
+
+def _item_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: str):
+        return {"id": item_id}
+
+    return app
+
+
+class _Route:
+    path = "/items/{item_id}"
+
+
+async def _noop_app(scope: Scope, receive: Receive, send: Send) -> None:
+    # stands in for the router: records the route and answers 200
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _drive(
+    app: ASGIApp, requests: int, params: Dict[str, object], headers
+) -> Result:
+    scope = {**_SCOPE, "headers": _SCOPE["headers"] + headers}
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    for _ in range(min(requests, 100)):
+        await app(dict(scope), receive, send)
+    latencies = [0] * requests
+    start = perf_counter_ns()
+    for i in range(requests):
+        t0 = perf_counter_ns()
+        await app(dict(scope), receive, send)
+        latencies[i] = perf_counter_ns() - t0
+    return summarize("overhead.asgi", params, latencies, perf_counter_ns() - start)
+
+
+def middleware_cost(requests: int) -> List[Result]:
+    histogram = Histogram(
+        "http_request_duration_seconds",
+        "bench",
+        ("method", "route", "status"),
+        registry=Registry(),
+    )
+    given = [(b"x-correlation-id", b"client-supplied-id")]
+    runs: List[Tuple[str, str, ASGIApp, list]] = []
+    apps: List[Tuple[str, ASGIApp]] = [("fastapi", _item_app()), ("noop", _noop_app)]
+    for name, app in apps:
+        runs += [
+            (name, "none", app, []),
+            (name, "metrics", MetricsMiddleware(app, histogram), []),
+        ]
+    runs += [
+        ("noop", "correlation-id", CorrelationIdMiddleware(_noop_app), []),
+        ("noop", "correlation-id-given", CorrelationIdMiddleware(_noop_app), given),
+    ]
+
+    async def measure() -> List[Result]:
+        return [
+            await _drive(app, requests, {"app": name, "middleware": mw}, headers)
+            for name, mw, app, headers in runs
+        ]
+
+    return asyncio.run(measure())
+
+
+def run(ops: int, requests: int) -> List[Result]:
+    return primitives(ops) + logging_cost(ops) + middleware_cost(requests)
@@ -0,0 +1,44 @@
+"""Throughput of the in-memory task queue.
+
+Times single pushes, then receive-and-ack of a batch of messages at a time
+from a queue filled beforehand.
+"""
+
+from __future__ import annotations
+from itertools import count
+from typing import List
+
+from orchestrator.queue import InMemoryTaskQueue, TaskEnvelope, TaskType
+
+from benchmarks.harness import Result, time_calls
+
+NAMES = ("queue.push", "queue.receive_ack")
+BATCH = 10
+WARMUP = 100
+TYPES = list(TaskType)
+
+
+def _envelopes(n: int) -> List[TaskEnvelope]:
+    return [
+        TaskEnvelope(execution_id=f"e{i}", type=TYPES[i % len(TYPES)]) for i in range(n)
+    ]
+
+
+def run(ops: int) -> List[Result]:
+    queue = InMemoryTaskQueue()
+    envelopes = _envelopes(ops + WARMUP)
+    n = count()
+    push = time_calls(
+        "queue.push", {}, lambda: queue.push(envelopes[next(n)]), ops, WARMUP
+    )
+
+    queue = InMemoryTaskQueue()
+    for env in _envelopes((ops + WARMUP) * BATCH):
+        queue.push(env)
+
+    def receive_ack() -> None:
+        for msg in queue.receive(max_messages=BATCH):
+            queue.ack(msg.receipt)
+
+    received = time_calls("queue.receive_ack", {"batch": BATCH}, receive_ack, ops)
+    return [push, received]
@@ -43,7 +43,7 @@ run_check_with_auto_fix() {
   # If check is ruff check -> fix with `ruff check --fix`
   elif [[ "${check_cmd[*]}" == *"ruff check"* ]]; then
     # append --fix to the ruff check command but run it as a separate invocation
-    fix_cmd=(poetry run ruff check src tests scripts --fix)
+    fix_cmd=(poetry run ruff check src tests scripts benchmarks --fix)
   else
     # no auto-fix known
     fix_cmd=()
@@ -90,13 +90,13 @@ run_step "Poetry check" poetry check || true
 run_step "Install dependencies" poetry install --no-interaction --no-ansi || true
 
 # 3. Black (format check) — auto-fix if issues
-run_check_with_auto_fix "Black (format check)" poetry run black --check src tests scripts || true
+run_check_with_auto_fix "Black (format check)" poetry run black --check src tests scripts benchmarks || true
 
 # 4. Ruff (lint check) — auto-fix if issues
-run_check_with_auto_fix "Ruff (lint check)" poetry run ruff check src tests scripts || true
+run_check_with_auto_fix "Ruff (lint check)" poetry run ruff check src tests scripts benchmarks || true
 
 # 5. Mypy (type checking)
-run_step "Mypy (type checking)" poetry run mypy src scripts || true
+run_step "Mypy (type checking)" poetry run mypy src scripts benchmarks || true
 
 # 6. Pytest (unit tests, verbose)
 run_step "Pytest (unit tests)" poetry run pytest -vv --maxfail=1 tests/unit || true
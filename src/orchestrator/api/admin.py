@@ -0,0 +1,50 @@
+import hmac
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.deps import get_profiler
+from orchestrator.observability.profiling import Profiler, collapsed
+
+router = APIRouter(prefix="/admin", tags=["admin"], route_class=ProfiledRoute)
+
+
+def admin_profiler(
+    x_admin_token: Optional[str] = Header(None),
+    profiler: Optional[Profiler] = Depends(get_profiler),
+) -> Profiler:
+    # without an admin token the endpoints do not exist, even when sampling
+    if profiler is None or not profiler.token:
+        raise HTTPException(status_code=404, detail="profiling is not enabled")
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), profiler.token.encode()
+    ):
+        raise HTTPException(status_code=403, detail="admin token required")
+    return profiler
+
+
+@router.get("/profiles")
+def list_profiles(
+    profiler: Profiler = Depends(admin_profiler),
+) -> List[Dict[str, Any]]:
+    """Recently captured request profiles, newest first."""
+    return [p.summary() for p in profiler.profiles()]
+
+
+@router.get("/profiles:merged", response_class=PlainTextResponse)
+def merged_profiles(
+    route: Optional[str] = None, profiler: Profiler = Depends(admin_profiler)
+):
+    """All kept profiles, or those of one route template, as one profile."""
+    return PlainTextResponse(collapsed(profiler.merged(route)))
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def get_profile(profile_id: str, profiler: Profiler = Depends(admin_profiler)):
+    """The profile's stacks in collapsed format (``frame;frame count``)."""
+    profile = profiler.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail="profile not found")
+    return PlainTextResponse(profile.collapsed())
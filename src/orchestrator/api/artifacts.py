@@ -0,0 +1,74 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.api.executions import get_service
+from orchestrator.artifacts import (
+    ArtifactConflictError,
+    ArtifactStore,
+    InvalidArtifactNameError,
+)
+from orchestrator.deps import get_artifact_store
+from orchestrator.models.artifact import Artifact
+from orchestrator.services.execution_service import ExecutionService
+
+router = APIRouter(prefix="/executions", tags=["artifacts"], route_class=ProfiledRoute)
+
+
+def _require_execution(svc: ExecutionService, execution_id: str) -> None:
+    if svc.get(execution_id) is None:
+        raise HTTPException(status_code=404, detail="execution not found")
+
+
+@router.put(
+    "/{execution_id}/artifacts/{name:path}",
+    response_model=Artifact,
+    status_code=status.HTTP_201_CREATED,
+)
+async def upload_artifact(
+    execution_id: str,
+    name: str,
+    request: Request,
+    svc: ExecutionService = Depends(get_service),
+    store: ArtifactStore = Depends(get_artifact_store),
+):
+    """Stream the raw request body into the store; never buffered whole."""
+    await run_in_threadpool(_require_execution, svc, execution_id)
+    try:
+        return await store.put(execution_id, name, request.stream())
+    except InvalidArtifactNameError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    except ArtifactConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+
+
+@router.get("/{execution_id}/artifacts", response_model=List[Artifact])
+def list_artifacts(
+    execution_id: str,
+    svc: ExecutionService = Depends(get_service),
+    store: ArtifactStore = Depends(get_artifact_store),
+):
+    _require_execution(svc, execution_id)
+    return store.list(execution_id)
+
+
+@router.get("/{execution_id}/artifacts/{name:path}")
+def download_artifact(
+    execution_id: str,
+    name: str,
+    store: ArtifactStore = Depends(get_artifact_store),
+):
+    """Serve the file with Range support, streamed from disk in chunks (or
+    handed to the server whole where it supports ASGI pathsend)."""
+    try:
+        artifact = store.get(execution_id, name)
+        path = store.path(execution_id, name) if artifact else None
+    except InvalidArtifactNameError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    if artifact is None or path is None:
+        raise HTTPException(status_code=404, detail="artifact not found")
+    # content digest as a strong ETag, which If-Range can match against
+    return FileResponse(path, headers={"etag": f'"{artifact.sha256}"'})
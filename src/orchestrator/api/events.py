@@ -0,0 +1,80 @@
+from typing import AsyncIterator, Iterable, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+
+from orchestrator.api.executions import get_service
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.api.streaming import SSE_KEEPALIVE, sse_event, sse_response
+from orchestrator.deps import get_event_bus
+from orchestrator.models.execution import Execution, ExecutionStatus
+from orchestrator.services.event_bus import EventBus, Subscription
+from orchestrator.services.execution_service import ExecutionService
+
+router = APIRouter(tags=["events"], route_class=ProfiledRoute)
+
+KEEPALIVE_SECONDS = 15.0
+TERMINAL = (
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+)
+
+
+async def iter_events(
+    sub: Subscription,
+    initial: Iterable[Execution] = (),
+    until_terminal: bool = False,
+    keepalive: float = KEEPALIVE_SECONDS,
+) -> AsyncIterator[str]:
+    """Render a subscription as SSE until it closes (or, for a single
+    execution, until that execution reaches a terminal state)."""
+    last_version = -1
+    try:
+        batch = list(initial)
+        while True:
+            for ex in batch:
+                if until_terminal:
+                    if ex.version <= last_version:
+                        continue  # already sent a newer state
+                    last_version = ex.version
+                yield sse_event("execution", ex.model_dump_json())
+                if until_terminal and ex.status in TERMINAL:
+                    return
+            if sub.overflowed:
+                # fell too far behind: the client re-reads state and reconnects
+                yield sse_event("overflow", "{}")
+                return
+            if sub.closed:
+                return
+            batch = await sub.get(keepalive)
+            if not batch and not sub.closed:
+                yield SSE_KEEPALIVE
+    finally:
+        sub.close()
+
+
+@router.get("/executions/{execution_id}/events")
+async def execution_events(
+    execution_id: str,
+    svc: ExecutionService = Depends(get_service),
+    bus: EventBus = Depends(get_event_bus),
+):
+    """Current state, then every change, ending once the run is finished."""
+    # subscribe first so no change between the read and the stream is lost
+    sub = bus.subscribe(execution_id=execution_id)
+    ex = await run_in_threadpool(svc.get, execution_id)
+    if ex is None:
+        sub.close()
+        raise HTTPException(status_code=404, detail="execution not found")
+    return sse_response(iter_events(sub, [ex], until_terminal=True))
+
+
+@router.get("/events")
+async def events(
+    reservation_id: Optional[str] = None,
+    bus: EventBus = Depends(get_event_bus),
+):
+    """Changes to every execution (or one reservation's) from now on."""
+    sub = bus.subscribe(reservation_id=reservation_id)
+    return sse_response(iter_events(sub))
@@ -1,20 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
-from orchestrator.models.execution import Execution, ExecutionCreate
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from typing import List, Optional
+from orchestrator.models.execution import (
+    Execution,
+    ExecutionBatchCreate,
+    ExecutionBatchItem,
+    ExecutionBatchResult,
+    ExecutionBatchStart,
+    ExecutionCreate,
+    ExecutionStatus,
+)
 from orchestrator.services.execution_service import (
     ExecutionService,
 )
-from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
-
-router = APIRouter(prefix="/executions", tags=["executions"])
+from orchestrator.repository.keyset import InvalidCursorError
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.api.responses import cached_model_response, model_response
+from orchestrator.api.streaming import ndjson_response
+from orchestrator.deps import get_engine, get_execution_repo, get_repo
 
-# Singleton in-memory repo to persist data across requests
-_execution_repo = InMemoryExecutionRepo()
+router = APIRouter(prefix="/executions", tags=["executions"], route_class=ProfiledRoute)
 
 
-# simple dependency factory (replaceable later)
+# simple dependency factory (replaceable later); the service only holds the
+# process-wide singletons, so building it is cheap. It is not cached: the
+# lifespan shuts the engine down, and the next request must get a new one.
 def get_service():
-    return ExecutionService(repo=_execution_repo)
+    repo = get_execution_repo()
+    return ExecutionService(
+        repo=repo,
+        engine=get_engine(repo),
+        reservations=get_repo(),
+    )
 
 
 @router.post("", response_model=Execution, status_code=status.HTTP_201_CREATED)
@@ -22,30 +38,100 @@ def create_execution(
     payload: ExecutionCreate, svc: ExecutionService = Depends(get_service)
 ):
     exe = svc.create(payload)
-    return exe
+    return model_response(exe, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    ":batch",
+    response_model=ExecutionBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_executions_batch(
+    payload: ExecutionBatchCreate, svc: ExecutionService = Depends(get_service)
+):
+    created = svc.create_many(payload.items)
+    result = ExecutionBatchResult(
+        results=[
+            ExecutionBatchItem(index=i, status=201, id=ex.id, execution=ex)
+            for i, ex in enumerate(created)
+        ]
+    )
+    return model_response(result, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(":batchStart", response_model=ExecutionBatchResult)
+def start_executions_batch(
+    payload: ExecutionBatchStart, svc: ExecutionService = Depends(get_service)
+):
+    results = []
+    for i, (eid, ex) in enumerate(zip(payload.ids, svc.start_many(payload.ids))):
+        if ex is None:
+            item = ExecutionBatchItem(
+                index=i, status=404, id=eid, detail="execution not found"
+            )
+        else:
+            item = ExecutionBatchItem(index=i, status=202, id=eid, execution=ex)
+        results.append(item)
+    return model_response(ExecutionBatchResult(results=results))
 
 
 @router.get("", response_model=List[Execution])
 def list_executions(
-    limit: int = Query(100, ge=1, le=1000), svc: ExecutionService = Depends(get_service)
+    limit: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = Query(None, description="id of the last item seen"),
+    status: Optional[ExecutionStatus] = None,
+    reservation_id: Optional[str] = None,
+    svc: ExecutionService = Depends(get_service),
+):
+    try:
+        items = svc.list(
+            limit=limit, after=after, status=status, reservation_id=reservation_id
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return model_response(items, List[Execution])
+
+
+@router.get("/export")
+def export_executions(
+    status: Optional[ExecutionStatus] = None,
+    reservation_id: Optional[str] = None,
+    svc: ExecutionService = Depends(get_service),
 ):
-    return svc.list(limit=limit)
+    """Stream every matching execution as NDJSON, one page at a time."""
+    return ndjson_response(
+        lambda limit, after: svc.list(
+            limit=limit, after=after, status=status, reservation_id=reservation_id
+        )
+    )
 
 
-@router.get("/{execution_id}", response_model=Execution)
-def get_execution(execution_id: str, svc: ExecutionService = Depends(get_service)):
-    ex = svc.get(execution_id)
-    if not ex:
+@router.get(
+    "/{execution_id}",
+    response_model=Execution,
+    responses={304: {"description": "Not modified since the ETag given"}},
+)
+def get_execution(
+    execution_id: str, request: Request, svc: ExecutionService = Depends(get_service)
+):
+    response = cached_model_response(
+        request, "executions", execution_id, lambda: svc.get(execution_id)
+    )
+    if response is None:
         raise HTTPException(status_code=404, detail="execution not found")
-    return ex
+    return response
 
 
-@router.post("/{execution_id}/start", response_model=Execution)
+@router.post(
+    "/{execution_id}/start",
+    response_model=Execution,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 def start_execution(execution_id: str, svc: ExecutionService = Depends(get_service)):
     ex = svc.start(execution_id)
     if ex is None:
         raise HTTPException(status_code=404, detail="execution not found")
-    return ex
+    return model_response(ex, status_code=status.HTTP_202_ACCEPTED)
 
 
 @router.post("/{execution_id}/stop", response_model=Execution)
@@ -53,4 +139,4 @@ def stop_execution(execution_id: str, svc: ExecutionService = Depends(get_servic
     ex = svc.stop(execution_id)
     if ex is None:
         raise HTTPException(status_code=404, detail="execution not found")
-    return ex
+    return model_response(ex)
@@ -0,0 +1,85 @@
+from typing import AsyncIterator, Awaitable, Callable
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.api.events import TERMINAL
+from orchestrator.api.executions import get_service
+from orchestrator.deps import get_live_logs
+from orchestrator.services.execution_service import ExecutionService
+from orchestrator.services.live_logs import LiveLogs, LogSink
+
+router = APIRouter(prefix="/executions", tags=["logs"], route_class=ProfiledRoute)
+
+READ_CHUNK = 64 << 10
+# how often a follower with no new output re-checks that the run is alive
+IDLE_CHECK_SECONDS = 5.0
+
+
+async def iter_log(
+    sink: LogSink,
+    offset: int,
+    follow: bool,
+    finished: Callable[[], Awaitable[bool]],
+    idle_check: float = IDLE_CHECK_SECONDS,
+) -> AsyncIterator[bytes]:
+    """Yield the log from ``offset``; when following, whole lines only,
+    until the sink is closed or ``finished()`` reports the run is over."""
+    while True:
+        start, data = await run_in_threadpool(sink.read, offset, READ_CHUNK)
+        seen = start + len(data)
+        if follow and not sink.closed and len(data) < READ_CHUNK:
+            # hold back a partial last line until the rest of it arrives
+            data = data[: data.rfind(b"\n") + 1]
+        if data:
+            offset = start + len(data)
+            yield data
+            continue
+        offset = start
+        if not follow or (sink.closed and offset >= sink.size):
+            return
+        if not await sink.wait(seen, idle_check) and await finished():
+            return
+
+
+@router.get("/{execution_id}/logs")
+async def tail_logs(
+    execution_id: str,
+    offset: int = Query(0, ge=0, description="byte offset to start from"),
+    follow: bool = False,
+    svc: ExecutionService = Depends(get_service),
+    logs: LiveLogs = Depends(get_live_logs),
+):
+    """Output of a running (or recently finished) execution as plain text.
+
+    ``X-Log-Offset`` is the offset the body starts at; it is past the one
+    asked for if those bytes are no longer held. Resume with that offset
+    plus the number of bytes received.
+    """
+    ex = await run_in_threadpool(svc.get, execution_id)
+    if ex is None:
+        raise HTTPException(status_code=404, detail="execution not found")
+    sink = logs.get(execution_id)
+    if sink is None:
+        # not started yet, or dropped; only runners open sinks, since one
+        # opened here would never be finished
+        raise HTTPException(status_code=404, detail="no live log for execution")
+
+    async def finished() -> bool:
+        current = await run_in_threadpool(svc.get, execution_id)
+        if current is None or current.status in TERMINAL:
+            logs.finish(execution_id)
+            return True
+        return False
+
+    return StreamingResponse(
+        iter_log(sink, offset, follow, finished),
+        media_type="text/plain; charset=utf-8",
+        headers={
+            "X-Log-Offset": str(sink.resolve(offset)),
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
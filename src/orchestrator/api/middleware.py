@@ -0,0 +1,156 @@
+import hmac
+import inspect
+import re
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from fastapi.routing import APIRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from orchestrator.ids import new_ulid
+from orchestrator.observability.log import correlation_id
+from orchestrator.observability.metrics import HTTP_REQUEST_DURATION
+from orchestrator.observability.profiling import (
+    Profiler,
+    attribute,
+    attribute_steps,
+)
+
+CORRELATION_HEADER = b"x-correlation-id"
+# client-supplied ids are kept if they are 1-128 visible ASCII characters,
+# so they are safe to echo and to log; anything else is replaced
+_VALID_CORRELATION_ID = re.compile(rb"[!-~]{1,128}")
+
+PROFILE_HEADER = b"x-profile"
+
+# route label for requests no route matched, to keep cardinality bounded
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """Times each HTTP request into a histogram labelled by route template.
+
+    Plain ASGI rather than BaseHTTPMiddleware, so no extra task or body
+    buffering per request. For streaming responses the time runs until the
+    stream ends.
+    """
+
+    def __init__(self, app: ASGIApp, histogram=HTTP_REQUEST_DURATION) -> None:
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        t0 = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # the router leaves the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            child = self.histogram.labels(scope["method"], route, str(status))
+            child.observe(perf_counter() - t0)
+
+
+class CorrelationIdMiddleware:
+    """Binds each request to a correlation id for logging (ADR-011).
+
+    The id comes from the ``X-Correlation-ID`` request header when present
+    and well formed, otherwise a new ULID. It is held in a context variable
+    for the request's duration and echoed in the response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        cid = None
+        for name, value in scope["headers"]:
+            if name == CORRELATION_HEADER:
+                if _VALID_CORRELATION_ID.fullmatch(value):
+                    cid = value
+                break
+        if cid is None:
+            cid = new_ulid().encode()
+        token = correlation_id.set(cid.decode("ascii"))
+
+        async def send_with_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (CORRELATION_HEADER, cid),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            correlation_id.reset(token)
+
+
+class ProfilingMiddleware:
+    """Samples the stacks of selected requests into the profiler.
+
+    A request is profiled when it sends ``X-Profile`` with the admin token,
+    or when it is the profiler's 1-in-N sample. ``get_profiler`` returns
+    None while profiling is off, which makes this a pass-through.
+    """
+
+    def __init__(
+        self, app: ASGIApp, get_profiler: Callable[[], Optional[Profiler]]
+    ) -> None:
+        self.app = app
+        self.get_profiler = get_profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.get_profiler() if scope["type"] == "http" else None
+        if profiler is None or not (self._asked(profiler, scope) or profiler.sampled()):
+            await self.app(scope, receive, send)
+            return
+
+        with profiler.profile(scope["method"], scope["path"]) as profile:
+
+            async def send_with_status(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    profile.status = message["status"]
+                await send(message)
+
+            try:
+                await attribute_steps(self.app(scope, receive, send_with_status))
+            finally:
+                profile.route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+
+    @staticmethod
+    def _asked(profiler: Profiler, scope: Scope) -> bool:
+        if not profiler.token:
+            return False
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return hmac.compare_digest(value, profiler.token.encode())
+        return False
+
+
+class ProfiledRoute(APIRoute):
+    """Route whose sync endpoint counts toward the request's profile.
+
+    FastAPI runs a sync endpoint on a threadpool thread, which the profiler
+    only samples while the call is attached to the request. Costs a context
+    variable lookup per call while the request is not profiled.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:
+        if not inspect.iscoroutinefunction(endpoint):
+            endpoint = attribute(endpoint)
+        super().__init__(path, endpoint, **kwargs)
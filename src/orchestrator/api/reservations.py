@@ -1,36 +1,151 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from typing import List
-from orchestrator.models.reservation import Reservation, ReservationCreate
-from orchestrator.repository.base import ReservationRepository
-from orchestrator.deps import get_repo_dep
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+from orchestrator.models.reservation import (
+    BenchSlot,
+    Reservation,
+    ReservationBatchCreate,
+    ReservationBatchDelete,
+    ReservationBatchItem,
+    ReservationBatchResult,
+    ReservationCreate,
+)
+from orchestrator.repository.base import (
+    ReservationConflictError,
+    ReservationRepository,
+)
+from orchestrator.repository.keyset import InvalidCursorError
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.api.responses import cached_model_response, model_response
+from orchestrator.api.streaming import ndjson_response
+from orchestrator.deps import get_repo_dep, get_response_cache
 
-router = APIRouter(prefix="/reservations", tags=["reservations"])
+router = APIRouter(
+    prefix="/reservations", tags=["reservations"], route_class=ProfiledRoute
+)
+
+# longest window /next-slot will look for
+NEXT_SLOT_MAX_SECONDS = 366 * 24 * 3600
 
 
 @router.post("", response_model=Reservation, status_code=status.HTTP_201_CREATED)
 def create_reservation(
     payload: ReservationCreate, repo: ReservationRepository = Depends(get_repo_dep)
 ):
-    res = repo.create(payload)
-    return res
+    try:
+        res = repo.create(payload)
+    except ReservationConflictError as exc:
+        raise HTTPException(status_code=409, detail=str(exc))
+    return model_response(res, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    ":batch",
+    response_model=ReservationBatchResult,
+    status_code=status.HTTP_201_CREATED,
+)
+def create_reservations_batch(
+    payload: ReservationBatchCreate,
+    repo: ReservationRepository = Depends(get_repo_dep),
+):
+    results = []
+    for i, res in enumerate(repo.create_many(payload.items)):
+        if isinstance(res, ReservationConflictError):
+            item = ReservationBatchItem(index=i, status=409, detail=str(res))
+        else:
+            item = ReservationBatchItem(index=i, status=201, id=res.id, reservation=res)
+        results.append(item)
+    return model_response(
+        ReservationBatchResult(results=results), status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.delete(":batch", response_model=ReservationBatchResult)
+def delete_reservations_batch(
+    payload: ReservationBatchDelete,
+    repo: ReservationRepository = Depends(get_repo_dep),
+):
+    deleted = repo.delete_many(payload.ids)
+    _uncache(rid for rid, ok in zip(payload.ids, deleted) if ok)
+    return ReservationBatchResult(
+        results=[
+            ReservationBatchItem(
+                index=i,
+                status=204 if ok else 404,
+                id=rid,
+                detail=None if ok else "reservation not found",
+            )
+            for i, (rid, ok) in enumerate(zip(payload.ids, deleted))
+        ]
+    )
 
 
 @router.get("", response_model=List[Reservation])
 def list_reservations(
     limit: int = Query(100, ge=1, le=1000),
+    after: Optional[str] = Query(None, description="id of the last item seen"),
+    user_id: Optional[str] = None,
+    bench_type: Optional[str] = None,
     repo: ReservationRepository = Depends(get_repo_dep),
 ):
-    return list(repo.list(limit=limit))
+    try:
+        items = list(
+            repo.list(limit=limit, after=after, user_id=user_id, bench_type=bench_type)
+        )
+    except InvalidCursorError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return model_response(items, List[Reservation])
 
 
-@router.get("/{reservation_id}", response_model=Reservation)
+@router.get("/export")
+def export_reservations(
+    user_id: Optional[str] = None,
+    bench_type: Optional[str] = None,
+    repo: ReservationRepository = Depends(get_repo_dep),
+):
+    """Stream every matching reservation as NDJSON, one page at a time."""
+    return ndjson_response(
+        lambda limit, after: list(
+            repo.list(limit=limit, after=after, user_id=user_id, bench_type=bench_type)
+        )
+    )
+
+
+@router.get("/next-slot", response_model=BenchSlot)
+def next_slot(
+    bench_type: str = Query(..., min_length=1),
+    duration_seconds: int = Query(..., ge=1, le=NEXT_SLOT_MAX_SECONDS),
+    not_before: Optional[datetime] = Query(None, description="defaults to now"),
+    repo: ReservationRepository = Depends(get_repo_dep),
+):
+    """Earliest window of the given length free on any bench of the type."""
+    try:
+        return repo.next_slot(
+            bench_type,
+            timedelta(seconds=duration_seconds),
+            not_before or datetime.now(timezone.utc),
+        )
+    except (OverflowError, ValueError):
+        # not_before so close to the end of the calendar that no slot fits
+        raise HTTPException(status_code=400, detail="no slot before year 9999")
+
+
+@router.get(
+    "/{reservation_id}",
+    response_model=Reservation,
+    responses={304: {"description": "Not modified since the ETag given"}},
+)
 def get_reservation(
-    reservation_id: str, repo: ReservationRepository = Depends(get_repo_dep)
+    reservation_id: str,
+    request: Request,
+    repo: ReservationRepository = Depends(get_repo_dep),
 ):
-    res = repo.get(reservation_id)
-    if not res:
+    response = cached_model_response(
+        request, "reservations", reservation_id, lambda: repo.get(reservation_id)
+    )
+    if response is None:
         raise HTTPException(status_code=404, detail="reservation not found")
-    return res
+    return response
 
 
 @router.delete("/{reservation_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -40,4 +155,13 @@ def delete_reservation(
     ok = repo.delete(reservation_id)
     if not ok:
         raise HTTPException(status_code=404, detail="reservation not found")
+    _uncache([reservation_id])
     return None
+
+
+def _uncache(reservation_ids: Iterable[str]) -> None:
+    # reservations are never updated in place, so deletes are all there is
+    cache = get_response_cache()
+    if cache is not None:
+        for rid in reservation_ids:
+            cache.invalidate(("reservations", rid))
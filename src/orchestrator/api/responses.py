@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from pydantic import TypeAdapter
+
+from orchestrator.deps import fast_json, get_response_cache
+from orchestrator.observability.metrics import RESPONSE_CACHE_LOOKUPS
+
+JSON_MEDIA_TYPE = "application/json"
+
+_adapters: Dict[Any, TypeAdapter] = {}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _adapter(tp: Any) -> TypeAdapter:
+    adapter = _adapters.get(tp)
+    if adapter is None:
+        adapter = _adapters[tp] = TypeAdapter(tp)
+    return adapter
+
+
+def model_response(
+    content: Any, response_type: Optional[Any] = None, status_code: int = 200
+) -> Any:
+    """Serialize trusted model output straight to a JSON response.
+
+    With ORCHESTRATOR_FAST_JSON on, ``content`` is dumped by pydantic's
+    serializer to bytes in one pass, skipping FastAPI's re-validation
+    against ``response_model`` and its own encoding. Only pass models the
+    repositories built, of exactly the declared type: nothing is checked.
+    ``response_type`` is needed for containers, e.g. ``List[Execution]``;
+    it defaults to the type of ``content``. When the mode is off,
+    ``content`` is returned as is for FastAPI to handle.
+    """
+    if not fast_json():
+        return content
+    body = _adapter(response_type or type(content)).dump_json(content)
+    return Response(body, status_code=status_code, media_type=JSON_MEDIA_TYPE)
+
+
+def etag(record: Any) -> str:
+    """Strong ETag of a stored record, from its version and ``updated_at``.
+
+    Every write bumps the version, so the tag changes with the body.
+    """
+    stamp = record.updated_at
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    micros = (stamp - _EPOCH) // _MICROSECOND
+    return f'"{record.version:x}-{micros:x}"'
+
+
+def _not_modified(if_none_match: Optional[str], tag: str) -> bool:
+    # If-None-Match compares weakly: W/"x" matches "x"
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().replace("W/", "", 1) == tag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def cached_model_response(
+    request: Request, resource: str, record_id: str, load: Callable[[], Any]
+) -> Optional[Response]:
+    """A single record's GET response, with an ETag and 304 handling.
+
+    The serialized body and its ETag come from the response cache while
+    fresh, so polling an unchanged record skips the repository and the
+    serializer; otherwise ``load`` reads it and the result is cached. An
+    ``If-None-Match`` naming the current ETag gets an empty 304. Returns
+    None when ``load`` finds nothing; misses are not cached.
+    """
+    cache = get_response_cache()
+    key = (resource, record_id)
+    entry = cache.get(key) if cache is not None else None
+    if entry is not None:
+        RESPONSE_CACHE_LOOKUPS.labels(resource, "hit").inc()
+        tag, body = entry.etag, entry.body
+    else:
+        token = 0
+        if cache is not None:
+            RESPONSE_CACHE_LOOKUPS.labels(resource, "miss").inc()
+            token = cache.token()
+        record = load()
+        if record is None:
+            return None
+        tag = etag(record)
+        body = _adapter(type(record)).dump_json(record)
+        if cache is not None:
+            cache.put(key, tag, body, token)
+    if _not_modified(request.headers.get("if-none-match"), tag):
+        return Response(status_code=304, headers={"ETag": tag})
+    return Response(body, media_type=JSON_MEDIA_TYPE, headers={"ETag": tag})
@@ -1,8 +1,11 @@
 # src/orchestrator/api/routes.py
 from fastapi import APIRouter
+from fastapi.responses import Response
 import orchestrator
+from orchestrator.api.middleware import ProfiledRoute
+from orchestrator.observability.metrics import CONTENT_TYPE, REGISTRY
 
-router = APIRouter()
+router = APIRouter(route_class=ProfiledRoute)
 
 
 @router.get("/ping")
@@ -14,3 +17,9 @@ def ping():
 def version():
     # return package version; keep response shape simple for tests
     return {"version": getattr(orchestrator, "__version__", "0.0.0")}
+
+
+@router.get("/metrics")
+def metrics():
+    # Prometheus text exposition format (ADR-010)
+    return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
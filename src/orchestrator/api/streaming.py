@@ -0,0 +1,57 @@
+from typing import AsyncIterator, Callable, Iterator, Optional, Protocol, Sequence
+
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+# comment line sent on idle streams so proxies keep them open
+SSE_KEEPALIVE = ": keepalive\n\n"
+EXPORT_CHUNK_SIZE = 1000
+
+
+class Row(Protocol):
+    """A model with the id the keyset cursor pages by."""
+
+    id: str
+
+    def model_dump_json(self) -> str: ...
+
+
+# fetch(limit, after) -> next page, using the repositories' keyset cursor
+PageFetcher = Callable[[int, Optional[str]], Sequence[Row]]
+
+
+def iter_ndjson(
+    fetch: PageFetcher, chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Walk every page via the keyset cursor, yielding one JSON line per row.
+
+    Only one page is held in memory at a time, so the export size does not
+    affect memory use or time to first byte.
+    """
+    after: Optional[str] = None
+    while True:
+        page = fetch(chunk_size, after)
+        if not page:
+            return
+        yield "".join(item.model_dump_json() + "\n" for item in page)
+        if len(page) < chunk_size:
+            return
+        after = page[-1].id
+
+
+def ndjson_response(fetch: PageFetcher) -> StreamingResponse:
+    return StreamingResponse(iter_ndjson(fetch), media_type=NDJSON_MEDIA_TYPE)
+
+
+def sse_event(event: str, data: str) -> str:
+    # data is a single line of JSON, so one "data:" field is enough
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    return StreamingResponse(
+        events,
+        media_type=SSE_MEDIA_TYPE,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
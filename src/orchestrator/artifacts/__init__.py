@@ -0,0 +1,15 @@
+"""Artifact storage (ADR-009): logs and outputs of executions."""
+
+from orchestrator.artifacts.base import (
+    ArtifactConflictError,
+    ArtifactStore,
+    InvalidArtifactNameError,
+)
+from orchestrator.artifacts.local import LocalArtifactStore
+
+__all__ = [
+    "ArtifactConflictError",
+    "ArtifactStore",
+    "InvalidArtifactNameError",
+    "LocalArtifactStore",
+]
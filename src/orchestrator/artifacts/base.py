@@ -0,0 +1,43 @@
+from __future__ import annotations
+from pathlib import Path
+from typing import AsyncIterable, List, Optional, Protocol
+
+from orchestrator.models.artifact import Artifact
+
+
+class InvalidArtifactNameError(ValueError):
+    """Raised for names that are empty, absolute or escape the execution."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(f"invalid artifact name: {name!r}")
+        self.name = name
+
+
+class ArtifactConflictError(Exception):
+    """Raised when a name is already taken by different content."""
+
+    def __init__(self, execution_id: str, name: str) -> None:
+        super().__init__(f"artifact {name!r} of {execution_id} already exists")
+        self.execution_id = execution_id
+        self.name = name
+
+
+class ArtifactStore(Protocol):
+    """Immutable per-execution artifact storage (ADR-009).
+
+    ``put`` consumes the content as a stream of chunks and is idempotent:
+    uploading the same bytes under the same name again returns the existing
+    artifact, other bytes raise ArtifactConflictError.
+    """
+
+    async def put(
+        self, execution_id: str, name: str, chunks: AsyncIterable[bytes]
+    ) -> Artifact: ...
+
+    def get(self, execution_id: str, name: str) -> Optional[Artifact]: ...
+
+    def list(self, execution_id: str) -> List[Artifact]: ...
+
+    def path(self, execution_id: str, name: str) -> Optional[Path]: ...
+
+    def uri(self, execution_id: str) -> str: ...
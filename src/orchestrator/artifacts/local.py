@@ -0,0 +1,202 @@
+from __future__ import annotations
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import Lock
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+import asyncio
+import hashlib
+import os
+import shutil
+import tempfile
+
+from orchestrator.artifacts.base import ArtifactConflictError, InvalidArtifactNameError
+from orchestrator.models.artifact import Artifact
+
+# bytes gathered before a write + hash is handed to a worker thread
+CHUNK_SIZE = 1 << 20
+_MAX_NAME = 1024
+
+
+class LocalArtifactStore:
+    """ADR-009 layout on a local or shared (EFS) disk.
+
+    ``executions/<execution_id>/<name>`` holds each upload, e.g.
+    ``logs/stdout.log`` or ``artifacts/results.json``, as a hard link to a
+    content-addressed blob under ``blobs/sha256/``; identical content
+    uploaded by any number of executions is stored once. Uploads stream
+    through a temp file while being hashed, so memory use is one chunk no
+    matter the size. Name, size and digest are appended to
+    ``index/<execution_id>.jsonl``.
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+        for sub in ("blobs", "executions", "index", "tmp"):
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+
+    async def put(
+        self, execution_id: str, name: str, chunks: AsyncIterable[bytes]
+    ) -> Artifact:
+        target = self._target(execution_id, name)
+        fd, tmp = tempfile.mkstemp(dir=self.root / "tmp")
+        try:
+            with os.fdopen(fd, "wb") as out:
+                digest = hashlib.sha256()
+                size = 0
+                pending: List[bytes] = []
+                buffered = 0
+                async for chunk in chunks:
+                    pending.append(chunk)
+                    buffered += len(chunk)
+                    if buffered >= CHUNK_SIZE:
+                        await asyncio.to_thread(_write, out, digest, pending)
+                        size += buffered
+                        pending, buffered = [], 0
+                await asyncio.to_thread(_write, out, digest, pending)
+                size += buffered
+            os.chmod(tmp, 0o444)  # blobs are immutable
+            return await asyncio.to_thread(
+                self._commit, execution_id, name, target, tmp, digest.hexdigest(), size
+            )
+        finally:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+
+    async def put_file(
+        self, execution_id: str, name: str, source: Union[str, Path]
+    ) -> Artifact:
+        return await self.put(execution_id, name, _file_chunks(Path(source)))
+
+    def get(self, execution_id: str, name: str) -> Optional[Artifact]:
+        return self._index(execution_id).get(name)
+
+    def list(self, execution_id: str) -> List[Artifact]:
+        index = self._index(execution_id)
+        return [index[name] for name in sorted(index)]
+
+    def path(self, execution_id: str, name: str) -> Optional[Path]:
+        target = self._target(execution_id, name)
+        return target if target.is_file() else None
+
+    def uri(self, execution_id: str) -> str:
+        _check_segment(execution_id)
+        return (self.root / "executions" / execution_id).resolve().as_uri()
+
+    def _commit(
+        self,
+        execution_id: str,
+        name: str,
+        target: Path,
+        tmp: str,
+        sha256: str,
+        size: int,
+    ) -> Artifact:
+        blob = self.root / "blobs" / "sha256" / sha256[:2] / sha256
+        artifact = Artifact(
+            name=name,
+            size=size,
+            sha256=sha256,
+            created_at=datetime.now(timezone.utc),
+        )
+        # settle a taken name before storing the blob, so a refused upload
+        # leaves nothing behind
+        try:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            taken = os.path.lexists(target)
+        except (FileExistsError, NotADirectoryError):
+            taken = True
+        if taken:
+            return self._taken(execution_id, target, blob, artifact)
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        if not blob.exists():
+            try:
+                _link(Path(tmp), blob)
+            except FileExistsError:
+                pass  # a concurrent upload of the same bytes won
+        try:
+            _link(blob, target)
+        except (FileExistsError, NotADirectoryError, IsADirectoryError):
+            # taken since the check, by an upload racing this one
+            return self._taken(execution_id, target, blob, artifact)
+        line = artifact.model_dump_json() + "\n"
+        with self._lock, open(self._index_path(execution_id), "a") as index:
+            index.write(line)
+        return artifact
+
+    def _taken(
+        self, execution_id: str, target: Path, blob: Path, artifact: Artifact
+    ) -> Artifact:
+        existing = self.get(execution_id, artifact.name)
+        if existing is not None and existing.sha256 == artifact.sha256:
+            return existing
+        if target.is_file() and blob.exists() and os.path.samefile(target, blob):
+            return artifact  # same upload racing us; it writes the index
+        raise ArtifactConflictError(execution_id, artifact.name)
+
+    def _index(self, execution_id: str) -> Dict[str, Artifact]:
+        try:
+            with open(self._index_path(execution_id)) as index:
+                lines = index.readlines()
+        except FileNotFoundError:
+            return {}
+        artifacts: Dict[str, Artifact] = {}
+        for line in lines:
+            artifact = Artifact.model_validate_json(line)
+            artifacts.setdefault(artifact.name, artifact)
+        return artifacts
+
+    def _index_path(self, execution_id: str) -> Path:
+        _check_segment(execution_id)
+        return self.root / "index" / f"{execution_id}.jsonl"
+
+    def _target(self, execution_id: str, name: str) -> Path:
+        _check_segment(execution_id)
+        parts = name.split("/")
+        if len(name) > _MAX_NAME or "\\" in name or "\x00" in name:
+            raise InvalidArtifactNameError(name)
+        if any(part in ("", ".", "..") for part in parts):
+            raise InvalidArtifactNameError(name)
+        return self.root.joinpath("executions", execution_id, *parts)
+
+
+def _check_segment(execution_id: str) -> None:
+    if execution_id in ("", ".", "..") or any(c in execution_id for c in "/\\\x00"):
+        raise InvalidArtifactNameError(execution_id)
+
+
+def _write(out: BinaryIO, digest: Any, chunks: List[bytes]) -> None:
+    # hashlib and file writes release the GIL on large buffers
+    for chunk in chunks:
+        digest.update(chunk)
+        out.write(chunk)
+
+
+def _link(source: Path, target: Path) -> None:
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        raise
+    except OSError:
+        # no hard links here (some network filesystems): copy, losing dedup
+        if target.exists():
+            raise FileExistsError(target) from None
+        shutil.copyfile(source, target)
+
+
+async def _file_chunks(source: Path) -> AsyncIterator[bytes]:
+    with open(source, "rb") as f:
+        while True:
+            chunk = await asyncio.to_thread(f.read, CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
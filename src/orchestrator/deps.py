@@ -1,17 +1,336 @@
-from typing import Optional
+import logging
+import os
+from typing import Any, Dict, Optional, cast
+from orchestrator.artifacts import ArtifactStore, LocalArtifactStore
 from orchestrator.repository.in_memory import InMemoryReservationRepo
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
 from orchestrator.repository.base import ReservationRepository
+from orchestrator.repository.execution_base import ExecutionRepository
+from orchestrator.repository.observed import ObservedExecutionRepo
+from orchestrator.repository.timed import TimedRepository
+from orchestrator.repository.sqlite import (
+    SQLiteDatabase,
+    SQLiteExecutionRepo,
+    SQLiteReservationRepo,
+)
+from orchestrator.models.execution import Execution
+from orchestrator.observability import log, metrics
+from orchestrator.observability.profiling import (
+    DEFAULT_INTERVAL,
+    DEFAULT_KEEP,
+    Profiler,
+)
+from orchestrator.models.reservation import DEFAULT_BENCH_TYPE
+from orchestrator.runners import (
+    DEFAULT_MAX_SHARDS,
+    MockSlotProvider,
+    RunnerFactory,
+    WarmPool,
+    as_engine_runner,
+    cpu_shards,
+)
+from orchestrator.scheduler import BenchPool
+from orchestrator.services.event_bus import EventBus
+from orchestrator.services.live_logs import DEFAULT_CAPACITY, LiveLogs
+from orchestrator.services.response_cache import (
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_TTL_SECONDS,
+    ResponseCache,
+)
+from orchestrator.services.execution_engine import (
+    ExecutionEngine,
+    Runner,
+    simulated_runner,
+)
 
-# Simple global repo instance for local/dev use.
+# Simple global repo instances; ORCHESTRATOR_STORE=sqlite selects the durable
+# backend at ORCHESTRATOR_SQLITE_PATH, anything else keeps them in memory.
 _repo: Optional[ReservationRepository] = None
+_execution_repo: Optional[ExecutionRepository] = None
+_engine: Optional[ExecutionEngine] = None
+_db: Optional[SQLiteDatabase] = None
+_warm_pool: Optional[WarmPool] = None
+_artifact_store: Optional[ArtifactStore] = None
+_event_bus: Optional[EventBus] = None
+_live_logs: Optional[LiveLogs] = None
+_profiler: Optional[Profiler] = None
+_profiler_loaded = False
+_fast_json: Optional[bool] = None
+_response_cache: Optional[ResponseCache] = None
+_response_cache_loaded = False
+
+
+def _sqlite_db() -> SQLiteDatabase:
+    global _db
+    if _db is None:
+        _db = SQLiteDatabase(
+            os.environ.get("ORCHESTRATOR_SQLITE_PATH", "orchestrator.db")
+        )
+    return _db
+
+
+def _use_sqlite() -> bool:
+    return os.environ.get("ORCHESTRATOR_STORE", "memory").lower() == "sqlite"
+
+
+def _parse_counts(raw: str) -> Dict[str, int]:
+    # "SIL=4,HIL=1" -> {"SIL": 4, "HIL": 1}
+    counts: Dict[str, int] = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        name, _, value = item.partition("=")
+        counts[name.strip()] = int(value)
+    return counts
+
+
+def _positive(name: str, raw: str) -> float:
+    value = float(raw)
+    if not value > 0:
+        # both are divisors in the fair queue; a negative one inverts the order
+        raise ValueError(f"{name} must be greater than 0, got {raw!r}")
+    return value
+
+
+def _parse_weights(raw: str) -> Dict[str, float]:
+    # "alice=2,bob=0.5" -> {"alice": 2.0, "bob": 0.5}
+    weights: Dict[str, float] = {}
+    for item in filter(None, (part.strip() for part in raw.split(","))):
+        name, _, value = item.partition("=")
+        weights[name.strip()] = _positive(
+            f"ORCHESTRATOR_TENANT_WEIGHTS[{name.strip()}]", value
+        )
+    return weights
+
+
+def _bench_pool() -> BenchPool:
+    # ORCHESTRATOR_BENCH_POOL="SIL=4,HIL=2" -> benches SIL-01..SIL-04, HIL-01..
+    return BenchPool.of_size(
+        _parse_counts(os.environ.get("ORCHESTRATOR_BENCH_POOL", ""))
+    )
 
 
 def get_repo() -> ReservationRepository:
     global _repo
     if _repo is None:
-        _repo = InMemoryReservationRepo()
+        inner: ReservationRepository
+        if _use_sqlite():
+            inner = SQLiteReservationRepo(_sqlite_db(), _bench_pool())
+        else:
+            inner = InMemoryReservationRepo(pool=_bench_pool())
+        _repo = cast(ReservationRepository, TimedRepository(inner, "reservations"))
     return _repo
 
 
+def get_event_bus() -> EventBus:
+    global _event_bus
+    if _event_bus is None:
+        _event_bus = EventBus()
+    return _event_bus
+
+
+def get_live_logs() -> LiveLogs:
+    # ORCHESTRATOR_LOG_BUFFER_BYTES of each run's output is kept in memory,
+    # older output spills to ORCHESTRATOR_LOG_SPILL_DIR
+    global _live_logs
+    if _live_logs is None:
+        _live_logs = LiveLogs(
+            int(os.environ.get("ORCHESTRATOR_LOG_BUFFER_BYTES", DEFAULT_CAPACITY)),
+            os.environ.get("ORCHESTRATOR_LOG_SPILL_DIR", "log-spill"),
+        )
+    return _live_logs
+
+
+def fast_json() -> bool:
+    # ORCHESTRATOR_FAST_JSON=1 lets endpoints dump repository models straight
+    # to JSON bytes, see orchestrator.api.responses
+    global _fast_json
+    if _fast_json is None:
+        raw = os.environ.get("ORCHESTRATOR_FAST_JSON", "")
+        _fast_json = raw.lower() in ("1", "true", "yes", "on")
+    return _fast_json
+
+
+def get_profiler() -> Optional[Profiler]:
+    # profiling is off (None) unless ORCHESTRATOR_ADMIN_TOKEN enables
+    # X-Profile requests or ORCHESTRATOR_PROFILE_SAMPLE_EVERY samples 1-in-N
+    global _profiler, _profiler_loaded
+    if not _profiler_loaded:
+        token = os.environ.get("ORCHESTRATOR_ADMIN_TOKEN") or None
+        every = int(os.environ.get("ORCHESTRATOR_PROFILE_SAMPLE_EVERY") or 0)
+        if token is not None or every > 0:
+            interval_ms = os.environ.get("ORCHESTRATOR_PROFILE_INTERVAL_MS")
+            _profiler = Profiler(
+                keep=int(os.environ.get("ORCHESTRATOR_PROFILE_KEEP") or DEFAULT_KEEP),
+                interval=float(interval_ms) / 1000 if interval_ms else DEFAULT_INTERVAL,
+                sample_every=every,
+                token=token,
+            )
+        _profiler_loaded = True
+    return _profiler
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    # GET /executions/{id} and /reservations/{id} bodies, up to
+    # ORCHESTRATOR_RESPONSE_CACHE_SIZE of them for
+    # ORCHESTRATOR_RESPONSE_CACHE_TTL_SECONDS; either one at 0 turns it off
+    global _response_cache, _response_cache_loaded
+    if not _response_cache_loaded:
+        size = int(
+            os.environ.get("ORCHESTRATOR_RESPONSE_CACHE_SIZE") or DEFAULT_MAX_ENTRIES
+        )
+        ttl = float(
+            os.environ.get("ORCHESTRATOR_RESPONSE_CACHE_TTL_SECONDS")
+            or DEFAULT_TTL_SECONDS
+        )
+        if size > 0 and ttl > 0:
+            _response_cache = ResponseCache(size, ttl)
+        _response_cache_loaded = True
+    return _response_cache
+
+
+def _on_execution_change(execution: Execution) -> None:
+    cache = get_response_cache()
+    # nothing can have read, let alone cached, a version-1 (just created) run
+    if cache is not None and execution.version > 1:
+        cache.invalidate(("executions", execution.id))
+    get_event_bus().publish(execution)
+    metrics.record_execution(execution)
+
+
+def get_execution_repo() -> ExecutionRepository:
+    # every write is published on the event bus for the streaming endpoints
+    global _execution_repo
+    if _execution_repo is None:
+        inner: ExecutionRepository
+        if _use_sqlite():
+            inner = SQLiteExecutionRepo(_sqlite_db())
+        else:
+            inner = InMemoryExecutionRepo()
+        timed = cast(ExecutionRepository, TimedRepository(inner, "executions"))
+        _execution_repo = ObservedExecutionRepo(timed, _on_execution_change)
+    return _execution_repo
+
+
 def get_repo_dep() -> ReservationRepository:
     return get_repo()
+
+
+def get_artifact_store() -> ArtifactStore:
+    global _artifact_store
+    if _artifact_store is None:
+        _artifact_store = LocalArtifactStore(
+            os.environ.get("ORCHESTRATOR_ARTIFACT_STORE_DIR", "artifact-store")
+        )
+    return _artifact_store
+
+
+def _bench_type_of(execution: Execution) -> str:
+    res = get_repo().get(execution.reservation_id)
+    return res.bench_type if res is not None else DEFAULT_BENCH_TYPE
+
+
+def _runner() -> Runner:
+    # ORCHESTRATOR_RUNNER picks the adapter (ADR-007): "local" runs test_suite
+    # as real processes, "local_mock" fakes runs on a warm pool of slow-to-
+    # provision slots; the default keeps the in-thread simulated runner
+    global _warm_pool
+    runner_type = os.environ.get("ORCHESTRATOR_RUNNER", "simulated")
+    run_seconds = float(os.environ.get("ORCHESTRATOR_SIMULATED_RUN_SECONDS", "0"))
+    if runner_type == "simulated":
+        return simulated_runner(run_seconds)
+    if runner_type == "local_mock":
+        provider = MockSlotProvider(
+            float(os.environ.get("ORCHESTRATOR_MOCK_PROVISION_SECONDS", "0"))
+        )
+        sizes = _parse_counts(os.environ.get("ORCHESTRATOR_WARM_POOL", ""))
+        _warm_pool = WarmPool(provider, sizes) if sizes else None
+        config: Dict[str, Any] = dict(
+            provider=provider, pool=_warm_pool, run_seconds=run_seconds
+        )
+    else:
+        shards = os.environ.get("ORCHESTRATOR_LOCAL_SHARDS", "1")
+        timeout = os.environ.get("ORCHESTRATOR_RUN_TIMEOUT_SECONDS")
+        config = dict(
+            artifacts_dir=os.environ.get("ORCHESTRATOR_ARTIFACTS_DIR", "artifacts"),
+            shards=cpu_shards() if shards == "auto" else int(shards),
+            max_shards=int(
+                os.environ.get("ORCHESTRATOR_LOCAL_MAX_SHARDS") or DEFAULT_MAX_SHARDS
+            ),
+            timeout_seconds=float(timeout) if timeout else None,
+            store=get_artifact_store(),
+            logs=get_live_logs(),
+        )
+    return as_engine_runner(RunnerFactory.create(runner_type, **config), _bench_type_of)
+
+
+def get_warm_pool() -> Optional[WarmPool]:
+    return _warm_pool
+
+
+def get_engine(repo: ExecutionRepository) -> ExecutionEngine:
+    """Process-wide execution engine, configured from ORCHESTRATOR_* env vars."""
+    global _engine
+    if _engine is None:
+        _engine = ExecutionEngine(
+            repo,
+            runner=_runner(),
+            max_workers=int(os.environ.get("ORCHESTRATOR_MAX_WORKERS", "4")),
+            bench_limits=_parse_counts(os.environ.get("ORCHESTRATOR_BENCH_LIMITS", "")),
+            tenant_weights=_parse_weights(
+                os.environ.get("ORCHESTRATOR_TENANT_WEIGHTS", "")
+            ),
+            aging_seconds=_positive(
+                "ORCHESTRATOR_PRIORITY_AGING_SECONDS",
+                os.environ.get("ORCHESTRATOR_PRIORITY_AGING_SECONDS", "60"),
+            ),
+        )
+        _export_engine_metrics(_engine)
+    return _engine
+
+
+def _export_engine_metrics(engine: ExecutionEngine) -> None:
+    # read at scrape time, so the dispatch path pays nothing for them
+    metrics.QUEUE_BACKLOG.set_function(
+        lambda: (((b,), n) for b, n in engine.queued().items())
+    )
+    metrics.EXECUTIONS_RUNNING.set_function(
+        lambda: (((b,), n) for b, n in engine.running().items())
+    )
+    pool = _warm_pool
+    if pool is not None:
+        metrics.WARM_POOL_READY.set_function(
+            lambda: (((b,), n) for b, n in pool.stats().ready.items())
+        )
+
+        def acquires():
+            stats = pool.stats()
+            return ((("hit",), stats.hits), (("miss",), stats.misses))
+
+        metrics.WARM_POOL_ACQUIRES.set_function(acquires)
+
+
+def setup_logging() -> None:
+    # JSON logging is opt-in; otherwise the server's own setup is kept
+    if os.environ.get("ORCHESTRATOR_LOG_FORMAT", "plain").lower() != "json":
+        return
+    level = os.environ.get("ORCHESTRATOR_LOG_LEVEL", "INFO").upper()
+    log.configure(
+        level=logging.getLevelName(level),
+        debug_sample_rate=float(
+            os.environ.get("ORCHESTRATOR_LOG_DEBUG_SAMPLE_RATE") or 1.0
+        ),
+    )
+
+
+def shutdown_logging() -> None:
+    log.shutdown()
+
+
+def shutdown_engine() -> None:
+    global _engine
+    global _warm_pool
+    if _engine is not None:
+        _engine.shutdown()
+        _engine = None
+    if _warm_pool is not None:
+        _warm_pool.close()
+        _warm_pool = None
@@ -0,0 +1,93 @@
+"""Identifier generation (ADR-005).
+
+Execution and reservation IDs are ULIDs: 48 bits of millisecond timestamp
+followed by 80 random bits, Crockford base32 encoded to 26 characters. IDs
+sort lexicographically by creation time, so they double as the ordering key
+for cursor pagination and time-window scans.
+"""
+
+from __future__ import annotations
+from datetime import datetime, timezone
+from threading import Lock
+import os
+import time
+
+ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+ULID_LENGTH = 26
+
+_DECODE = {c: i for i, c in enumerate(ALPHABET)}
+# two characters (10 bits) per lookup halves the work of encoding
+_PAIRS = [a + b for a in ALPHABET for b in ALPHABET]
+_PAIR_SHIFTS = tuple(range(120, -1, -10))
+_RANDOM_BITS = 80
+_RANDOM_MAX = (1 << _RANDOM_BITS) - 1
+_TIME_MAX = (1 << 48) - 1
+
+
+def encode(value: int) -> str:
+    """Encode a 128-bit integer as a 26-character ULID string."""
+    return "".join([_PAIRS[(value >> shift) & 1023] for shift in _PAIR_SHIFTS])
+
+
+def is_ulid(value: str) -> bool:
+    return (
+        len(value) == ULID_LENGTH
+        and value[0] in "01234567"
+        and all(c in _DECODE for c in value)
+    )
+
+
+def timestamp_ms(ulid: str) -> int:
+    """Milliseconds since the epoch embedded in a ULID."""
+    ms = 0
+    for c in ulid[:10]:
+        ms = (ms << 5) | _DECODE[c]
+    return ms
+
+
+def datetime_of(ulid: str) -> datetime:
+    return datetime.fromtimestamp(timestamp_ms(ulid) / 1000, tz=timezone.utc)
+
+
+def lower_bound(dt: datetime) -> str:
+    """Smallest ULID that could be minted at ``dt`` (naive means UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    ms = min(max(int(dt.timestamp() * 1000), 0), _TIME_MAX)
+    return encode(ms << _RANDOM_BITS)
+
+
+class ULIDGenerator:
+    """Thread-safe, monotonic ULID source.
+
+    Within one millisecond the random part is incremented instead of redrawn,
+    so IDs from one process are strictly increasing even if the wall clock
+    stalls or steps backwards.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._last_ms = -1
+        self._last_rand = 0
+
+    def new(self) -> str:
+        now = time.time_ns() // 1_000_000
+        with self._lock:
+            if now > self._last_ms:
+                self._last_ms = now
+                self._last_rand = int.from_bytes(os.urandom(10), "big")
+            elif self._last_rand < _RANDOM_MAX:
+                self._last_rand += 1
+            else:
+                # random space for this millisecond exhausted; borrow the next
+                self._last_ms += 1
+                self._last_rand = int.from_bytes(os.urandom(10), "big")
+            value = (self._last_ms << _RANDOM_BITS) | self._last_rand
+        return encode(value)
+
+
+_generator = ULIDGenerator()
+
+
+def new_ulid() -> str:
+    return _generator.new()
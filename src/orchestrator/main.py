@@ -1,13 +1,48 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from orchestrator.deps import (
+    get_profiler,
+    setup_logging,
+    shutdown_engine,
+    shutdown_logging,
+)
 from orchestrator.api.reservations import router as reservations_router
 from orchestrator.api.routes import router as routes_router
 from orchestrator.api.executions import router as executions_router
+from orchestrator.api.artifacts import router as artifacts_router
+from orchestrator.api.events import router as events_router
+from orchestrator.api.logs import router as logs_router
+from orchestrator.api.admin import router as admin_router
+from orchestrator.api.middleware import (
+    CorrelationIdMiddleware,
+    MetricsMiddleware,
+    ProfiledRoute,
+    ProfilingMiddleware,
+)
 
-app = FastAPI(title="Test Execution Orchestrator - API (dev)")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    setup_logging()
+    yield
+    shutdown_engine()
+    shutdown_logging()
+
+
+app = FastAPI(title="Test Execution Orchestrator - API (dev)", lifespan=lifespan)
+app.router.route_class = ProfiledRoute
+app.add_middleware(ProfilingMiddleware, get_profiler=get_profiler)
+app.add_middleware(MetricsMiddleware)
+# added last so it wraps everything and the id is set for all app logging
+app.add_middleware(CorrelationIdMiddleware)
 
 app.include_router(executions_router)
+app.include_router(artifacts_router)
+app.include_router(events_router)
+app.include_router(logs_router)
 app.include_router(reservations_router)
 app.include_router(routes_router)
+app.include_router(admin_router)
 
 
 @app.get("/health")
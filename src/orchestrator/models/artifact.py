@@ -0,0 +1,11 @@
+from __future__ import annotations
+from datetime import datetime
+from pydantic import BaseModel
+
+
+class Artifact(BaseModel):
+    # path relative to the execution, e.g. "logs/stdout.log" (ADR-009)
+    name: str
+    size: int
+    sha256: str
+    created_at: datetime
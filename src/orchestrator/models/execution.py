@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
@@ -18,6 +18,8 @@ class ExecutionBase(BaseModel):
     commit_sha: Optional[str] = None
     test_suite: Optional[str] = None
     parameters: Optional[dict] = None
+    # 0 (lowest) .. 9; orders a tenant's queued runs, see FairQueue
+    priority: int = Field(default=0, ge=0, le=9)
 
 
 class ExecutionCreate(ExecutionBase):
@@ -32,3 +34,28 @@ class Execution(ExecutionBase):
     finished_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
+    # bumped on every write; used for optimistic concurrency checks
+    version: int = 1
+
+
+BATCH_MAX_ITEMS = 1000
+
+
+class ExecutionBatchCreate(BaseModel):
+    items: List[ExecutionCreate] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class ExecutionBatchStart(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class ExecutionBatchItem(BaseModel):
+    index: int
+    status: int
+    id: Optional[str] = None
+    execution: Optional[Execution] = None
+    detail: Optional[str] = None
+
+
+class ExecutionBatchResult(BaseModel):
+    results: List[ExecutionBatchItem]
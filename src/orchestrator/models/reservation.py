@@ -1,10 +1,14 @@
 from __future__ import annotations
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field, validator
 from enum import Enum
 
 
+# bench_type assumed for executions whose reservation cannot be found
+DEFAULT_BENCH_TYPE = "default"
+
+
 class ReservationStatus(str, Enum):
     PENDING = "PENDING"
     ACTIVE = "ACTIVE"
@@ -35,3 +39,39 @@ class Reservation(ReservationBase):
     status: ReservationStatus = ReservationStatus.PENDING
     created_at: datetime
     updated_at: datetime
+    # concrete bench from the bench_type's pool; None if the type has no pool
+    bench_id: Optional[str] = None
+    # bumped on every write; used for optimistic concurrency checks
+    version: int = 1
+
+
+class BenchSlot(BaseModel):
+    bench_type: str
+    bench_id: Optional[str] = None
+    start: datetime
+    end: datetime
+
+
+BATCH_MAX_ITEMS = 1000
+
+
+class ReservationBatchCreate(BaseModel):
+    items: List[ReservationCreate] = Field(
+        ..., min_length=1, max_length=BATCH_MAX_ITEMS
+    )
+
+
+class ReservationBatchDelete(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_ITEMS)
+
+
+class ReservationBatchItem(BaseModel):
+    index: int
+    status: int
+    id: Optional[str] = None
+    reservation: Optional[Reservation] = None
+    detail: Optional[str] = None
+
+
+class ReservationBatchResult(BaseModel):
+    results: List[ReservationBatchItem]
@@ -0,0 +1,27 @@
+"""Observability: metrics (ADR-010), structured logging (ADR-011) and
+request profiling."""
+
+from orchestrator.observability.log import JsonFormatter, correlation_id, execution_id
+from orchestrator.observability.metrics import (
+    REGISTRY,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+    record_execution,
+)
+from orchestrator.observability.profiling import Profile, Profiler
+
+__all__ = [
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "JsonFormatter",
+    "Profile",
+    "Profiler",
+    "Registry",
+    "correlation_id",
+    "execution_id",
+    "record_execution",
+]
@@ -0,0 +1,142 @@
+from __future__ import annotations
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Optional
+import json
+import logging
+import queue
+import sys
+import zlib
+
+# set per request by CorrelationIdMiddleware and per run by the engine
+correlation_id: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
+execution_id: ContextVar[Optional[str]] = ContextVar("execution_id", default=None)
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RESERVED = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message",
+    "asctime",
+    "correlation_id",
+    "execution_id",
+    "taskName",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: ts, level, logger, message, the correlation
+    and execution ids when set, any ``extra`` fields and the traceback."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        cid = getattr(record, "correlation_id", None)
+        if cid is not None:
+            entry["correlation_id"] = cid
+        eid = getattr(record, "execution_id", None)
+        if eid is not None:
+            entry["execution_id"] = eid
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+class ContextFilter(logging.Filter):
+    """Stamps the current correlation/execution ids onto the record.
+
+    Runs on the logging thread, before the record is queued; the listener
+    thread formatting it later has no access to the caller's context.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.correlation_id = correlation_id.get()
+        record.execution_id = execution_id.get()
+        return True
+
+
+class DebugSampler(logging.Filter):
+    """Keeps DEBUG records for a ``rate`` fraction of correlation ids.
+
+    The choice hashes the correlation id, so a sampled request keeps all of
+    its debug output and an unsampled one none of it. Records outside any
+    request are sampled on their execution id, else kept. INFO and above
+    always pass.
+    """
+
+    def __init__(self, rate: float) -> None:
+        super().__init__()
+        self.threshold = int(max(0.0, min(rate, 1.0)) * 0x100000000)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        key = correlation_id.get() or execution_id.get()
+        if key is None:
+            return True
+        return zlib.crc32(key.encode()) < self.threshold
+
+
+class _Handler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # resolve the message (args may be mutated later) and the traceback
+        # (frames die with the caller), and leave the JSON to the listener
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_FORMATTER = JsonFormatter()
+_listener: Optional[QueueListener] = None
+
+
+def configure(
+    level: int = logging.INFO,
+    debug_sample_rate: float = 1.0,
+    stream: Optional[IO[str]] = None,
+) -> None:
+    """Send all logging, uvicorn's included, as JSON lines to ``stream``.
+
+    Callers only enqueue the record; a listener thread formats and writes
+    it, so a slow stream never blocks a request or worker thread.
+    """
+    global _listener
+    shutdown()
+    output = logging.StreamHandler(stream if stream is not None else sys.stderr)
+    output.setFormatter(_FORMATTER)
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    handler = _Handler(records)
+    if debug_sample_rate < 1.0:
+        # first, so dropped records skip the rest of the handler
+        handler.addFilter(DebugSampler(debug_sample_rate))
+    handler.addFilter(ContextFilter())
+    root = logging.getLogger()
+    root.handlers = [handler]
+    root.setLevel(level)
+    for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
+        # uvicorn installs its own plain-text handlers; route through ours
+        uv = logging.getLogger(name)
+        uv.handlers = []
+        uv.propagate = True
+    _listener = QueueListener(records, output, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
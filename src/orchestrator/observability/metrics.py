@@ -0,0 +1,320 @@
+from __future__ import annotations
+from bisect import bisect_left
+from threading import Lock
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+import math
+
+from orchestrator.models.execution import Execution, ExecutionStatus
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# seconds; request and repository latencies sit well under a second
+LATENCY_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+# seconds; test runs take minutes to hours
+DURATION_BUCKETS = (1.0, 5.0, 15.0, 60.0, 300.0, 900.0, 1800.0, 3600.0, 7200.0)
+
+LabelValues = Tuple[str, ...]
+# (label values, value) pairs read from live state at scrape time
+SampleSource = Callable[[], Iterable[Tuple[LabelValues, float]]]
+
+
+class Registry:
+    """Holds metrics and renders them in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"metric {metric.name} already registered")
+            self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                lines.append(f"{metric.name}{suffix}{labels} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[Registry] = REGISTRY,
+    ) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = Lock()
+        self._children: Dict[LabelValues, object] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def labels(self, *values: str):
+        # hot path: one dict lookup once the child exists
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} takes labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def _new_child(self) -> object:
+        raise NotImplementedError
+
+    def _items(self) -> List[Tuple[LabelValues, object]]:
+        with self._lock:
+            return list(self._children.items())
+
+    def _labels(self, values: LabelValues, extra: str = "") -> str:
+        pairs = [
+            f'{name}="{_escape_value(value)}"'
+            for name, value in zip(self.labelnames, values)
+        ]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Value:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Sourced(_Metric):
+    """Counters and gauges: stored values, or read from ``set_function``."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._source: Optional[SampleSource] = None
+
+    def set_function(self, source: Optional[SampleSource]) -> None:
+        """Read samples from live state at scrape time, costing nothing
+        on the hot path; replaces any stored values."""
+        self._source = source
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        if self._source is not None:
+            for values, value in self._source():
+                yield "", self._labels(tuple(values)), value
+            return
+        for values, child in self._items():
+            yield "", self._labels(values), child.value  # type: ignore[attr-defined]
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+
+class Counter(_Sourced):
+    kind = "counter"
+
+
+class Gauge(_Sourced):
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+
+class _HistogramValue:
+    __slots__ = ("_lock", "_bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]) -> None:
+        self._lock = Lock()
+        self._bounds = bounds
+        # one slot per bucket plus +Inf, allocated once
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        i = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        registry: Optional[Registry] = REGISTRY,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, help, labelnames, registry)
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def samples(self) -> Iterator[Tuple[str, str, float]]:
+        for values, child in self._items():
+            with child._lock:  # type: ignore[attr-defined]
+                counts = list(child.counts)  # type: ignore[attr-defined]
+                total = child.sum  # type: ignore[attr-defined]
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                yield "_bucket", self._labels(values, le), cumulative
+            yield "_sum", self._labels(values), total
+            yield "_count", self._labels(values), cumulative
+
+    def _new_child(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+
+def _number(value: Union[int, float]) -> str:
+    if isinstance(value, float):
+        if math.isinf(value):
+            return "+Inf" if value > 0 else "-Inf"
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+    return repr(value)
+
+
+def _escape_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+# orchestrator metrics (ADR-010)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "API request latency by route template.",
+    ("method", "route", "status"),
+)
+REPOSITORY_OPERATION_DURATION = Histogram(
+    "repository_operation_duration_seconds",
+    "Latency of repository calls.",
+    ("repository", "operation"),
+)
+REPOSITORY_LOCK_WAIT = Histogram(
+    "repository_lock_wait_seconds",
+    "Time spent waiting for a contended in-memory repository lock.",
+    ("repository",),
+)
+QUEUE_BACKLOG = Gauge(
+    "queue_backlog", "Executions queued for a free worker.", ("bench_type",)
+)
+EXECUTIONS_RUNNING = Gauge(
+    "executions_running", "Executions currently running.", ("bench_type",)
+)
+EXECUTION_TRANSITIONS = Counter(
+    "execution_transitions_total",
+    "Execution writes by the status they leave the execution in.",
+    ("status",),
+)
+EXECUTION_DURATION = Histogram(
+    "execution_duration_seconds",
+    "Wall time of finished runs, started_at to finished_at.",
+    ("status",),
+    buckets=DURATION_BUCKETS,
+)
+WARM_POOL_READY = Gauge(
+    "warm_pool_ready", "Provisioned slots waiting in the warm pool.", ("bench_type",)
+)
+WARM_POOL_ACQUIRES = Counter(
+    "warm_pool_acquires_total", "Warm pool acquisitions by outcome.", ("result",)
+)
+WARM_POOL_ACQUIRE_DURATION = Histogram(
+    "warm_pool_acquire_seconds",
+    "Time to hand out a slot, warm or provisioned on demand.",
+    ("bench_type",),
+)
+RESPONSE_CACHE_LOOKUPS = Counter(
+    "response_cache_lookups_total",
+    "Response cache lookups by outcome.",
+    ("resource", "result"),
+)
+
+_FINISHED = (
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+)
+
+
+def record_execution(execution: Execution) -> None:
+    """Count a committed execution write (an ObservedExecutionRepo listener)."""
+    status = execution.status.value
+    EXECUTION_TRANSITIONS.labels(status).inc()
+    if (
+        execution.status in _FINISHED
+        and execution.started_at is not None
+        and execution.finished_at is not None
+    ):
+        elapsed = (execution.finished_at - execution.started_at).total_seconds()
+        EXECUTION_DURATION.labels(status).observe(max(0.0, elapsed))
@@ -0,0 +1,306 @@
+from __future__ import annotations
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import wraps
+from itertools import count
+from threading import Event, Lock, Thread, get_ident
+from time import perf_counter, sleep
+from types import CodeType, FrameType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+import logging
+import os
+import sys
+
+from orchestrator.ids import new_ulid
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL = 0.001
+DEFAULT_KEEP = 50
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False)
+class Profile:
+    """Stack samples of one request, weighted by how often each was seen."""
+
+    id: str
+    method: str
+    path: str
+    started_at: datetime
+    interval_ms: float
+    route: Optional[str] = None
+    status: Optional[int] = None
+    duration_ms: float = 0.0
+    stacks: Counter = field(default_factory=Counter)
+    _t0: float = field(default_factory=perf_counter, repr=False)
+
+    @property
+    def samples(self) -> int:
+        return sum(self.stacks.values())
+
+    def summary(self) -> Dict[str, object]:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status": self.status,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 3),
+            "interval_ms": self.interval_ms,
+            "samples": self.samples,
+        }
+
+    def collapsed(self) -> str:
+        return collapsed(self.stacks)
+
+
+def collapsed(stacks: Counter) -> str:
+    """``frame;frame;frame count`` lines, outermost frame first, as read by
+    flamegraph.pl, speedscope and similar tools."""
+    return "".join(f"{stack} {n}\n" for stack, n in stacks.most_common())
+
+
+# the profile the running code belongs to; ``attribute`` reads it in the
+# thread a call lands on
+_current: ContextVar[Optional[Profile]] = ContextVar("profile", default=None)
+
+# thread ident -> profile the thread is running code for right now
+_threads: Dict[int, Profile] = {}
+
+
+def _attach(profile: Profile) -> Optional[Profile]:
+    tid = get_ident()
+    previous = _threads.get(tid)
+    _threads[tid] = profile
+    return previous
+
+
+def _detach(previous: Optional[Profile]) -> None:
+    if previous is None:
+        _threads.pop(get_ident(), None)
+    else:
+        _threads[get_ident()] = previous
+
+
+def _call_attached(profile: Profile, func: Callable[..., T], args, kwargs) -> T:
+    previous = _attach(profile)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _detach(previous)
+
+
+def attribute(func: Callable[..., T]) -> Callable[..., T]:
+    """Wrap a sync callable so that, called in a profiled request's context
+    (e.g. on a threadpool thread), the thread's samples count toward it."""
+
+    @wraps(func)
+    def call(*args, **kwargs) -> T:
+        profile = _current.get()
+        if profile is None:
+            return func(*args, **kwargs)
+        return _call_attached(profile, func, args, kwargs)
+
+    return call
+
+
+class _Steps(Generic[T]):
+    def __init__(self, awaitable: Awaitable[T], profile: Profile) -> None:
+        self._awaitable = awaitable
+        self._profile = profile
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        steps, profile = self._awaitable.__await__(), self._profile
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            previous = _attach(profile)
+            try:
+                if error is None:
+                    yielded = steps.send(value)
+                else:
+                    yielded = steps.throw(error)
+            except StopIteration as stop:
+                return stop.value
+            finally:
+                _detach(previous)
+            try:
+                value, error = (yield yielded), None
+            except GeneratorExit:
+                steps.close()
+                raise
+            except BaseException as exc:
+                value, error = None, exc
+
+
+def attribute_steps(awaitable: Awaitable[T]) -> Awaitable[T]:
+    """Await ``awaitable`` with the event loop thread attached to the current
+    profile during each of its steps, and only then: other tasks the loop
+    runs in between are not counted."""
+    profile = _current.get()
+    return awaitable if profile is None else _Steps(awaitable, profile)
+
+
+# samples keep only the frames above these, i.e. the request's own code
+_BOUNDARIES = frozenset({_call_attached.__code__, _Steps.__await__.__code__})
+
+
+class Profiler:
+    """Wall-clock stack sampler for selected requests.
+
+    While a profile is active a daemon thread snapshots, each ``interval``
+    seconds, the stacks of the threads attached to a profile: the event loop
+    thread during each step of a request awaited through
+    ``attribute_steps``, and a threadpool thread while it runs a call
+    wrapped with ``attribute``. Concurrent requests therefore do not bleed
+    into each other, and only the frames above the attaching call are kept.
+    Threads blocked inside the request (locks, I/O) are sampled too; a
+    request awaiting on the event loop, or a task it spawns, is not.
+
+    The sampler only runs when a busy thread drops the GIL, so CPU-bound
+    code is sampled at most once per interpreter switch interval (5 ms by
+    default), whatever ``interval`` asks for.
+
+    Finished profiles are kept in a ring of the last ``keep``.
+    """
+
+    def __init__(
+        self,
+        keep: int = DEFAULT_KEEP,
+        interval: float = DEFAULT_INTERVAL,
+        sample_every: int = 0,
+        token: Optional[str] = None,
+    ) -> None:
+        self.interval = interval
+        self.sample_every = sample_every
+        self.token = token
+        self._counter = count(1)
+        self._lock = Lock()
+        self._active: Set[Profile] = set()
+        self._profiles: Deque[Profile] = deque(maxlen=keep)
+        self._wake = Event()
+        self._thread: Optional[Thread] = None
+        self._labels: Dict[CodeType, str] = {}
+
+    def sampled(self) -> bool:
+        """True for every ``sample_every``-th call."""
+        return self.sample_every > 0 and next(self._counter) % self.sample_every == 0
+
+    @contextmanager
+    def profile(self, method: str, path: str) -> Iterator[Profile]:
+        """Profile the calling context, and everything it runs, until exit."""
+        profile = Profile(
+            id=new_ulid(),
+            method=method,
+            path=path,
+            started_at=datetime.now(timezone.utc),
+            interval_ms=self.interval * 1000,
+        )
+        with self._lock:
+            self._active.add(profile)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="profiler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        token = _current.set(profile)
+        try:
+            yield profile
+        finally:
+            _current.reset(token)
+            with self._lock:
+                profile.duration_ms = (perf_counter() - profile._t0) * 1000
+                self._active.discard(profile)
+                self._profiles.append(profile)
+
+    def profiles(self) -> List[Profile]:
+        """Finished profiles, newest first."""
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id: str) -> Optional[Profile]:
+        with self._lock:
+            for profile in self._profiles:
+                if profile.id == profile_id:
+                    return profile
+        return None
+
+    def merged(self, route: Optional[str] = None) -> Counter:
+        """Stacks summed over the kept profiles, optionally of one route.
+
+        A request much shorter than the interval yields a sample or none,
+        so sampled (1-in-N) profiles are best read together.
+        """
+        total: Counter = Counter()
+        with self._lock:
+            for profile in self._profiles:
+                if route is None or profile.route == route:
+                    total.update(profile.stacks)
+        return total
+
+    def _run(self) -> None:
+        me = get_ident()
+        while True:
+            self._wake.wait()
+            with self._lock:
+                if not self._active:
+                    self._wake.clear()
+                    continue
+            try:
+                self._sample(me)
+            except Exception:
+                logger.exception("profiler: sampling failed")
+            sleep(self.interval)
+
+    def _sample(self, me: int) -> None:
+        attached = _threads.copy()
+        frames = sys._current_frames()
+        seen: List[Tuple[Profile, List[CodeType]]] = []
+        for tid, profile in attached.items():
+            frame = frames.get(tid)
+            if tid == me or frame is None:
+                continue
+            codes = []
+            f: Optional[FrameType] = frame
+            while f is not None and f.f_code not in _BOUNDARIES:
+                codes.append(f.f_code)
+                f = f.f_back
+            # the thread may have moved on to another request since the copy;
+            # the attaching frame holds the profile it is running for
+            if f is not None and codes and f.f_locals.get("profile") is profile:
+                seen.append((profile, codes))
+        with self._lock:
+            # a profile that finished meanwhile is already readable; leave it
+            for profile, codes in seen:
+                if profile in self._active:
+                    stack = ";".join(self._label(c) for c in reversed(codes))
+                    profile.stacks[stack] += 1
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            name = getattr(code, "co_qualname", code.co_name)
+            label = (
+                f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            )
+            self._labels[code] = label
+        return label
@@ -0,0 +1,6 @@
+"""Task queue abstraction (ADR-006) and its backends."""
+
+from orchestrator.queue.base import Message, TaskEnvelope, TaskQueue, TaskType
+from orchestrator.queue.in_memory import InMemoryTaskQueue
+
+__all__ = ["InMemoryTaskQueue", "Message", "TaskEnvelope", "TaskQueue", "TaskType"]
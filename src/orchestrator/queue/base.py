@@ -0,0 +1,62 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Protocol
+import uuid
+
+
+class TaskType(str, Enum):
+    PROVISION = "provision"
+    RUN = "run"
+    COLLECT = "collect"
+    TEARDOWN = "teardown"
+
+
+@dataclass
+class TaskEnvelope:
+    """Backend-agnostic, JSON-serializable unit of work (ADR-006)."""
+
+    execution_id: str
+    type: TaskType
+    reservation_id: Optional[str] = None
+    payload: Dict[str, Any] = field(default_factory=dict)
+    max_attempts: int = 5
+    attempt: int = 0
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["type"] = self.type.value
+        data["created_at"] = self.created_at.isoformat()
+        return data
+
+
+@dataclass
+class Message:
+    """A received task plus the receipt handle that acks/nacks this delivery."""
+
+    task: TaskEnvelope
+    receipt: str
+
+
+class TaskQueue(Protocol):
+    def push(self, task: TaskEnvelope, delay: float = 0.0) -> None: ...
+
+    def receive(
+        self,
+        max_messages: int = 1,
+        visibility_timeout: Optional[float] = None,
+        wait_seconds: float = 0.0,
+    ) -> List[Message]: ...
+
+    def ack(self, receipt: str) -> bool: ...
+
+    def nack(self, receipt: str, delay: Optional[float] = None) -> bool: ...
+
+    def extend_visibility(self, receipt: str, seconds: float) -> bool: ...
+
+    def dead_letters(self) -> List[TaskEnvelope]: ...
+
+    def __len__(self) -> int: ...
@@ -0,0 +1,152 @@
+from __future__ import annotations
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition
+from typing import Callable, Dict, List, Optional, Tuple
+import time
+
+from orchestrator.queue.base import Message, TaskEnvelope, TaskQueue
+
+
+class _Entry:
+    __slots__ = ("task", "seq", "delivery")
+
+    def __init__(self, task: TaskEnvelope) -> None:
+        self.task = task
+        # sequence of the only heap slot still valid for this entry
+        self.seq = -1
+        # bumped on every receive so receipts from earlier deliveries go stale
+        self.delivery = 0
+
+
+class InMemoryTaskQueue(TaskQueue):
+    """At-least-once in-memory queue with visibility timeouts, retries and a DLQ.
+
+    Tasks sit in a heap ordered by the time they become visible. Receiving a
+    task pushes it back with ``now + visibility_timeout``; if it is not acked
+    by then it is delivered again. Heap entries are invalidated lazily, so
+    push/receive/ack/nack are all O(log n).
+    """
+
+    def __init__(
+        self,
+        visibility_timeout: float = 30.0,
+        backoff_base: float = 1.0,
+        backoff_max: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.visibility_timeout = visibility_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._clock = clock
+        self._cond = Condition()
+        self._seq = count()
+        self._heap: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, _Entry] = {}
+        self._dlq: List[TaskEnvelope] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential retry delay after the given (1-based) failed attempt."""
+        return min(self.backoff_max, self.backoff_base * (2 ** max(attempt - 1, 0)))
+
+    def push(self, task: TaskEnvelope, delay: float = 0.0) -> None:
+        with self._cond:
+            entry = _Entry(task)
+            self._entries[task.task_id] = entry
+            self._reschedule(entry, self._clock() + delay)
+            self._cond.notify()
+
+    def receive(
+        self,
+        max_messages: int = 1,
+        visibility_timeout: Optional[float] = None,
+        wait_seconds: float = 0.0,
+    ) -> List[Message]:
+        if visibility_timeout is None:
+            visibility_timeout = self.visibility_timeout
+        deadline = time.monotonic() + wait_seconds
+        with self._cond:
+            while True:
+                out = self._take(max_messages, visibility_timeout)
+                remaining = deadline - time.monotonic()
+                if out or remaining <= 0:
+                    return out
+                self._cond.wait(min(remaining, self._until_next_visible()))
+
+    def ack(self, receipt: str) -> bool:
+        with self._cond:
+            entry = self._lookup(receipt)
+            if entry is None:
+                return False
+            del self._entries[entry.task.task_id]
+            return True
+
+    def nack(self, receipt: str, delay: Optional[float] = None) -> bool:
+        """Release a delivery for retry after backoff, or dead-letter it."""
+        with self._cond:
+            entry = self._lookup(receipt)
+            if entry is None:
+                return False
+            task = entry.task
+            if task.attempt >= task.max_attempts:
+                del self._entries[task.task_id]
+                self._dlq.append(task)
+                return True
+            wait = self.backoff(task.attempt) if delay is None else delay
+            self._reschedule(entry, self._clock() + wait)
+            entry.delivery += 1  # the nacked receipt must not ack the retry
+            self._cond.notify()
+            return True
+
+    def extend_visibility(self, receipt: str, seconds: float) -> bool:
+        with self._cond:
+            entry = self._lookup(receipt)
+            if entry is None:
+                return False
+            self._reschedule(entry, self._clock() + seconds)
+            return True
+
+    def dead_letters(self) -> List[TaskEnvelope]:
+        with self._cond:
+            return list(self._dlq)
+
+    def _take(self, max_messages: int, timeout: float) -> List[Message]:
+        # caller holds self._cond
+        now = self._clock()
+        heap = self._heap
+        out: List[Message] = []
+        while heap and len(out) < max_messages and heap[0][0] <= now:
+            _, seq, task_id = heappop(heap)
+            entry = self._entries.get(task_id)
+            if entry is None or entry.seq != seq:
+                continue  # acked, dead-lettered or rescheduled since
+            task = entry.task
+            if task.attempt >= task.max_attempts:
+                # visibility expired on the final attempt
+                del self._entries[task_id]
+                self._dlq.append(task)
+                continue
+            task.attempt += 1
+            entry.delivery += 1
+            self._reschedule(entry, now + timeout)
+            out.append(Message(task=task, receipt=f"{task_id}:{entry.delivery}"))
+        return out
+
+    def _reschedule(self, entry: _Entry, visible_at: float) -> None:
+        entry.seq = next(self._seq)
+        heappush(self._heap, (visible_at, entry.seq, entry.task.task_id))
+
+    def _lookup(self, receipt: str) -> Optional[_Entry]:
+        task_id, _, delivery = receipt.rpartition(":")
+        entry = self._entries.get(task_id)
+        if entry is None or str(entry.delivery) != delivery:
+            return None
+        return entry
+
+    def _until_next_visible(self) -> float:
+        if not self._heap:
+            return 3600.0
+        return max(self._heap[0][0] - self._clock(), 0.001)
@@ -1,6 +1,19 @@
 from __future__ import annotations
-from typing import Protocol, Iterable, Optional
-from orchestrator.models.reservation import Reservation, ReservationCreate
+from datetime import datetime, timedelta
+from typing import Protocol, Iterable, List, Optional, Sequence, Union
+from orchestrator.models.reservation import (
+    BenchSlot,
+    Reservation,
+    ReservationCreate,
+)
+
+
+class ReservationConflictError(Exception):
+    """Raised when every bench of the requested type is booked for the window."""
+
+    def __init__(self, conflicting_id: str) -> None:
+        super().__init__(f"reservation conflicts with {conflicting_id}")
+        self.conflicting_id = conflicting_id
 
 
 class ReservationRepository(Protocol):
@@ -8,6 +21,34 @@ class ReservationRepository(Protocol):
 
     def get(self, reservation_id: str) -> Optional[Reservation]: ...
 
-    def list(self, limit: int = 100) -> Iterable[Reservation]: ...
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        user_id: Optional[str] = None,
+        bench_type: Optional[str] = None,
+    ) -> Iterable[Reservation]: ...
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Reservation]: ...
 
     def delete(self, reservation_id: str) -> bool: ...
+
+    def create_many(
+        self, payloads: Sequence[ReservationCreate]
+    ) -> List[Union[Reservation, ReservationConflictError]]: ...
+
+    def delete_many(self, reservation_ids: Sequence[str]) -> List[bool]: ...
+
+    def find_overlapping(
+        self, bench_type: str, start: datetime, end: datetime
+    ) -> List[Reservation]: ...
+
+    def next_slot(
+        self, bench_type: str, duration: timedelta, not_before: datetime
+    ) -> BenchSlot: ...
@@ -1,15 +1,112 @@
 from __future__ import annotations
-from typing import Protocol, Iterable, Optional
-from orchestrator.models.execution import Execution, ExecutionCreate
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple, Union
+from pydantic import ConfigDict, TypeAdapter
+from typing_extensions import Annotated, TypedDict
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+
+
+ExpectedStatus = Union[ExecutionStatus, Tuple[ExecutionStatus, ...], None]
+
+
+class VersionConflictError(Exception):
+    """Raised when a conditional update finds the execution changed underneath it."""
+
+    def __init__(
+        self, execution_id: str, version: int, status: ExecutionStatus
+    ) -> None:
+        super().__init__(
+            f"execution {execution_id} is at version {version} ({status.value})"
+        )
+        self.execution_id = execution_id
+        self.version = version
+        self.status = status
+
+
+class Versioned(Protocol):
+    # an Execution, or a repository's stored form of one
+    id: str
+    version: int
+    status: ExecutionStatus
+
+
+def check_expected(
+    ex: Versioned, expected_version: Optional[int], expected_status: ExpectedStatus
+) -> None:
+    """Raise VersionConflictError unless ``ex`` matches the caller's expectations."""
+    if expected_version is not None and ex.version != expected_version:
+        raise VersionConflictError(ex.id, ex.version, ex.status)
+    if expected_status is not None:
+        allowed = (
+            expected_status
+            if isinstance(expected_status, tuple)
+            else (expected_status,)
+        )
+        if ex.status not in allowed:
+            raise VersionConflictError(ex.id, ex.version, ex.status)
+
+
+# fields an update may set; the rest are owned by the repository
+_FIXED = ("id", "created_at", "updated_at", "version")
+_Changes = TypedDict(  # type: ignore[misc]
+    "_Changes",
+    {
+        name: Annotated[(f.annotation, *f.metadata)] if f.metadata else f.annotation
+        for name, f in Execution.model_fields.items()
+        if name not in _FIXED
+    },
+    total=False,
+)
+_Changes.__pydantic_config__ = ConfigDict(extra="forbid")  # type: ignore[attr-defined]
+_changes: TypeAdapter[Dict[str, Any]] = TypeAdapter(_Changes)
+
+
+def validate_changes(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """``fields`` checked against the same types and constraints as the model."""
+    return _changes.validate_python(fields)
+
+
+def apply_update(ex: Execution, fields: Dict[str, Any]) -> Execution:
+    """The next version of ``ex`` with ``fields`` set.
+
+    Only the changed fields are validated; the copy shares every other value
+    with ``ex``.
+    """
+    changes = validate_changes(fields)
+    changes["updated_at"] = datetime.utcnow()
+    changes["version"] = ex.version + 1
+    return ex.model_copy(update=changes)
 
 
 class ExecutionRepository(Protocol):
     def create(self, payload: ExecutionCreate) -> Execution: ...
 
+    def create_many(self, payloads: Sequence[ExecutionCreate]) -> List[Execution]: ...
+
     def get(self, execution_id: str) -> Optional[Execution]: ...
 
-    def list(self, limit: int = 100) -> Iterable[Execution]: ...
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        reservation_id: Optional[str] = None,
+    ) -> Iterable[Execution]: ...
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Execution]: ...
 
-    def update(self, execution_id: str, **fields) -> Optional[Execution]: ...
+    def update(
+        self,
+        execution_id: str,
+        expected_version: Optional[int] = None,
+        expected_status: ExpectedStatus = None,
+        **fields,
+    ) -> Optional[Execution]: ...
 
     def delete(self, execution_id: str) -> bool: ...
@@ -0,0 +1,162 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from sys import intern
+from typing import Any, Callable, Dict, Optional, Union, overload
+
+from orchestrator.models.execution import Execution, ExecutionStatus
+
+_EPOCH = datetime(1970, 1, 1)
+_US = timedelta(microseconds=1)
+
+# Naive UTC datetimes, which is everything the repository stamps, are kept as
+# microseconds since the epoch; an aware one is kept as given so it reads back
+# unchanged.
+Stamp = Union[int, datetime]
+
+# stands in for the common empty ``parameters``; never handed out
+_EMPTY: Dict[str, Any] = {}
+
+
+def _pack_time(value: Optional[datetime]) -> Optional[Stamp]:
+    if value is None or value.tzinfo is not None:
+        return value
+    return (value - _EPOCH) // _US
+
+
+@overload
+def _unpack_time(value: Stamp) -> datetime: ...
+
+
+@overload
+def _unpack_time(value: Optional[Stamp]) -> Optional[datetime]: ...
+
+
+def _unpack_time(value: Optional[Stamp]) -> Optional[datetime]:
+    if isinstance(value, int):
+        return _EPOCH + timedelta(0, 0, value)
+    return value
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return None if value is None else intern(value)
+
+
+def _pack_parameters(value: Optional[dict]) -> Optional[dict]:
+    # a copy, so the caller's model and the stored record never share it
+    if value is None:
+        return None
+    return dict(value) if value else _EMPTY
+
+
+_PACK: Dict[str, Callable[[Any], Any]] = {
+    "reservation_id": _intern,
+    "commit_sha": _intern,
+    "test_suite": _intern,
+    "parameters": _pack_parameters,
+    "started_at": _pack_time,
+    "finished_at": _pack_time,
+    "created_at": _pack_time,
+    "updated_at": _pack_time,
+}
+
+
+class ExecutionRecord:
+    """An Execution as the in-memory repository keeps it.
+
+    A slotted object instead of a model: no per-record ``__dict__`` or
+    fields-set, timestamps as ints, and the strings many runs share
+    (reservation, commit, suite) interned. ``status`` is the enum member
+    itself. A stored record is never mutated; ``replace`` makes the next.
+    """
+
+    __slots__ = (
+        "id",
+        "reservation_id",
+        "commit_sha",
+        "test_suite",
+        "parameters",
+        "priority",
+        "status",
+        "artifacts_uri",
+        "started_at",
+        "finished_at",
+        "created_at",
+        "updated_at",
+        "version",
+    )
+
+    id: str
+    reservation_id: str
+    commit_sha: Optional[str]
+    test_suite: Optional[str]
+    parameters: Optional[dict]
+    priority: int
+    status: ExecutionStatus
+    artifacts_uri: Optional[str]
+    started_at: Optional[Stamp]
+    finished_at: Optional[Stamp]
+    created_at: Stamp
+    updated_at: Stamp
+    version: int
+
+    @classmethod
+    def pack(cls, ex: Execution) -> "ExecutionRecord":
+        return cls()._set({name: getattr(ex, name) for name in cls.__slots__})
+
+    def replace(self, changes: Dict[str, Any]) -> "ExecutionRecord":
+        """A new record with ``changes`` (already validated) applied."""
+        rec = ExecutionRecord()
+        for name in self.__slots__:
+            setattr(rec, name, getattr(self, name))
+        return rec._set(changes)
+
+    def _set(self, values: Dict[str, Any]) -> "ExecutionRecord":
+        for name, value in values.items():
+            pack = _PACK.get(name)
+            setattr(self, name, value if pack is None else pack(value))
+        return self
+
+    def unpack(self) -> Execution:
+        parameters = self.parameters
+        if parameters is not None:
+            # the one mutable field; copied as validation would
+            parameters = {} if parameters is _EMPTY else dict(parameters)
+        created_at = _unpack_time(self.created_at)
+        return _construct(
+            {
+                "reservation_id": self.reservation_id,
+                "commit_sha": self.commit_sha,
+                "test_suite": self.test_suite,
+                "parameters": parameters,
+                "priority": self.priority,
+                "id": self.id,
+                "status": self.status,
+                "artifacts_uri": self.artifacts_uri,
+                "started_at": _unpack_time(self.started_at),
+                "finished_at": _unpack_time(self.finished_at),
+                "created_at": created_at,
+                "updated_at": (
+                    created_at
+                    if self.updated_at == self.created_at
+                    else _unpack_time(self.updated_at)
+                ),
+                "version": self.version,
+            }
+        )
+
+
+_FIELDS = frozenset(Execution.model_fields)
+
+
+def _construct(values: Dict[str, Any]) -> Execution:
+    # Stored records were validated on the way in, so reads skip validation.
+    # This is Execution.model_construct for a complete set of fields, given
+    # in declaration order; model_construct itself resolves defaults per
+    # field and costs more than validating (about 6 us against 3 on pydantic
+    # 2.14), which is why it is not used.
+    ex = object.__new__(Execution)
+    object.__setattr__(ex, "__dict__", values)
+    object.__setattr__(ex, "__pydantic_fields_set__", set(_FIELDS))
+    object.__setattr__(ex, "__pydantic_extra__", None)
+    object.__setattr__(ex, "__pydantic_private__", None)
+    return ex
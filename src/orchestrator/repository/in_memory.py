@@ -1,50 +1,172 @@
 from __future__ import annotations
-from threading import Lock
-from typing import Dict, Iterable, Optional
-from datetime import datetime
-import uuid
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+from datetime import datetime, timedelta
 
 from orchestrator.models.reservation import (
+    BenchSlot,
     Reservation,
     ReservationCreate,
     ReservationStatus,
 )
-from orchestrator.repository.base import ReservationRepository
+from orchestrator.repository.base import (
+    ReservationConflictError,
+    ReservationRepository,
+)
+from orchestrator.repository.interval_index import from_timestamp, to_timestamp
+from orchestrator.ids import lower_bound, new_ulid
+from orchestrator.repository.keyset import KeysetIndex
+from orchestrator.observability.metrics import REPOSITORY_LOCK_WAIT
+from orchestrator.repository.striped import (
+    DEFAULT_STRIPES,
+    LockStripes,
+    StripedStore,
+    new_lock,
+)
+from orchestrator.scheduler import BenchPool, CapacityScheduler
 
 
 class InMemoryReservationRepo(ReservationRepository):
-    def __init__(self) -> None:
-        self._store: Dict[str, Reservation] = {}
-        self._lock = Lock()
+    # Admission is serialized per bench_type stripe (the conflict check and
+    # window insert must be atomic); records are stored in id stripes. Lock
+    # order: bench stripe, then id stripe, then _index_lock.
+
+    def __init__(
+        self, stripes: int = DEFAULT_STRIPES, pool: Optional[BenchPool] = None
+    ) -> None:
+        wait = REPOSITORY_LOCK_WAIT.labels("reservations").observe
+        self._store: StripedStore[Reservation] = StripedStore(stripes, wait)
+        self._bench_locks = LockStripes(stripes, wait)
+        self._index_lock = new_lock(wait)
+        # per-bench calendars of booked windows; assigns benches on admission
+        self._scheduler = CapacityScheduler(pool)
+        self._index = KeysetIndex("user_id", "bench_type")
 
     def create(self, payload: ReservationCreate) -> Reservation:
-        with self._lock:
-            rid = uuid.uuid4().hex
-            now = datetime.utcnow()
-            res = Reservation(
-                id=rid,
-                user_id=payload.user_id,
-                bench_type=payload.bench_type,
-                start=payload.start,
-                end=payload.end,
-                tags=payload.tags or [],
-                status=ReservationStatus.PENDING,
-                created_at=now,
-                updated_at=now,
+        result = self.create_many([payload])[0]
+        if isinstance(result, ReservationConflictError):
+            raise result
+        return result
+
+    def create_many(
+        self, payloads: Sequence[ReservationCreate]
+    ) -> List[Union[Reservation, ReservationConflictError]]:
+        now = datetime.utcnow()
+        built = [self._build(payload, now) for payload in payloads]
+        results: List[Union[Reservation, ReservationConflictError]] = list(built)
+        # admit per bench_type, taking each bench lock once and keeping the
+        # request order within a bench so earlier items win conflicts
+        by_bench: Dict[str, List[int]] = {}
+        for i, payload in enumerate(payloads):
+            by_bench.setdefault(payload.bench_type, []).append(i)
+        for bench_type, positions in by_bench.items():
+            with self._bench_locks(bench_type):
+                for i in positions:
+                    try:
+                        self._admit(built[i])
+                    except ReservationConflictError as exc:
+                        results[i] = exc
+        return results
+
+    @staticmethod
+    def _build(payload: ReservationCreate, now: datetime) -> Reservation:
+        return Reservation(
+            id=new_ulid(),
+            user_id=payload.user_id,
+            bench_type=payload.bench_type,
+            start=payload.start,
+            end=payload.end,
+            tags=payload.tags or [],
+            status=ReservationStatus.PENDING,
+            created_at=now,
+            updated_at=now,
+        )
+
+    def _admit(self, res: Reservation) -> None:
+        # caller holds the bench lock for res.bench_type
+        start, end = to_timestamp(res.start), to_timestamp(res.end)
+        res.bench_id = self._scheduler.assign(res.bench_type, start, end, res.id)
+        with self._store.lock(res.id):
+            self._store.put(res.id, res)
+        with self._index_lock:
+            self._index.add(
+                res.id,
+                user_id=res.user_id,
+                bench_type=res.bench_type,
             )
-            self._store[rid] = res
-            return res
 
     def get(self, reservation_id: str) -> Optional[Reservation]:
         return self._store.get(reservation_id)
 
-    def list(self, limit: int = 100) -> Iterable[Reservation]:
-        vals = list(self._store.values())
-        return vals[:limit]
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        user_id: Optional[str] = None,
+        bench_type: Optional[str] = None,
+    ) -> Iterable[Reservation]:
+        with self._index_lock:
+            ids = self._index.page(
+                limit, after=after, user_id=user_id, bench_type=bench_type
+            )
+        found = (self._store.get(i) for i in ids)
+        return [res for res in found if res is not None]
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Reservation]:
+        with self._index_lock:
+            ids = self._index.page(
+                limit, after=after, lo=lower_bound(start), hi=lower_bound(end)
+            )
+        found = (self._store.get(i) for i in ids)
+        return [res for res in found if res is not None]
 
     def delete(self, reservation_id: str) -> bool:
-        with self._lock:
-            if reservation_id in self._store:
-                del self._store[reservation_id]
-                return True
+        res = self._store.get(reservation_id)
+        if res is None:
             return False
+        with self._bench_locks(res.bench_type):
+            with self._store.lock(reservation_id):
+                if self._store.pop(reservation_id) is None:
+                    return False
+            self._scheduler.release(
+                res.bench_type, res.bench_id, to_timestamp(res.start), res.id
+            )
+            with self._index_lock:
+                self._index.remove(res.id)
+        return True
+
+    def delete_many(self, reservation_ids: Sequence[str]) -> List[bool]:
+        return [self.delete(rid) for rid in reservation_ids]
+
+    def find_overlapping(
+        self, bench_type: str, start: datetime, end: datetime
+    ) -> List[Reservation]:
+        with self._bench_locks(bench_type):
+            ids = self._scheduler.overlapping(
+                bench_type, to_timestamp(start), to_timestamp(end)
+            )
+        found = (self._store.get(i) for i in ids)
+        return sorted(
+            (res for res in found if res is not None),
+            key=lambda res: to_timestamp(res.start),
+        )
+
+    def next_slot(
+        self, bench_type: str, duration: timedelta, not_before: datetime
+    ) -> BenchSlot:
+        length = duration.total_seconds()
+        with self._bench_locks(bench_type):
+            start, bench_id = self._scheduler.next_slot(
+                bench_type, length, to_timestamp(not_before)
+            )
+        return BenchSlot(
+            bench_type=bench_type,
+            bench_id=bench_id,
+            start=from_timestamp(start),
+            end=from_timestamp(start + length),
+        )
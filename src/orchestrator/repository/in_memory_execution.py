@@ -1,61 +1,130 @@
 from __future__ import annotations
-from threading import Lock
-from typing import Dict, Iterable, Optional
+from typing import Iterable, List, Optional, Sequence
 from datetime import datetime
-import uuid
 
 from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
-from orchestrator.repository.execution_base import ExecutionRepository
+from orchestrator.repository.execution_base import (
+    ExecutionRepository,
+    ExpectedStatus,
+    check_expected,
+    validate_changes,
+)
+from orchestrator.ids import lower_bound, new_ulid
+from orchestrator.repository.execution_record import ExecutionRecord
+from orchestrator.repository.keyset import KeysetIndex
+from orchestrator.observability.metrics import REPOSITORY_LOCK_WAIT
+from orchestrator.repository.striped import DEFAULT_STRIPES, StripedStore, new_lock
 
 
 class InMemoryExecutionRepo(ExecutionRepository):
-    def __init__(self) -> None:
-        self._store: Dict[str, Execution] = {}
-        self._lock = Lock()
+    # Lock order: store stripe, then _index_lock. Models are always built
+    # outside both; the locks only cover dict swaps and index maintenance.
+    # Executions are stored as compact ExecutionRecords and become models
+    # again only when read.
+
+    def __init__(self, stripes: int = DEFAULT_STRIPES) -> None:
+        wait = REPOSITORY_LOCK_WAIT.labels("executions").observe
+        self._store: StripedStore[ExecutionRecord] = StripedStore(stripes, wait)
+        self._index_lock = new_lock(wait)
+        self._index = KeysetIndex("status", "reservation_id")
 
     def create(self, payload: ExecutionCreate) -> Execution:
-        with self._lock:
-            eid = uuid.uuid4().hex
-            now = datetime.utcnow()
-            exe = Execution(
-                id=eid,
-                reservation_id=payload.reservation_id,
-                commit_sha=payload.commit_sha,
-                test_suite=payload.test_suite,
-                parameters=payload.parameters or {},
-                status=ExecutionStatus.PENDING,
-                artifacts_uri=None,
-                started_at=None,
-                finished_at=None,
-                created_at=now,
-                updated_at=now,
-            )
-            self._store[eid] = exe
-            return exe
+        return self.create_many([payload])[0]
+
+    def create_many(self, payloads: Sequence[ExecutionCreate]) -> List[Execution]:
+        now = datetime.utcnow()
+        created = [self._build(payload, now) for payload in payloads]
+        records = [ExecutionRecord.pack(exe) for exe in created]
+        for rec in records:
+            with self._store.lock(rec.id):
+                self._store.put(rec.id, rec)
+        # ids are fresh, so nobody can race us between the puts and indexing
+        with self._index_lock:
+            for rec in records:
+                self._index.add(
+                    rec.id,
+                    status=rec.status,
+                    reservation_id=rec.reservation_id,
+                )
+        return created
+
+    @staticmethod
+    def _build(payload: ExecutionCreate, now: datetime) -> Execution:
+        return Execution(
+            id=new_ulid(),
+            reservation_id=payload.reservation_id,
+            commit_sha=payload.commit_sha,
+            test_suite=payload.test_suite,
+            parameters=payload.parameters or {},
+            priority=payload.priority,
+            status=ExecutionStatus.PENDING,
+            artifacts_uri=None,
+            started_at=None,
+            finished_at=None,
+            created_at=now,
+            updated_at=now,
+        )
 
     def get(self, execution_id: str) -> Optional[Execution]:
-        return self._store.get(execution_id)
+        rec = self._store.get(execution_id)
+        return None if rec is None else rec.unpack()
 
-    def list(self, limit: int = 100) -> Iterable[Execution]:
-        vals = list(self._store.values())
-        return vals[:limit]
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        reservation_id: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        with self._index_lock:
+            ids = self._index.page(
+                limit, after=after, status=status, reservation_id=reservation_id
+            )
+        found = (self._store.get(i) for i in ids)
+        return [rec.unpack() for rec in found if rec is not None]
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        with self._index_lock:
+            ids = self._index.page(
+                limit, after=after, lo=lower_bound(start), hi=lower_bound(end)
+            )
+        found = (self._store.get(i) for i in ids)
+        return [rec.unpack() for rec in found if rec is not None]
 
-    def update(self, execution_id: str, **fields) -> Optional[Execution]:
-        with self._lock:
-            ex = self._store.get(execution_id)
-            if not ex:
+    def update(
+        self,
+        execution_id: str,
+        expected_version: Optional[int] = None,
+        expected_status: ExpectedStatus = None,
+        **fields,
+    ) -> Optional[Execution]:
+        changes = validate_changes(fields)
+        while True:
+            rec = self._store.get(execution_id)
+            if rec is None:
                 return None
-            data = ex.dict()
-            data.update(fields)
-            data["updated_at"] = datetime.utcnow()
-            # pydantic model reconstruct
-            new_ex = Execution(**data)
-            self._store[execution_id] = new_ex
-            return new_ex
+            check_expected(rec, expected_version, expected_status)
+            new_rec = rec.replace(
+                dict(changes, updated_at=datetime.utcnow(), version=rec.version + 1)
+            )
+            with self._store.lock(execution_id):
+                if self._store.get(execution_id) is not rec:
+                    continue  # lost the race; re-check against the newer copy
+                self._store.put(execution_id, new_rec)
+                with self._index_lock:
+                    self._index.set(execution_id, "status", new_rec.status)
+            return new_rec.unpack()
 
     def delete(self, execution_id: str) -> bool:
-        with self._lock:
-            if execution_id in self._store:
-                del self._store[execution_id]
-                return True
-            return False
+        with self._store.lock(execution_id):
+            if self._store.pop(execution_id) is None:
+                return False
+            with self._index_lock:
+                self._index.remove(execution_id)
+            return True
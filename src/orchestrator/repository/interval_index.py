@@ -0,0 +1,147 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+import math
+
+
+def to_timestamp(dt: datetime) -> float:
+    """Return a POSIX timestamp, treating naive datetimes as UTC."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def from_timestamp(ts: float) -> datetime:
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def earliest_gap(
+    windows: Iterable[Tuple[float, float]],
+    not_before: float,
+    length: float,
+    give_up_at: float = math.inf,
+) -> Optional[float]:
+    """First start >= ``not_before`` leaving ``length`` free before the next window.
+
+    ``windows`` are ``(start, end)`` pairs in start order, skipping any that
+    end at or before ``not_before``. Returns None once the candidate start
+    reaches ``give_up_at``.
+    """
+    t = not_before
+    for start, end in windows:
+        if t >= give_up_at:
+            return None
+        if start - t >= length:
+            return t
+        t = max(t, end)
+    return t if t < give_up_at else None
+
+
+class _Lane:
+    """Sorted, non-overlapping half-open intervals kept in parallel arrays.
+
+    Because intervals in a lane never overlap, ordering by start also orders
+    by end, so both arrays can be bisected independently.
+    """
+
+    __slots__ = ("starts", "ends", "ids")
+
+    def __init__(self) -> None:
+        self.starts: List[float] = []
+        self.ends: List[float] = []
+        self.ids: List[str] = []
+
+    def span(self, start: float, end: float) -> Tuple[int, int]:
+        # first interval ending after `start` .. first interval starting at/after `end`
+        return bisect_right(self.ends, start), bisect_left(self.starts, end)
+
+
+class IntervalIndex:
+    """Per-key index of non-overlapping ``[start, end)`` intervals.
+
+    Lookups and conflict checks are O(log n + k); inserts and removals are a
+    bisect plus a list insert/delete.
+    """
+
+    def __init__(self) -> None:
+        self._lanes: Dict[Hashable, _Lane] = {}
+
+    def overlapping(self, key: Hashable, start: float, end: float) -> List[str]:
+        lane = self._lanes.get(key)
+        if lane is None:
+            return []
+        lo, hi = lane.span(start, end)
+        return lane.ids[lo:hi]
+
+    def has_overlap(self, key: Hashable, start: float, end: float) -> bool:
+        lane = self._lanes.get(key)
+        if lane is None:
+            return False
+        lo, hi = lane.span(start, end)
+        return lo < hi
+
+    def free_gap(
+        self, key: Hashable, start: float, end: float
+    ) -> Optional[Tuple[float, float]]:
+        """The free gap enclosing ``[start, end)``, or None if it is booked.
+
+        Unbounded sides of the gap are reported as -inf/inf.
+        """
+        lane = self._lanes.get(key)
+        if lane is None:
+            return -math.inf, math.inf
+        lo, hi = lane.span(start, end)
+        if lo < hi:
+            return None
+        gap_start = lane.ends[lo - 1] if lo else -math.inf
+        gap_end = lane.starts[lo] if lo < len(lane.starts) else math.inf
+        return gap_start, gap_end
+
+    def first_fit(
+        self,
+        key: Hashable,
+        not_before: float,
+        length: float,
+        give_up_at: float = math.inf,
+    ) -> Optional[float]:
+        """Earliest start >= ``not_before`` of a free gap at least ``length`` long.
+
+        One bisect, then a walk over the gaps until one fits; the walk stops
+        early (returning None) once candidates reach ``give_up_at``.
+        """
+        lane = self._lanes.get(key)
+        if lane is None:
+            return earliest_gap((), not_before, length, give_up_at)
+        starts, ends = lane.starts, lane.ends
+        first = bisect_right(ends, not_before)
+        windows = ((starts[i], ends[i]) for i in range(first, len(starts)))
+        return earliest_gap(windows, not_before, length, give_up_at)
+
+    def last_end(self, key: Hashable) -> float:
+        """End of the latest interval under ``key``, or -inf if it has none."""
+        lane = self._lanes.get(key)
+        return lane.ends[-1] if lane is not None else -math.inf
+
+    def add(self, key: Hashable, start: float, end: float, item_id: str) -> None:
+        lane = self._lanes.setdefault(key, _Lane())
+        lo, hi = lane.span(start, end)
+        if lo < hi:
+            raise ValueError(f"interval overlaps {lane.ids[lo]}")
+        lane.starts.insert(lo, start)
+        lane.ends.insert(lo, end)
+        lane.ids.insert(lo, item_id)
+
+    def remove(self, key: Hashable, start: float, item_id: str) -> bool:
+        lane = self._lanes.get(key)
+        if lane is None:
+            return False
+        i = bisect_left(lane.starts, start)
+        if i < len(lane.ids) and lane.ids[i] == item_id:
+            del lane.starts[i]
+            del lane.ends[i]
+            del lane.ids[i]
+            if not lane.ids:
+                del self._lanes[key]
+            return True
+        return False
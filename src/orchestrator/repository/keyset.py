@@ -0,0 +1,114 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from orchestrator.ids import is_ulid
+
+
+class InvalidCursorError(ValueError):
+    """Raised when an ``after`` cursor is not a well-formed record id."""
+
+    def __init__(self, cursor: str) -> None:
+        super().__init__(f"invalid cursor {cursor}")
+        self.cursor = cursor
+
+
+def check_cursor(after: Optional[str]) -> None:
+    if after is not None and not is_ulid(after):
+        raise InvalidCursorError(after)
+
+
+class KeysetIndex:
+    """Id-ordered primary index plus equality secondary indexes.
+
+    Record ids are ULIDs, so id order is creation order. Every bucket is a
+    sorted list of ids, so a page is one bisect to the cursor (or time bound)
+    followed by a walk of at most ``limit`` matching entries. Any id works as
+    a cursor, including one that has since been deleted.
+    """
+
+    def __init__(self, *fields: str) -> None:
+        self._fields = fields
+        self._all: List[str] = []
+        # each record's values, in ``fields`` order; a tuple is a third the
+        # size of a dict, which adds up over millions of records
+        self._attrs: Dict[str, Tuple[Hashable, ...]] = {}
+        self._by: Dict[str, Dict[Hashable, List[str]]] = {f: {} for f in fields}
+
+    def add(self, record_id: str, **attrs: Hashable) -> None:
+        values = tuple(attrs[f] for f in self._fields)
+        self._attrs[record_id] = values
+        insort(self._all, record_id)
+        for field, value in zip(self._fields, values):
+            insort(self._by[field].setdefault(value, []), record_id)
+
+    def remove(self, record_id: str) -> None:
+        values = self._attrs.pop(record_id, None)
+        if values is None:
+            return
+        _discard(self._all, record_id)
+        for field, value in zip(self._fields, values):
+            self._drop(field, value, record_id)
+
+    def set(self, record_id: str, field: str, value: Hashable) -> None:
+        """Move a record to another bucket of ``field`` (e.g. on status change)."""
+        values = self._attrs.get(record_id)
+        i = self._fields.index(field)
+        if values is None or values[i] == value:
+            return
+        self._drop(field, values[i], record_id)
+        self._attrs[record_id] = values[:i] + (value,) + values[i + 1 :]
+        insort(self._by[field].setdefault(value, []), record_id)
+
+    def page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        lo: Optional[str] = None,
+        hi: Optional[str] = None,
+        **filters: Optional[Hashable],
+    ) -> List[str]:
+        """Up to ``limit`` ids greater than ``after``, within ``[lo, hi)``."""
+        check_cursor(after)
+        active = {f: v for f, v in filters.items() if v is not None}
+        checks = [(self._fields.index(f), v) for f, v in active.items()]
+        candidates = self._all
+        for field, value in active.items():
+            bucket = self._by[field].get(value)
+            if bucket is None:
+                return []
+            if len(bucket) < len(candidates):
+                candidates = bucket
+
+        pos = 0
+        if after is not None:
+            pos = bisect_right(candidates, after)
+        if lo is not None:
+            pos = max(pos, bisect_left(candidates, lo))
+        end = len(candidates) if hi is None else bisect_left(candidates, hi)
+
+        if not active:
+            return candidates[pos : min(pos + limit, end)]
+        out: List[str] = []
+        for i in range(pos, end):
+            rid = candidates[i]
+            values = self._attrs[rid]
+            if all(values[i] == v for i, v in checks):
+                out.append(rid)
+                if len(out) >= limit:
+                    break
+        return out
+
+    def _drop(self, field: str, value: Hashable, record_id: str) -> None:
+        bucket = self._by[field].get(value)
+        if bucket is None:
+            return
+        _discard(bucket, record_id)
+        if not bucket:
+            del self._by[field][value]
+
+
+def _discard(ids: List[str], record_id: str) -> None:
+    i = bisect_left(ids, record_id)
+    if i < len(ids) and ids[i] == record_id:
+        del ids[i]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+from orchestrator.repository.execution_base import ExecutionRepository, ExpectedStatus
+
+ChangeListener = Callable[[Execution], None]
+
+
+class ObservedExecutionRepo(ExecutionRepository):
+    """Wraps an execution repository and reports every write to ``on_change``.
+
+    The listener runs on the writer's thread after the write has committed,
+    with the stored model; it must not block.
+    """
+
+    def __init__(self, inner: ExecutionRepository, on_change: ChangeListener) -> None:
+        self.inner = inner
+        self.on_change = on_change
+
+    def create(self, payload: ExecutionCreate) -> Execution:
+        return self.create_many([payload])[0]
+
+    def create_many(self, payloads: Sequence[ExecutionCreate]) -> List[Execution]:
+        created = self.inner.create_many(payloads)
+        for ex in created:
+            self.on_change(ex)
+        return created
+
+    def get(self, execution_id: str) -> Optional[Execution]:
+        return self.inner.get(execution_id)
+
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        reservation_id: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        return self.inner.list(
+            limit=limit, after=after, status=status, reservation_id=reservation_id
+        )
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        return self.inner.created_between(start, end, limit=limit, after=after)
+
+    def update(
+        self,
+        execution_id: str,
+        expected_version: Optional[int] = None,
+        expected_status: ExpectedStatus = None,
+        **fields,
+    ) -> Optional[Execution]:
+        ex = self.inner.update(
+            execution_id,
+            expected_version=expected_version,
+            expected_status=expected_status,
+            **fields,
+        )
+        if ex is not None:
+            self.on_change(ex)
+        return ex
+
+    def delete(self, execution_id: str) -> bool:
+        return self.inner.delete(execution_id)
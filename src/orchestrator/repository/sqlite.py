@@ -0,0 +1,444 @@
+from __future__ import annotations
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import math
+import sqlite3
+import threading
+
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+from orchestrator.models.reservation import (
+    BenchSlot,
+    Reservation,
+    ReservationCreate,
+    ReservationStatus,
+)
+from orchestrator.repository.base import (
+    ReservationConflictError,
+    ReservationRepository,
+)
+from orchestrator.repository.execution_base import (
+    ExecutionRepository,
+    ExpectedStatus,
+    apply_update,
+    check_expected,
+)
+from orchestrator.ids import lower_bound, new_ulid
+from orchestrator.repository.interval_index import (
+    earliest_gap,
+    from_timestamp,
+    to_timestamp,
+)
+from orchestrator.repository.keyset import check_cursor
+from orchestrator.scheduler import BenchPool, best_fit
+
+# Rows keep the full model as JSON in `data`; the other columns exist only to
+# be indexed and filtered on. Ids are ULIDs, so the primary key doubles as the
+# creation-time ordering used for paging and time-window scans.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reservations (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    bench_type TEXT NOT NULL,
+    bench_id TEXT,
+    start_ts REAL NOT NULL,
+    end_ts REAL NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_reservations_bench_calendar
+    ON reservations (bench_type, bench_id, start_ts, end_ts);
+CREATE INDEX IF NOT EXISTS ix_reservations_user
+    ON reservations (user_id, id);
+
+CREATE TABLE IF NOT EXISTS executions (
+    id TEXT PRIMARY KEY,
+    reservation_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 1,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_executions_status
+    ON executions (status, id);
+CREATE INDEX IF NOT EXISTS ix_executions_reservation
+    ON executions (reservation_id, id);
+"""
+
+
+class SQLiteDatabase:
+    """Connection-per-thread access to one SQLite file in WAL mode.
+
+    WAL lets readers proceed while a writer commits, so several API workers
+    (processes or threads) can share the file. Writes use ``BEGIN IMMEDIATE``
+    so read-check-write sequences are serialized across processes.
+    """
+
+    def __init__(self, path: str, busy_timeout_ms: int = 5000) -> None:
+        self.path = path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # autocommit mode; transactions are opened explicitly
+            conn = sqlite3.connect(
+                self.path, isolation_level=None, cached_statements=256
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _page_sql(
+    table: str,
+    filters: List[Tuple[str, Any]],
+    after: Optional[str],
+    lo: Optional[str] = None,
+    hi: Optional[str] = None,
+) -> Tuple[str, List[Any]]:
+    check_cursor(after)
+    clauses = [f"{col} = ?" for col, _ in filters]
+    params: List[Any] = [value for _, value in filters]
+    for op, bound in ((">", after), (">=", lo), ("<", hi)):
+        if bound is not None:
+            clauses.append(f"id {op} ?")
+            params.append(bound)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    # table and column names come from this module, never from the caller
+    sql = f"SELECT data FROM {table}{where} ORDER BY id LIMIT ?"  # nosec B608
+    return sql, params
+
+
+class SQLiteReservationRepo(ReservationRepository):
+    def __init__(self, db: SQLiteDatabase, pool: Optional[BenchPool] = None) -> None:
+        self.db = db
+        self.pool = pool or BenchPool()
+
+    def create(self, payload: ReservationCreate) -> Reservation:
+        with self.db.write() as conn:
+            return self._insert(conn, payload, datetime.utcnow())
+
+    def create_many(
+        self, payloads: Sequence[ReservationCreate]
+    ) -> List[Union[Reservation, ReservationConflictError]]:
+        results: List[Union[Reservation, ReservationConflictError]] = []
+        now = datetime.utcnow()
+        with self.db.write() as conn:
+            for payload in payloads:
+                try:
+                    results.append(self._insert(conn, payload, now))
+                except ReservationConflictError as exc:
+                    results.append(exc)
+        return results
+
+    def _insert(
+        self, conn: sqlite3.Connection, payload: ReservationCreate, now: datetime
+    ) -> Reservation:
+        # caller holds the write transaction
+        start, end = to_timestamp(payload.start), to_timestamp(payload.end)
+        bench_id = self._assign(conn, payload.bench_type, start, end)
+        res = Reservation(
+            id=new_ulid(),
+            user_id=payload.user_id,
+            bench_type=payload.bench_type,
+            start=payload.start,
+            end=payload.end,
+            tags=payload.tags or [],
+            status=ReservationStatus.PENDING,
+            created_at=now,
+            updated_at=now,
+            bench_id=bench_id,
+        )
+        conn.execute(
+            "INSERT INTO reservations"
+            " (id, user_id, bench_type, bench_id, start_ts, end_ts, data)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                res.id,
+                res.user_id,
+                res.bench_type,
+                res.bench_id,
+                start,
+                end,
+                res.model_dump_json(),
+            ),
+        )
+        return res
+
+    def _assign(
+        self, conn: sqlite3.Connection, bench_type: str, start: float, end: float
+    ) -> Optional[str]:
+        # windows on one bench never overlap, so only the latest one starting
+        # before `end` can clash; otherwise it and the next one bound the gap
+        gaps = []
+        clash_id: Optional[str] = None
+        for bench_id in self.pool.benches(bench_type):
+            prev = conn.execute(
+                "SELECT id, end_ts FROM reservations"
+                " WHERE bench_type = ? AND bench_id IS ? AND start_ts < ?"
+                " ORDER BY start_ts DESC LIMIT 1",
+                (bench_type, bench_id, end),
+            ).fetchone()
+            if prev is not None and prev[1] > start:
+                clash_id = clash_id or prev[0]
+                continue
+            (following,) = conn.execute(
+                "SELECT MIN(start_ts) FROM reservations"
+                " WHERE bench_type = ? AND bench_id IS ? AND start_ts >= ?",
+                (bench_type, bench_id, end),
+            ).fetchone()
+            gaps.append(
+                (
+                    bench_id,
+                    -math.inf if prev is None else prev[1],
+                    math.inf if following is None else following,
+                )
+            )
+        if not gaps:
+            raise ReservationConflictError(str(clash_id))
+        return best_fit(start, gaps)
+
+    def get(self, reservation_id: str) -> Optional[Reservation]:
+        row = (
+            self.db.connection()
+            .execute("SELECT data FROM reservations WHERE id = ?", (reservation_id,))
+            .fetchone()
+        )
+        return Reservation.model_validate_json(row[0]) if row else None
+
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        user_id: Optional[str] = None,
+        bench_type: Optional[str] = None,
+    ) -> Iterable[Reservation]:
+        conn = self.db.connection()
+        filters = [
+            (col, val)
+            for col, val in (("user_id", user_id), ("bench_type", bench_type))
+            if val is not None
+        ]
+        sql, params = _page_sql("reservations", filters, after)
+        rows = conn.execute(sql, (*params, limit)).fetchall()
+        return [Reservation.model_validate_json(r[0]) for r in rows]
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Reservation]:
+        sql, params = _page_sql(
+            "reservations", [], after, lower_bound(start), lower_bound(end)
+        )
+        rows = self.db.connection().execute(sql, (*params, limit)).fetchall()
+        return [Reservation.model_validate_json(r[0]) for r in rows]
+
+    def delete(self, reservation_id: str) -> bool:
+        with self.db.write() as conn:
+            cur = conn.execute(
+                "DELETE FROM reservations WHERE id = ?", (reservation_id,)
+            )
+            return cur.rowcount > 0
+
+    def delete_many(self, reservation_ids: Sequence[str]) -> List[bool]:
+        with self.db.write() as conn:
+            deleted = []
+            for rid in reservation_ids:
+                cur = conn.execute("DELETE FROM reservations WHERE id = ?", (rid,))
+                deleted.append(cur.rowcount > 0)
+            return deleted
+
+    def find_overlapping(
+        self, bench_type: str, start: datetime, end: datetime
+    ) -> List[Reservation]:
+        conn = self.db.connection()
+        found: List[Reservation] = []
+        for bench_id in self.pool.benches(bench_type):
+            rows = conn.execute(
+                # bound the index range below by the bench's last window
+                # starting at/before `start`; anything earlier ended before it
+                "SELECT data FROM reservations"
+                " WHERE bench_type = ?1 AND bench_id IS ?2"
+                " AND start_ts < ?3 AND end_ts > ?4"
+                " AND start_ts >= COALESCE((SELECT MAX(start_ts) FROM reservations"
+                " WHERE bench_type = ?1 AND bench_id IS ?2 AND start_ts <= ?4), ?4)"
+                " ORDER BY start_ts",
+                (bench_type, bench_id, to_timestamp(end), to_timestamp(start)),
+            ).fetchall()
+            found.extend(Reservation.model_validate_json(r[0]) for r in rows)
+        found.sort(key=lambda res: to_timestamp(res.start))
+        return found
+
+    def next_slot(
+        self, bench_type: str, duration: timedelta, not_before: datetime
+    ) -> BenchSlot:
+        length = duration.total_seconds()
+        t = to_timestamp(not_before)
+        conn = self.db.connection()
+        best_start = math.inf
+        best_bench: Optional[str] = None
+        for bench_id in self.pool.benches(bench_type):
+            windows = conn.execute(
+                "SELECT start_ts, end_ts FROM reservations"
+                " WHERE bench_type = ?1 AND bench_id IS ?2 AND end_ts > ?3"
+                " AND start_ts >= COALESCE((SELECT MAX(start_ts) FROM reservations"
+                " WHERE bench_type = ?1 AND bench_id IS ?2 AND start_ts <= ?3), ?3)"
+                " ORDER BY start_ts",
+                (bench_type, bench_id, t),
+            )
+            found = earliest_gap(windows, t, length, give_up_at=best_start)
+            windows.close()
+            if found is not None and found < best_start:
+                best_start, best_bench = found, bench_id
+                if found == t:
+                    break
+        return BenchSlot(
+            bench_type=bench_type,
+            bench_id=best_bench,
+            start=from_timestamp(best_start),
+            end=from_timestamp(best_start + length),
+        )
+
+
+class SQLiteExecutionRepo(ExecutionRepository):
+    def __init__(self, db: SQLiteDatabase) -> None:
+        self.db = db
+
+    def create(self, payload: ExecutionCreate) -> Execution:
+        return self.create_many([payload])[0]
+
+    def create_many(self, payloads: Sequence[ExecutionCreate]) -> List[Execution]:
+        now = datetime.utcnow()
+        created = [
+            Execution(
+                id=new_ulid(),
+                reservation_id=payload.reservation_id,
+                commit_sha=payload.commit_sha,
+                test_suite=payload.test_suite,
+                parameters=payload.parameters or {},
+                priority=payload.priority,
+                status=ExecutionStatus.PENDING,
+                artifacts_uri=None,
+                started_at=None,
+                finished_at=None,
+                created_at=now,
+                updated_at=now,
+            )
+            for payload in payloads
+        ]
+        with self.db.write() as conn:
+            conn.executemany(
+                "INSERT INTO executions"
+                " (id, reservation_id, status, data)"
+                " VALUES (?, ?, ?, ?)",
+                [
+                    (
+                        exe.id,
+                        exe.reservation_id,
+                        exe.status.value,
+                        exe.model_dump_json(),
+                    )
+                    for exe in created
+                ],
+            )
+        return created
+
+    def get(self, execution_id: str) -> Optional[Execution]:
+        row = (
+            self.db.connection()
+            .execute("SELECT data FROM executions WHERE id = ?", (execution_id,))
+            .fetchone()
+        )
+        return Execution.model_validate_json(row[0]) if row else None
+
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        reservation_id: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        conn = self.db.connection()
+        filters: List[Tuple[str, Any]] = []
+        if status is not None:
+            filters.append(("status", ExecutionStatus(status).value))
+        if reservation_id is not None:
+            filters.append(("reservation_id", reservation_id))
+        sql, params = _page_sql("executions", filters, after)
+        rows = conn.execute(sql, (*params, limit)).fetchall()
+        return [Execution.model_validate_json(r[0]) for r in rows]
+
+    def created_between(
+        self,
+        start: datetime,
+        end: datetime,
+        limit: int = 100,
+        after: Optional[str] = None,
+    ) -> Iterable[Execution]:
+        sql, params = _page_sql(
+            "executions", [], after, lower_bound(start), lower_bound(end)
+        )
+        rows = self.db.connection().execute(sql, (*params, limit)).fetchall()
+        return [Execution.model_validate_json(r[0]) for r in rows]
+
+    def update(
+        self,
+        execution_id: str,
+        expected_version: Optional[int] = None,
+        expected_status: ExpectedStatus = None,
+        **fields,
+    ) -> Optional[Execution]:
+        # Optimistic: read without a write lock, then compare-and-set on version.
+        # Unconditional updates retry on a lost race; conditional ones re-check
+        # their expectations against the fresh row and fail fast.
+        conn = self.db.connection()
+        while True:
+            row = conn.execute(
+                "SELECT data FROM executions WHERE id = ?", (execution_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            ex = Execution.model_validate_json(row[0])
+            check_expected(ex, expected_version, expected_status)
+            new_ex = apply_update(ex, fields)
+            cur = conn.execute(
+                "UPDATE executions SET status = ?, version = ?, data = ?"
+                " WHERE id = ? AND version = ?",
+                (
+                    new_ex.status.value,
+                    new_ex.version,
+                    new_ex.model_dump_json(),
+                    execution_id,
+                    ex.version,
+                ),
+            )
+            if cur.rowcount:
+                return new_ex
+
+    def delete(self, execution_id: str) -> bool:
+        with self.db.write() as conn:
+            cur = conn.execute("DELETE FROM executions WHERE id = ?", (execution_id,))
+            return cur.rowcount > 0
@@ -0,0 +1,113 @@
+from __future__ import annotations
+from threading import Lock
+from time import perf_counter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+V = TypeVar("V")
+
+DEFAULT_STRIPES = 16
+
+# called with the seconds a contended acquisition waited
+WaitObserver = Callable[[float], None]
+
+
+class TimedLock:
+    """Lock that reports how long contended acquisitions waited.
+
+    An uncontended acquire succeeds on the first non-blocking try and is not
+    timed, so the cost over a bare Lock is one extra call.
+    """
+
+    __slots__ = ("_lock", "_on_wait")
+
+    def __init__(self, on_wait: WaitObserver) -> None:
+        self._lock = Lock()
+        self._on_wait = on_wait
+
+    def acquire(self) -> bool:
+        if not self._lock.acquire(False):
+            t0 = perf_counter()
+            self._lock.acquire()
+            self._on_wait(perf_counter() - t0)
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc: Any) -> None:
+        self._lock.release()
+
+
+AnyLock = Union[Lock, TimedLock]
+
+
+def new_lock(on_wait: Optional[WaitObserver] = None) -> AnyLock:
+    return Lock() if on_wait is None else TimedLock(on_wait)
+
+
+class LockStripes:
+    """Fixed pool of locks; a key always maps to the same lock."""
+
+    def __init__(
+        self, stripes: int = DEFAULT_STRIPES, on_wait: Optional[WaitObserver] = None
+    ) -> None:
+        self._locks = [new_lock(on_wait) for _ in range(stripes)]
+
+    def __call__(self, key: Hashable) -> AnyLock:
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class StripedStore(Generic[V]):
+    """Dict sharded by key hash, with one lock per shard.
+
+    Reads are plain dict lookups and never take a lock. Writers hold
+    ``lock(key)`` only for the swap itself, so writers on different shards do
+    not contend.
+    """
+
+    def __init__(
+        self, stripes: int = DEFAULT_STRIPES, on_wait: Optional[WaitObserver] = None
+    ) -> None:
+        self._shards: List[Dict[str, V]] = [{} for _ in range(stripes)]
+        self._locks = [new_lock(on_wait) for _ in range(stripes)]
+
+    def _slot(self, key: str) -> int:
+        return hash(key) % len(self._shards)
+
+    def lock(self, key: str) -> AnyLock:
+        return self._locks[self._slot(key)]
+
+    def get(self, key: str) -> Optional[V]:
+        return self._shards[self._slot(key)].get(key)
+
+    def put(self, key: str, value: V) -> None:
+        # caller holds lock(key)
+        self._shards[self._slot(key)][key] = value
+
+    def pop(self, key: str) -> Optional[V]:
+        # caller holds lock(key)
+        return self._shards[self._slot(key)].pop(key, None)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def values(self) -> Iterator[V]:
+        for shard in self._shards:
+            yield from list(shard.values())
@@ -0,0 +1,40 @@
+from __future__ import annotations
+from functools import wraps
+from time import perf_counter
+from typing import Any, Callable
+
+from orchestrator.observability.metrics import REPOSITORY_OPERATION_DURATION
+
+
+class TimedRepository:
+    """Proxy recording the latency of every public method of a repository.
+
+    The wrappers and their histogram children are built once, so a call
+    costs two clock reads and one ``observe`` on top of the real work.
+    """
+
+    def __init__(self, inner: Any, repository: str) -> None:
+        self.inner = inner
+        for name in dir(type(inner)):
+            if name.startswith("_"):
+                continue
+            method = getattr(inner, name)
+            if callable(method):
+                child = REPOSITORY_OPERATION_DURATION.labels(repository, name)
+                setattr(self, name, _timed(method, child.observe))
+
+    def __getattr__(self, name: str) -> Any:
+        # only reached for attributes that are not wrapped methods
+        return getattr(self.inner, name)
+
+
+def _timed(method: Callable, observe: Callable[[float], None]) -> Callable:
+    @wraps(method)
+    def call(*args, **kwargs):
+        t0 = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            observe(perf_counter() - t0)
+
+    return call
@@ -0,0 +1,49 @@
+"""Runner adapters (ADR-007): execution backends behind one interface."""
+
+from orchestrator.runners.base import (
+    ArtifactBundle,
+    ArtifactError,
+    ExecutionError,
+    ProvisionError,
+    RunnerAdapter,
+    RunnerError,
+    RunnerHandle,
+    ShardResult,
+    TeardownError,
+    TestResult,
+    as_engine_runner,
+    run_lifecycle,
+)
+from orchestrator.runners.factory import RunnerFactory
+from orchestrator.runners.local import (
+    DEFAULT_MAX_SHARDS,
+    LocalProcessRunner,
+    cpu_shards,
+)
+from orchestrator.runners.mock import LocalMockRunner, MockSlotProvider
+from orchestrator.runners.warm_pool import PoolStats, SlotProvider, WarmPool, WarmSlot
+
+__all__ = [
+    "ArtifactBundle",
+    "ArtifactError",
+    "DEFAULT_MAX_SHARDS",
+    "ExecutionError",
+    "LocalMockRunner",
+    "LocalProcessRunner",
+    "MockSlotProvider",
+    "PoolStats",
+    "ProvisionError",
+    "RunnerAdapter",
+    "RunnerError",
+    "RunnerFactory",
+    "RunnerHandle",
+    "ShardResult",
+    "SlotProvider",
+    "TeardownError",
+    "TestResult",
+    "WarmPool",
+    "WarmSlot",
+    "as_engine_runner",
+    "cpu_shards",
+    "run_lifecycle",
+]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Event
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+import asyncio
+
+from orchestrator.models.execution import Execution
+from orchestrator.models.reservation import DEFAULT_BENCH_TYPE
+
+
+class RunnerError(Exception):
+    """Base class for adapter failures; carries whatever artifacts were saved."""
+
+    def __init__(
+        self,
+        message: str,
+        execution_id: Optional[str] = None,
+        artifacts_uri: Optional[str] = None,
+    ) -> None:
+        super().__init__(message)
+        self.execution_id = execution_id
+        self.artifacts_uri = artifacts_uri
+
+
+class ProvisionError(RunnerError):
+    pass
+
+
+class ExecutionError(RunnerError):
+    pass
+
+
+class ArtifactError(RunnerError):
+    pass
+
+
+class TeardownError(RunnerError):
+    pass
+
+
+@dataclass
+class RunnerHandle:
+    """Opaque to callers; only the adapter that issued it looks inside."""
+
+    execution_id: str
+    bench_type: str = DEFAULT_BENCH_TYPE
+    workdir: Optional[Path] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ShardResult:
+    index: int
+    # negative signal number if the shard was killed
+    exit_code: Optional[int]
+    log_path: Optional[Path] = None
+
+
+@dataclass
+class TestResult:
+    __test__ = False  # not a pytest test class
+
+    shards: List[ShardResult]
+    duration_seconds: float
+    timed_out: bool = False
+    cancelled: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return (
+            not self.timed_out
+            and not self.cancelled
+            and all(shard.exit_code == 0 for shard in self.shards)
+        )
+
+
+@dataclass
+class ArtifactBundle:
+    uri: Optional[str]
+    files: List[Path] = field(default_factory=list)
+
+
+class RunnerAdapter(Protocol):
+    """Strategy interface for execution backends (ADR-007).
+
+    Every execution goes provision -> run_test -> collect_artifacts ->
+    teardown; teardown always runs once provisioning succeeded.
+    """
+
+    async def provision(
+        self, execution: Execution, bench_type: str = DEFAULT_BENCH_TYPE
+    ) -> RunnerHandle: ...
+
+    async def run_test(self, handle: RunnerHandle, cancel: Event) -> TestResult: ...
+
+    async def collect_artifacts(
+        self, handle: RunnerHandle, result: TestResult
+    ) -> ArtifactBundle: ...
+
+    async def teardown(self, handle: RunnerHandle) -> None: ...
+
+
+async def run_lifecycle(
+    adapter: RunnerAdapter,
+    execution: Execution,
+    cancel: Event,
+    bench_type: str = DEFAULT_BENCH_TYPE,
+) -> Tuple[TestResult, ArtifactBundle]:
+    handle = await adapter.provision(execution, bench_type)
+    try:
+        result = await adapter.run_test(handle, cancel)
+        bundle = await adapter.collect_artifacts(handle, result)
+    finally:
+        await adapter.teardown(handle)
+    return result, bundle
+
+
+def as_engine_runner(
+    adapter: RunnerAdapter,
+    bench_type_of: Optional[Callable[[Execution], str]] = None,
+) -> Callable[[Execution, Event], Optional[str]]:
+    """Wrap an adapter as an ExecutionEngine runner (one event loop per run).
+
+    Returns the artifacts URI; a failed or timed-out run raises ExecutionError
+    so the engine marks the execution FAILED. ``bench_type_of`` resolves the
+    bench type handed to ``provision``.
+    """
+
+    def run(execution: Execution, cancel: Event) -> Optional[str]:
+        bench_type = DEFAULT_BENCH_TYPE
+        if bench_type_of is not None:
+            bench_type = bench_type_of(execution)
+        result, bundle = asyncio.run(
+            run_lifecycle(adapter, execution, cancel, bench_type)
+        )
+        if result.cancelled:
+            return None
+        if not result.passed:
+            if result.timed_out:
+                reason = f"timed out after {result.duration_seconds:.0f}s"
+            else:
+                codes = [shard.exit_code for shard in result.shards]
+                reason = f"exit codes {codes}"
+            raise ExecutionError(
+                f"run failed: {reason}", execution.id, artifacts_uri=bundle.uri
+            )
+        return bundle.uri
+
+    return run
@@ -0,0 +1,26 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict
+
+from orchestrator.runners.base import RunnerAdapter
+from orchestrator.runners.local import LocalProcessRunner
+from orchestrator.runners.mock import LocalMockRunner
+
+
+class RunnerFactory:
+    """Creates runner adapters by type name (ADR-007 configuration model)."""
+
+    _types: Dict[str, Callable[..., RunnerAdapter]] = {
+        "local": LocalProcessRunner,
+        "local_mock": LocalMockRunner,
+    }
+
+    @classmethod
+    def register(cls, runner_type: str, builder: Callable[..., RunnerAdapter]) -> None:
+        cls._types[runner_type] = builder
+
+    @classmethod
+    def create(cls, runner_type: str, **config: Any) -> RunnerAdapter:
+        builder = cls._types.get(runner_type)
+        if builder is None:
+            raise ValueError(f"unknown runner type {runner_type!r}")
+        return builder(**config)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+from pathlib import Path
+from threading import Event
+from typing import Callable, Dict, List, Optional, Union
+import asyncio
+import os
+import shlex
+import signal
+
+from orchestrator.artifacts import LocalArtifactStore
+from orchestrator.models.execution import Execution
+from orchestrator.models.reservation import DEFAULT_BENCH_TYPE
+from orchestrator.runners.base import (
+    ArtifactBundle,
+    ArtifactError,
+    ExecutionError,
+    ProvisionError,
+    RunnerHandle,
+    ShardResult,
+    TestResult,
+)
+from orchestrator.services.live_logs import LiveLogs
+
+# (execution_id, shard index, line without trailing newline)
+OutputHandler = Callable[[str, int, str], None]
+
+# longest output line kept; asyncio drops anything longer
+_LINE_LIMIT = 1 << 20
+
+# processes one execution may fork, whatever its parameters ask for
+DEFAULT_MAX_SHARDS = 32
+
+
+class LocalProcessRunner:
+    """Runs an execution's ``test_suite`` command as local subprocesses.
+
+    The suite can be sharded across N processes (``shards`` here, or the
+    execution's ``parameters["shards"]``). Every shard runs the same command
+    with ``ORCHESTRATOR_SHARD_INDEX``/``ORCHESTRATOR_SHARD_COUNT`` set and
+    ``{shard}``/``{shards}`` substituted in its arguments, which is what test
+    sharding plugins consume. A requested shard count is capped at
+    ``max_shards`` (never below ``shards``). Output is streamed line by line into a log
+    file per shard under ``artifacts_dir/<execution_id>/`` and to
+    ``on_output``, and into the execution's live log in ``logs`` for tailing
+    (prefixed ``[shard N]`` when sharded). With a ``store``, the logs are then
+    published to it as ``logs/shard-N.log`` (ADR-009). The command is never
+    run through a shell.
+    """
+
+    def __init__(
+        self,
+        artifacts_dir: Union[str, Path],
+        shards: int = 1,
+        timeout_seconds: Optional[float] = None,
+        on_output: Optional[OutputHandler] = None,
+        cwd: Optional[Union[str, Path]] = None,
+        env: Optional[Dict[str, str]] = None,
+        poll_interval: float = 0.05,
+        store: Optional[LocalArtifactStore] = None,
+        logs: Optional[LiveLogs] = None,
+        max_shards: int = DEFAULT_MAX_SHARDS,
+    ) -> None:
+        self.artifacts_dir = Path(artifacts_dir)
+        self.shards = max(1, shards)
+        self.max_shards = max(self.shards, max_shards)
+        self.timeout_seconds = timeout_seconds
+        self.on_output = on_output
+        self.cwd = cwd
+        self.env = dict(env or {})
+        self.poll_interval = poll_interval
+        self.store = store
+        self.logs = logs
+
+    async def provision(
+        self, execution: Execution, bench_type: str = DEFAULT_BENCH_TYPE
+    ) -> RunnerHandle:
+        if not execution.test_suite:
+            raise ProvisionError("execution has no test_suite", execution.id)
+        try:
+            argv = shlex.split(execution.test_suite)
+        except ValueError as exc:
+            raise ProvisionError(f"bad test_suite: {exc}", execution.id) from exc
+        params = execution.parameters or {}
+        shards = params.get("shards", self.shards)
+        try:
+            shards = min(max(1, int(shards)), self.max_shards)
+        except (TypeError, ValueError):
+            raise ProvisionError(
+                f"parameters.shards must be an integer, got {shards!r}", execution.id
+            ) from None
+        timeout = params.get("timeout_seconds", self.timeout_seconds)
+        if timeout is not None:
+            if (
+                isinstance(timeout, bool)
+                or not isinstance(timeout, (int, float))
+                or not timeout >= 0  # NaN too
+            ):
+                raise ProvisionError(
+                    "parameters.timeout_seconds must be a non-negative number,"
+                    f" got {timeout!r}",
+                    execution.id,
+                )
+            timeout = float(timeout)
+        workdir = self.artifacts_dir / execution.id
+        workdir.mkdir(parents=True, exist_ok=True)
+        if self.logs is not None:
+            self.logs.open(execution.id)
+        return RunnerHandle(
+            execution_id=execution.id,
+            bench_type=bench_type,
+            workdir=workdir,
+            metadata={
+                "argv": argv,
+                "shards": shards,
+                "timeout": timeout,
+                "processes": [],
+            },
+        )
+
+    async def run_test(self, handle: RunnerHandle, cancel: Event) -> TestResult:
+        count = handle.metadata["shards"]
+        timeout = handle.metadata["timeout"]
+        procs: List[asyncio.subprocess.Process] = handle.metadata["processes"]
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for index in range(count):
+            procs.append(await self._spawn(handle, index, count))
+        pumps = [
+            asyncio.ensure_future(self._pump(handle, proc, index))
+            for index, proc in enumerate(procs)
+        ]
+
+        timed_out = cancelled = False
+        pending = set(pumps)
+        while pending:
+            _, pending = await asyncio.wait(pending, timeout=self.poll_interval)
+            if not pending:
+                break
+            if cancel.is_set():
+                cancelled = True
+            elif timeout is not None and loop.time() - started >= timeout:
+                timed_out = True
+            else:
+                continue
+            _kill(procs)
+            await asyncio.wait(pending)
+            break
+        return TestResult(
+            shards=[pump.result() for pump in pumps],
+            duration_seconds=loop.time() - started,
+            timed_out=timed_out,
+            cancelled=cancelled,
+        )
+
+    async def collect_artifacts(
+        self, handle: RunnerHandle, result: TestResult
+    ) -> ArtifactBundle:
+        workdir = handle.workdir
+        if workdir is None:
+            return ArtifactBundle(uri=None)
+        files = sorted(p for p in workdir.rglob("*") if p.is_file())
+        uri = workdir.resolve().as_uri()
+        if self.store is None:
+            return ArtifactBundle(uri=uri, files=files)
+        eid = handle.execution_id
+        try:
+            for path in files:
+                name = "logs/" + path.relative_to(workdir).as_posix()
+                await self.store.put_file(eid, name, path)
+        except Exception as exc:
+            raise ArtifactError(
+                f"cannot publish artifacts: {exc}", eid, artifacts_uri=uri
+            ) from exc
+        return ArtifactBundle(uri=self.store.uri(eid), files=files)
+
+    async def teardown(self, handle: RunnerHandle) -> None:
+        _kill(handle.metadata.get("processes", []))
+        if self.logs is not None:
+            self.logs.finish(handle.execution_id)
+
+    async def _spawn(
+        self, handle: RunnerHandle, index: int, count: int
+    ) -> asyncio.subprocess.Process:
+        argv = [
+            arg.replace("{shard}", str(index)).replace("{shards}", str(count))
+            for arg in handle.metadata["argv"]
+        ]
+        env = {**os.environ, **self.env}
+        env.update(
+            ORCHESTRATOR_EXECUTION_ID=handle.execution_id,
+            ORCHESTRATOR_SHARD_INDEX=str(index),
+            ORCHESTRATOR_SHARD_COUNT=str(count),
+            ORCHESTRATOR_WORKDIR=str(handle.workdir),
+        )
+        try:
+            # own session, so a timeout can kill the whole process tree
+            return await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.cwd,
+                env=env,
+                start_new_session=True,
+                limit=_LINE_LIMIT,
+            )
+        except OSError as exc:
+            raise ExecutionError(
+                f"cannot launch {argv[0]}: {exc}", handle.execution_id
+            ) from exc
+
+    async def _pump(
+        self, handle: RunnerHandle, proc: asyncio.subprocess.Process, index: int
+    ) -> ShardResult:
+        workdir = handle.workdir or self.artifacts_dir / handle.execution_id
+        log_path = workdir / f"shard-{index}.log"
+        stream = proc.stdout
+        live = self.logs.open(handle.execution_id) if self.logs else None
+        prefix = f"[shard {index}] ".encode() if handle.metadata["shards"] > 1 else b""
+        with open(log_path, "wb") as log:
+            while stream is not None:
+                try:
+                    line = await stream.readline()
+                except ValueError:
+                    # asyncio discards a line over the limit; record the gap
+                    line = b"[orchestrator: over-long output line dropped]\n"
+                if not line:
+                    break
+                log.write(line)
+                if live is not None:
+                    live.write(prefix + line)
+                if self.on_output is not None:
+                    text = line.decode("utf-8", errors="replace").rstrip("\r\n")
+                    self.on_output(handle.execution_id, index, text)
+        code = await proc.wait()
+        return ShardResult(index=index, exit_code=code, log_path=log_path)
+
+
+def _kill(procs: List[asyncio.subprocess.Process]) -> None:
+    # the whole group, since children can outlive the shard's own process
+    # and keep its output pipe open; a shard already reaped is skipped, as
+    # its pid may since have been reused
+    for proc in procs:
+        if proc.returncode is not None:
+            continue
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except ProcessLookupError:
+            pass
+
+
+def cpu_shards() -> int:
+    """One shard per available core."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
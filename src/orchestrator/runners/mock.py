@@ -0,0 +1,94 @@
+from __future__ import annotations
+from itertools import count
+from threading import Event
+from typing import Optional
+import asyncio
+
+from orchestrator.models.execution import Execution
+from orchestrator.models.reservation import DEFAULT_BENCH_TYPE
+from orchestrator.runners.base import (
+    ArtifactBundle,
+    RunnerHandle,
+    ShardResult,
+    TestResult,
+)
+from orchestrator.runners.warm_pool import WarmPool, WarmSlot
+
+
+class MockSlotProvider:
+    """Fake environments that take ``provision_seconds`` to come up."""
+
+    def __init__(self, provision_seconds: float = 0.0) -> None:
+        self.provision_seconds = provision_seconds
+        self.created = 0
+        self.destroyed = 0
+        self._ids = count(1)
+
+    async def create(self, bench_type: str) -> str:
+        await asyncio.sleep(self.provision_seconds)
+        self.created += 1
+        return f"mock-{bench_type}-{next(self._ids)}"
+
+    async def destroy(self, resource: str) -> None:
+        self.destroyed += 1
+
+
+class LocalMockRunner:
+    """Deterministic fake backend (ADR-007) with ADR-008 style provisioning.
+
+    Provisioning goes through ``pool`` when one is given, otherwise straight
+    to the provider; the run itself waits ``run_seconds`` (or until
+    cancelled) and reports fake artifacts.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[MockSlotProvider] = None,
+        pool: Optional[WarmPool] = None,
+        run_seconds: float = 0.0,
+        poll_interval: float = 0.05,
+    ) -> None:
+        self.provider = provider or MockSlotProvider()
+        self.pool = pool
+        self.run_seconds = run_seconds
+        self.poll_interval = poll_interval
+
+    async def provision(
+        self, execution: Execution, bench_type: str = DEFAULT_BENCH_TYPE
+    ) -> RunnerHandle:
+        if self.pool is not None:
+            slot = await self.pool.acquire(bench_type)
+        else:
+            loop = asyncio.get_running_loop()
+            resource = await self.provider.create(bench_type)
+            slot = WarmSlot(bench_type, resource, warm=False, created_at=loop.time())
+        return RunnerHandle(
+            execution_id=execution.id, bench_type=bench_type, metadata={"slot": slot}
+        )
+
+    async def run_test(self, handle: RunnerHandle, cancel: Event) -> TestResult:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self.run_seconds
+        while not cancel.is_set() and loop.time() < deadline:
+            await asyncio.sleep(min(self.poll_interval, deadline - loop.time()))
+        cancelled = cancel.is_set()
+        return TestResult(
+            shards=[ShardResult(index=0, exit_code=None if cancelled else 0)],
+            duration_seconds=loop.time() - started,
+            cancelled=cancelled,
+        )
+
+    async def collect_artifacts(
+        self, handle: RunnerHandle, result: TestResult
+    ) -> ArtifactBundle:
+        return ArtifactBundle(
+            uri=f"s3://fake-bucket/executions/{handle.execution_id}/artifacts.tar.gz"
+        )
+
+    async def teardown(self, handle: RunnerHandle) -> None:
+        slot: WarmSlot = handle.metadata["slot"]
+        if self.pool is not None:
+            await self.pool.release(slot)
+        else:
+            await self.provider.destroy(slot.resource)
@@ -0,0 +1,227 @@
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Deque, Dict, List, Mapping, Protocol, Set
+import asyncio
+import logging
+import time
+
+from orchestrator.observability.metrics import WARM_POOL_ACQUIRE_DURATION
+
+logger = logging.getLogger(__name__)
+
+
+class SlotProvider(Protocol):
+    """Creates and destroys the environments a WarmPool keeps ready."""
+
+    async def create(self, bench_type: str) -> Any: ...
+
+    async def destroy(self, resource: Any) -> None: ...
+
+
+@dataclass
+class WarmSlot:
+    bench_type: str
+    resource: Any
+    # True if handed out from the pool, False if provisioned on demand
+    warm: bool
+    created_at: float
+
+
+@dataclass
+class PoolStats:
+    hits: int
+    misses: int
+    ready: Dict[str, int]
+    provisioning: Dict[str, int]
+    acquire_count: int
+    acquire_seconds_total: float
+    acquire_p50: float
+    acquire_p99: float
+
+
+class WarmPool:
+    """Pre-provisioned runner slots per bench_type (ADR-008).
+
+    ``acquire`` pops a ready slot in O(1) (a hit) or, if none is ready,
+    provisions one on the caller's event loop (a miss). Either way the pool is
+    topped back up to its target size in the background, on a private event
+    loop thread, so the cold start is paid off the request path. Failed
+    provisioning is retried after ``retry_seconds``.
+    """
+
+    def __init__(
+        self,
+        provider: SlotProvider,
+        sizes: Mapping[str, int],
+        retry_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        samples: int = 1024,
+    ) -> None:
+        self.provider = provider
+        self.sizes = dict(sizes)
+        self.retry_seconds = retry_seconds
+        self._clock = clock
+        self._lock = Lock()
+        self._ready: Dict[str, Deque[WarmSlot]] = {b: deque() for b in self.sizes}
+        self._inflight: Dict[str, int] = {b: 0 for b in self.sizes}
+        self._hits = 0
+        self._misses = 0
+        self._acquire_count = 0
+        self._acquire_total = 0.0
+        self._acquire_samples: Deque[float] = deque(maxlen=samples)
+        self._closed = False
+        self._fills: Set[asyncio.Task] = set()
+        self._loop = asyncio.new_event_loop()
+        started = Event()
+        self._thread = Thread(
+            target=self._serve, args=(started,), name="warm-pool", daemon=True
+        )
+        self._thread.start()
+        started.wait()
+        for bench_type in self.sizes:
+            self._schedule_replenish(bench_type)
+
+    async def acquire(self, bench_type: str) -> WarmSlot:
+        t0 = self._clock()
+        with self._lock:
+            ready = self._ready.get(bench_type)
+            slot = ready.popleft() if ready else None
+            if slot is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        if bench_type in self.sizes:
+            self._schedule_replenish(bench_type)
+        if slot is None:
+            resource = await self.provider.create(bench_type)
+            slot = WarmSlot(bench_type, resource, warm=False, created_at=self._clock())
+        elapsed = self._clock() - t0
+        with self._lock:
+            self._acquire_count += 1
+            self._acquire_total += elapsed
+            self._acquire_samples.append(elapsed)
+        WARM_POOL_ACQUIRE_DURATION.labels(bench_type).observe(elapsed)
+        return slot
+
+    async def release(self, slot: WarmSlot, reusable: bool = True) -> None:
+        """Return a slot for reuse if the pool is short, else destroy it."""
+        bench_type = slot.bench_type
+        with self._lock:
+            ready = self._ready.get(bench_type)
+            if (
+                reusable
+                and not self._closed
+                and ready is not None
+                and len(ready) + self._inflight[bench_type] < self.sizes[bench_type]
+            ):
+                # the pool is short of this bench type
+                slot.warm = True
+                ready.append(slot)
+                return
+        await self.provider.destroy(slot.resource)
+
+    def stats(self) -> PoolStats:
+        with self._lock:
+            samples = sorted(self._acquire_samples)
+            return PoolStats(
+                hits=self._hits,
+                misses=self._misses,
+                ready={b: len(q) for b, q in self._ready.items()},
+                provisioning=dict(self._inflight),
+                acquire_count=self._acquire_count,
+                acquire_seconds_total=self._acquire_total,
+                acquire_p50=_percentile(samples, 0.50),
+                acquire_p99=_percentile(samples, 0.99),
+            )
+
+    def wait_ready(self, timeout: float = 10.0) -> bool:
+        """Block until every bench_type is at its target size (for tests/startup)."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            with self._lock:
+                if all(len(self._ready[b]) >= n for b, n in self.sizes.items()):
+                    return True
+            time.sleep(0.01)
+        return False
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop replenishing and destroy every idle slot."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle = [slot for q in self._ready.values() for slot in q]
+            for q in self._ready.values():
+                q.clear()
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(idle), self._loop)
+        try:
+            future.result(timeout)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout)
+
+    def _serve(self, started: Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.call_soon(started.set)
+        self._loop.run_forever()
+        self._loop.close()
+
+    def _schedule_replenish(self, bench_type: str) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._replenish, bench_type)
+        except RuntimeError:
+            pass  # closed concurrently
+
+    def _replenish(self, bench_type: str) -> None:
+        # runs on the pool loop
+        with self._lock:
+            if self._closed:
+                return
+            missing = (
+                self.sizes[bench_type]
+                - len(self._ready[bench_type])
+                - self._inflight[bench_type]
+            )
+            if missing <= 0:
+                return
+            self._inflight[bench_type] += missing
+        for _ in range(missing):
+            task = self._loop.create_task(self._fill(bench_type))
+            self._fills.add(task)
+            task.add_done_callback(self._fills.discard)
+
+    async def _fill(self, bench_type: str) -> None:
+        try:
+            resource = await self.provider.create(bench_type)
+        except Exception:
+            logger.exception("warm pool: provisioning %s failed", bench_type)
+            with self._lock:
+                self._inflight[bench_type] -= 1
+            self._loop.call_later(self.retry_seconds, self._replenish, bench_type)
+            return
+        slot = WarmSlot(bench_type, resource, warm=True, created_at=self._clock())
+        with self._lock:
+            self._inflight[bench_type] -= 1
+            if not self._closed:
+                self._ready[bench_type].append(slot)
+                return
+        await self.provider.destroy(resource)
+
+    async def _shutdown(self, slots: List[WarmSlot]) -> None:
+        fills = list(self._fills)
+        for task in fills:
+            task.cancel()
+        await asyncio.gather(*fills, return_exceptions=True)
+        for slot in slots:
+            try:
+                await self.provider.destroy(slot.resource)
+            except Exception:
+                logger.exception("warm pool: teardown of %s failed", slot.resource)
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
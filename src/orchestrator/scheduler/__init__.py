@@ -0,0 +1,5 @@
+"""Bench inventory and capacity scheduling."""
+
+from orchestrator.scheduler.capacity import BenchPool, CapacityScheduler, best_fit
+
+__all__ = ["BenchPool", "CapacityScheduler", "best_fit"]
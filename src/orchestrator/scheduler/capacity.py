@@ -0,0 +1,208 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import math
+
+from orchestrator.repository.base import ReservationConflictError
+from orchestrator.repository.interval_index import IntervalIndex
+
+# (bench_id, gap_start, gap_end) for a bench whose free gap encloses a window
+Gap = Tuple[Optional[str], float, float]
+
+
+class BenchPool:
+    """Concrete benches available per bench_type.
+
+    A bench_type without an inventory behaves as a single anonymous bench
+    (``bench_id`` None), which is the one-booking-at-a-time rule used before
+    pools existed.
+    """
+
+    def __init__(self, benches: Optional[Mapping[str, Sequence[str]]] = None) -> None:
+        self._benches: Dict[str, Tuple[str, ...]] = {
+            bench_type: tuple(ids) for bench_type, ids in (benches or {}).items() if ids
+        }
+
+    @classmethod
+    def of_size(cls, sizes: Mapping[str, int]) -> BenchPool:
+        """Pool with ``n`` benches named ``<bench_type>-01`` .. per bench_type."""
+        return cls(
+            {
+                bench_type: [f"{bench_type}-{i:02d}" for i in range(1, n + 1)]
+                for bench_type, n in sizes.items()
+            }
+        )
+
+    def benches(self, bench_type: str) -> Tuple[Optional[str], ...]:
+        return self._benches.get(bench_type) or (None,)
+
+    def inventory(self) -> Dict[str, List[str]]:
+        return {bench_type: list(ids) for bench_type, ids in self._benches.items()}
+
+
+def best_fit(start: float, gaps: Iterable[Gap]) -> Optional[str]:
+    """Pick the bench whose free gap wraps the window most tightly.
+
+    Ties (e.g. several open-ended gaps) go to the gap starting closest before
+    ``start``, then to pool order, so bookings pack onto as few benches as
+    possible and long gaps stay free for long runs.
+    """
+    best: Optional[Tuple[float, float, int]] = None
+    chosen: Optional[str] = None
+    for i, (bench_id, gap_start, gap_end) in enumerate(gaps):
+        key = (gap_end - gap_start, start - gap_start, i)
+        if best is None or key < best:
+            best, chosen = key, bench_id
+    return chosen
+
+
+class _Frontier:
+    """The benches of one type, ordered by when each is free for good.
+
+    A bench is free from the end of its latest booking onwards (-inf while it
+    has none), so one bisect finds the benches free from a time on and the
+    ones still booked past it. ``order`` holds ``(free_from, pool index)``.
+    """
+
+    __slots__ = ("benches", "index", "free_from", "order")
+
+    def __init__(self, benches: Tuple[Optional[str], ...]) -> None:
+        self.benches = benches
+        self.index = {bench_id: i for i, bench_id in enumerate(benches)}
+        self.free_from = [-math.inf] * len(benches)
+        self.order = [(-math.inf, i) for i in range(len(benches))]
+
+    def move(self, i: int, free_from: float) -> None:
+        del self.order[bisect_left(self.order, (self.free_from[i], i))]
+        insort(self.order, (free_from, i))
+        self.free_from[i] = free_from
+
+    def free_since(self, t: float) -> Optional[int]:
+        """The bench free from ``t`` on whose last booking ends closest before it.
+
+        Ties go to pool order; None if every bench is booked past ``t``.
+        """
+        k = bisect_right(self.order, (t, math.inf))
+        if not k:
+            return None
+        latest = self.order[k - 1][0]
+        return self.order[bisect_left(self.order, (latest, -1))][1]
+
+    def booked_past(self, t: float) -> List[int]:
+        """Pool indexes of the benches with a booking ending after ``t``."""
+        k = bisect_right(self.order, (t, math.inf))
+        return [i for _, i in self.order[k:]]
+
+
+class CapacityScheduler:
+    """Assigns booking windows to benches of a pool.
+
+    Every bench has its own calendar of booked ``[start, end)`` windows in an
+    :class:`IntervalIndex`; the free list of a bench is the gaps between
+    them. Each bench type also keeps its benches ordered by the end of their
+    latest booking, so a window after every booking on some bench is placed
+    with a bisect, and only benches booked past the window are checked for
+    a gap inside their calendar. Not thread-safe: callers serialize per
+    bench_type.
+    """
+
+    def __init__(self, pool: Optional[BenchPool] = None) -> None:
+        self.pool = pool or BenchPool()
+        self._calendars = IntervalIndex()
+        self._frontiers: Dict[str, _Frontier] = {}
+
+    def _frontier(self, bench_type: str) -> _Frontier:
+        frontier = self._frontiers.get(bench_type)
+        if frontier is None:
+            frontier = _Frontier(self.pool.benches(bench_type))
+            self._frontiers[bench_type] = frontier
+        return frontier
+
+    def assign(
+        self, bench_type: str, start: float, end: float, reservation_id: str
+    ) -> Optional[str]:
+        """Book the window on the best-fitting free bench and return its id.
+
+        Raises ReservationConflictError if every bench is busy.
+        """
+        frontier = self._frontier(bench_type)
+        benches = frontier.benches
+        # of the benches free from `start` for good, only the one whose last
+        # booking ends closest before it can fit best; any other free gap is
+        # closed by a booking at or after `end`
+        candidates = frontier.booked_past(end)
+        tail = frontier.free_since(start)
+        if tail is not None:
+            candidates.append(tail)
+        gaps: List[Gap] = []
+        for i in sorted(candidates):  # pool order, for best_fit's ties
+            gap = self._calendars.free_gap((bench_type, benches[i]), start, end)
+            if gap is not None:
+                gaps.append((benches[i], gap[0], gap[1]))
+        if not gaps:
+            clash = self._calendars.overlapping((bench_type, benches[0]), start, end)
+            raise ReservationConflictError(clash[0])
+        bench_id = best_fit(start, gaps)
+        i = frontier.index[bench_id]
+        self._calendars.add((bench_type, bench_id), start, end, reservation_id)
+        if end > frontier.free_from[i]:
+            frontier.move(i, end)
+        return bench_id
+
+    def release(
+        self,
+        bench_type: str,
+        bench_id: Optional[str],
+        start: float,
+        reservation_id: str,
+    ) -> bool:
+        key = (bench_type, bench_id)
+        if not self._calendars.remove(key, start, reservation_id):
+            return False
+        frontier = self._frontier(bench_type)
+        i = frontier.index[bench_id]
+        free_from = self._calendars.last_end(key)
+        if free_from != frontier.free_from[i]:
+            frontier.move(i, free_from)
+        return True
+
+    def overlapping(self, bench_type: str, start: float, end: float) -> List[str]:
+        """Ids of bookings on any bench of the type that overlap the window."""
+        frontier = self._frontier(bench_type)
+        found: List[str] = []
+        for i in sorted(frontier.booked_past(start)):
+            found.extend(
+                self._calendars.overlapping(
+                    (bench_type, frontier.benches[i]), start, end
+                )
+            )
+        return found
+
+    def next_slot(
+        self, bench_type: str, length: float, not_before: float
+    ) -> Tuple[float, Optional[str]]:
+        """Earliest ``(start, bench_id)`` with ``length`` free on some bench.
+
+        The bench free for good soonest gives an upper bound. Starting before
+        it needs a gap inside a calendar, so only benches booked past
+        ``not_before + length`` are searched, each cut off once it cannot
+        beat the best start found so far. When some bench is already free at
+        ``not_before``, the one whose last booking ends closest before it is
+        picked, as :meth:`assign` would for that window.
+        """
+        frontier = self._frontier(bench_type)
+        i = frontier.free_since(not_before)
+        if i is not None:
+            return not_before, frontier.benches[i]
+        best_start, i = frontier.order[0]
+        best_bench = frontier.benches[i]
+        for i in frontier.booked_past(not_before + length):
+            bench_id = frontier.benches[i]
+            found = self._calendars.first_fit(
+                (bench_type, bench_id), not_before, length, give_up_at=best_start
+            )
+            if found is not None and found < best_start:
+                best_start, best_bench = found, bench_id
+                if found == not_before:
+                    break  # cannot do better than the requested time
+        return best_start, best_bench
@@ -0,0 +1,169 @@
+from __future__ import annotations
+from threading import Lock
+from typing import Dict, List, Optional, Set
+import asyncio
+
+from orchestrator.models.execution import Execution
+
+# executions a subscriber may have pending before it is cut off
+DEFAULT_BUFFER = 1000
+
+
+class Subscription:
+    """One watcher's view of the bus, consumed from its own event loop.
+
+    Updates are buffered per execution, newest state wins: a slow consumer
+    sees fewer intermediate states rather than an ever-growing backlog. If
+    more than ``maxsize`` distinct executions are pending, the subscription
+    is overflowed and closed; the consumer should re-read current state and
+    subscribe again.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        execution_id: Optional[str],
+        reservation_id: Optional[str],
+        maxsize: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        self.execution_id = execution_id
+        self.reservation_id = reservation_id
+        self.maxsize = maxsize
+        self.overflowed = False
+        self.closed = False
+        self._bus = bus
+        self._loop = loop
+        self._lock = Lock()
+        self._pending: Dict[str, Execution] = {}
+        self._wakeup = asyncio.Event()
+        self._notified = False
+
+    async def get(self, timeout: Optional[float] = None) -> List[Execution]:
+        """Wait for updates; returns [] on timeout or once closed."""
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                if self._pending or self.closed:
+                    batch = list(self._pending.values())
+                    self._pending.clear()
+                    self._notified = False
+                    return batch
+                # a wakeup scheduled before this point is only spurious
+                self._wakeup.clear()
+                self._notified = False
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return []
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), remaining)
+            except asyncio.TimeoutError:
+                return []
+
+    def close(self) -> None:
+        self._bus._remove(self)
+        with self._lock:
+            self.closed = True
+        self._notify()
+
+    def _offer(self, execution: Execution) -> bool:
+        # called from any thread; False once the subscriber is cut off
+        with self._lock:
+            if self.closed:
+                return False
+            current = self._pending.get(execution.id)
+            if current is None or current.version <= execution.version:
+                self._pending[execution.id] = execution
+            if len(self._pending) > self.maxsize:
+                self._pending.clear()
+                self.overflowed = self.closed = True
+            wake = not self._notified
+            self._notified = True
+        if wake:
+            self._notify()
+        return not self.closed
+
+    def _notify(self) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+        except RuntimeError:
+            pass  # consumer loop already gone
+
+
+class EventBus:
+    """In-process fan-out of execution changes to streaming watchers.
+
+    Subscribers are indexed by execution id and reservation id, so a publish
+    only touches the watchers it matches. Publishing never blocks on a
+    subscriber: buffers are bounded and a lagging one is cut off instead.
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER) -> None:
+        self.buffer_size = buffer_size
+        self._lock = Lock()
+        self._by_execution: Dict[str, Set[Subscription]] = {}
+        self._by_reservation: Dict[str, Set[Subscription]] = {}
+        self._everything: Set[Subscription] = set()
+
+    def subscribe(
+        self,
+        execution_id: Optional[str] = None,
+        reservation_id: Optional[str] = None,
+        maxsize: Optional[int] = None,
+    ) -> Subscription:
+        """Watch one execution, one reservation's executions, or everything.
+
+        Must be called from the event loop that will consume it.
+        """
+        sub = Subscription(
+            self,
+            execution_id,
+            reservation_id,
+            maxsize or self.buffer_size,
+            asyncio.get_running_loop(),
+        )
+        with self._lock:
+            if execution_id is not None:
+                self._by_execution.setdefault(execution_id, set()).add(sub)
+            elif reservation_id is not None:
+                self._by_reservation.setdefault(reservation_id, set()).add(sub)
+            else:
+                self._everything.add(sub)
+        return sub
+
+    def publish(self, execution: Execution) -> None:
+        with self._lock:
+            targets = [
+                *self._by_execution.get(execution.id, ()),
+                *self._by_reservation.get(execution.reservation_id, ()),
+                *self._everything,
+            ]
+        for sub in targets:
+            if not sub._offer(execution):
+                self._remove(sub)
+
+    def subscribers(self) -> int:
+        with self._lock:
+            return (
+                sum(len(s) for s in self._by_execution.values())
+                + sum(len(s) for s in self._by_reservation.values())
+                + len(self._everything)
+            )
+
+    def _remove(self, sub: Subscription) -> None:
+        with self._lock:
+            if sub.execution_id is not None:
+                _discard(self._by_execution, sub.execution_id, sub)
+            elif sub.reservation_id is not None:
+                _discard(self._by_reservation, sub.reservation_id, sub)
+            else:
+                self._everything.discard(sub)
+
+
+def _discard(index: Dict[str, Set[Subscription]], key: str, sub: Subscription) -> None:
+    subs = index.get(key)
+    if subs is not None:
+        subs.discard(sub)
+        if not subs:
+            del index[key]
@@ -0,0 +1,230 @@
+from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Event, Lock
+from typing import Callable, Dict, Mapping, Optional
+import logging
+
+from orchestrator.observability.log import correlation_id, execution_id
+from orchestrator.models.execution import Execution, ExecutionStatus
+from orchestrator.repository.execution_base import (
+    ExecutionRepository,
+    VersionConflictError,
+)
+from orchestrator.runners.base import RunnerError
+from orchestrator.services.fair_queue import DEFAULT_TENANT, FairQueue
+
+logger = logging.getLogger(__name__)
+
+# A runner executes one test run and returns the artifacts URI. It must poll
+# `cancel` and return early (or raise) once it is set.
+Runner = Callable[[Execution, Event], Optional[str]]
+
+
+def simulated_runner(duration: float = 0.0) -> Runner:
+    """Runner used until real bench adapters exist: waits, then fakes artifacts."""
+
+    def run(execution: Execution, cancel: Event) -> Optional[str]:
+        if cancel.wait(duration):
+            return None
+        return f"s3://fake-bucket/executions/{execution.id}/artifacts.tar.gz"
+
+    return run
+
+
+class _Job:
+    __slots__ = ("execution_id", "bench_type", "cancel", "running", "correlation_id")
+
+    def __init__(self, execution_id: str, bench_type: str) -> None:
+        self.execution_id = execution_id
+        self.bench_type = bench_type
+        self.cancel = Event()
+        self.running = False
+        # the request that queued the run, so its logs can be traced back
+        self.correlation_id = correlation_id.get()
+
+
+class ExecutionEngine:
+    """Drives executions PENDING -> RUNNING -> COMPLETED/FAILED off the request path.
+
+    Jobs wait in a per-bench_type queue and are handed to the worker pool only
+    while that bench type is under its concurrency limit, so a saturated bench
+    class never ties up pool threads needed by others. Each queue is a
+    :class:`FairQueue`: tenants share a bench type by weight, and priority
+    (with aging) orders each tenant's own jobs.
+    """
+
+    def __init__(
+        self,
+        repo: ExecutionRepository,
+        runner: Optional[Runner] = None,
+        max_workers: int = 4,
+        bench_limits: Optional[Dict[str, int]] = None,
+        default_bench_limit: Optional[int] = None,
+        tenant_weights: Optional[Mapping[str, float]] = None,
+        aging_seconds: float = 60.0,
+    ) -> None:
+        self.repo = repo
+        self.runner = runner or simulated_runner()
+        self.bench_limits = dict(bench_limits or {})
+        self.default_bench_limit = default_bench_limit or max_workers
+        self.tenant_weights = dict(tenant_weights or {})
+        self.aging_seconds = aging_seconds
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="execution"
+        )
+        self._lock = Lock()
+        self._jobs: Dict[str, _Job] = {}
+        self._waiting: Dict[str, FairQueue[_Job]] = {}
+        self._running: Dict[str, int] = {}
+        self._closing = False
+
+    def limit_for(self, bench_type: str) -> int:
+        return self.bench_limits.get(bench_type, self.default_bench_limit)
+
+    def queued(self) -> Dict[str, int]:
+        """Executions waiting for a worker, per bench_type."""
+        with self._lock:
+            return {b: len(q) for b, q in self._waiting.items()}
+
+    def running(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._running)
+
+    def is_active(self, execution_id: str) -> bool:
+        with self._lock:
+            return execution_id in self._jobs
+
+    def submit(
+        self,
+        execution_id: str,
+        bench_type: str,
+        tenant: str = DEFAULT_TENANT,
+        priority: int = 0,
+    ) -> bool:
+        """Queue an execution; returns False if it is already queued or running."""
+        with self._lock:
+            if execution_id in self._jobs:
+                return False
+            job = _Job(execution_id, bench_type)
+            self._jobs[execution_id] = job
+            queue = self._waiting.get(bench_type)
+            if queue is None:
+                queue = self._waiting[bench_type] = FairQueue(
+                    self.tenant_weights, self.aging_seconds
+                )
+            queue.push(execution_id, job, tenant, priority)
+            self._dispatch(bench_type)
+            return True
+
+    def cancel(self, execution_id: str) -> bool:
+        """Cancel a queued or running execution; returns False if unknown."""
+        with self._lock:
+            job = self._jobs.get(execution_id)
+            if job is None:
+                return False
+            job.cancel.set()
+            if not job.running:
+                self._waiting[job.bench_type].discard(execution_id)
+                del self._jobs[execution_id]
+        return True
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop all work. Queued and interrupted runs are left FAILED, not
+        PENDING or RUNNING, so nothing waits on a run that will never end and
+        clients can start them again."""
+        with self._lock:
+            self._closing = True
+            for job in self._jobs.values():
+                job.cancel.set()
+            queued = [job for job in self._jobs.values() if not job.running]
+            for job in queued:
+                del self._jobs[job.execution_id]
+            self._waiting.clear()
+        for job in queued:
+            self._interrupt(job, ExecutionStatus.PENDING)
+        self._pool.shutdown(wait=wait)
+
+    def _dispatch(self, bench_type: str) -> None:
+        # caller holds self._lock
+        queue = self._waiting.get(bench_type)
+        limit = self.limit_for(bench_type)
+        while queue and self._running.get(bench_type, 0) < limit:
+            job = queue.pop()
+            job.running = True
+            self._running[bench_type] = self._running.get(bench_type, 0) + 1
+            self._pool.submit(self._run, job)
+
+    def _run(self, job: _Job) -> None:
+        # pool threads are reused, so the ids are reset after every job
+        cid_token = correlation_id.set(job.correlation_id)
+        eid_token = execution_id.set(job.execution_id)
+        try:
+            self._execute(job)
+        except Exception:
+            logger.exception("execution %s crashed", job.execution_id)
+        finally:
+            execution_id.reset(eid_token)
+            correlation_id.reset(cid_token)
+            with self._lock:
+                self._jobs.pop(job.execution_id, None)
+                self._running[job.bench_type] -= 1
+                self._dispatch(job.bench_type)
+
+    def _execute(self, job: _Job) -> None:
+        if job.cancel.is_set():
+            if self._closing:
+                self._interrupt(job, ExecutionStatus.PENDING)
+            return
+        try:
+            ex = self.repo.update(
+                job.execution_id,
+                expected_status=ExecutionStatus.PENDING,
+                status=ExecutionStatus.RUNNING,
+                started_at=datetime.utcnow(),
+                finished_at=None,
+            )
+        except VersionConflictError:
+            return  # cancelled or picked up elsewhere before we got to it
+        if ex is None:
+            return
+        try:
+            artifacts = self.runner(ex, job.cancel)
+        except RunnerError as exc:
+            logger.warning("execution %s failed: %s", job.execution_id, exc)
+            self._finish(job, ExecutionStatus.FAILED, artifacts_uri=exc.artifacts_uri)
+            return
+        except Exception:
+            logger.exception("execution %s failed", job.execution_id)
+            self._finish(job, ExecutionStatus.FAILED)
+            return
+        if job.cancel.is_set():
+            if self._closing:
+                self._interrupt(job, ExecutionStatus.RUNNING)
+            return
+        self._finish(job, ExecutionStatus.COMPLETED, artifacts_uri=artifacts)
+
+    def _finish(self, job: _Job, status: ExecutionStatus, **fields) -> None:
+        try:
+            self.repo.update(
+                job.execution_id,
+                expected_status=ExecutionStatus.RUNNING,
+                status=status,
+                finished_at=datetime.utcnow(),
+                **fields,
+            )
+        except VersionConflictError:
+            pass  # stopped concurrently; keep the CANCELLED state
+
+    def _interrupt(self, job: _Job, expected: ExecutionStatus) -> None:
+        # a run cut short by shutdown; a stop that got there first wins
+        logger.warning("execution %s interrupted by shutdown", job.execution_id)
+        try:
+            self.repo.update(
+                job.execution_id,
+                expected_status=expected,
+                status=ExecutionStatus.FAILED,
+                finished_at=datetime.utcnow(),
+            )
+        except VersionConflictError:
+            pass
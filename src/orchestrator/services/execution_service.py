@@ -1,54 +1,102 @@
 from __future__ import annotations
-from datetime import datetime, timedelta
-from typing import Optional
-from orchestrator.repository.execution_base import ExecutionRepository
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from orchestrator.repository.base import ReservationRepository
+from orchestrator.repository.execution_base import (
+    ExecutionRepository,
+    VersionConflictError,
+)
 from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
-from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+from orchestrator.models.reservation import DEFAULT_BENCH_TYPE
+from orchestrator.services.execution_engine import ExecutionEngine
+from orchestrator.services.fair_queue import DEFAULT_TENANT
 
 
 # simple service with injected repo (default to in-memory)
 class ExecutionService:
-    def __init__(self, repo: Optional[ExecutionRepository] = None):
+    def __init__(
+        self,
+        repo: Optional[ExecutionRepository] = None,
+        engine: Optional[ExecutionEngine] = None,
+        reservations: Optional[ReservationRepository] = None,
+    ):
         self.repo = repo or InMemoryExecutionRepo()
+        self.engine = engine or ExecutionEngine(self.repo)
+        self.reservations = reservations
 
     def create(self, payload: ExecutionCreate):
         return self.repo.create(payload)
 
+    def create_many(self, payloads: Sequence[ExecutionCreate]) -> List[Execution]:
+        return self.repo.create_many(payloads)
+
     def start(self, execution_id: str):
+        """Queue the execution on the engine and return without waiting for it."""
         ex = self.repo.get(execution_id)
         if not ex:
             return None
         if ex.status not in (ExecutionStatus.PENDING, ExecutionStatus.FAILED):
             return ex
-        started = datetime.utcnow()
-        # simulate quick run for now: set RUNNING then COMPLETED
-        self.repo.update(
-            execution_id, status=ExecutionStatus.RUNNING, started_at=started
-        )
-        # for demo: mark completed with artifacts_uri after small simulated duration
-        finished = started + timedelta(seconds=1)
-        artifacts = f"s3://fake-bucket/executions/{execution_id}/artifacts.tar.gz"
-        self.repo.update(
-            execution_id,
-            status=ExecutionStatus.COMPLETED,
-            finished_at=finished,
-            artifacts_uri=artifacts,
-        )
-        return self.repo.get(execution_id)
+        if ex.status == ExecutionStatus.FAILED:
+            try:
+                ex = self.repo.update(
+                    execution_id,
+                    expected_version=ex.version,
+                    status=ExecutionStatus.PENDING,
+                    finished_at=None,
+                )
+            except VersionConflictError:
+                return self.repo.get(execution_id)
+            if ex is None:
+                # deleted between the read and the update
+                return None
+        bench_type, tenant = self._placement(ex)
+        self.engine.submit(execution_id, bench_type, tenant, ex.priority)
+        return ex
+
+    def start_many(self, execution_ids: Sequence[str]) -> List[Optional[Execution]]:
+        return [self.start(eid) for eid in execution_ids]
 
     def stop(self, execution_id: str):
         ex = self.repo.get(execution_id)
         if not ex:
             return None
-        if ex.status == ExecutionStatus.RUNNING:
+        cancelled = self.engine.cancel(execution_id)
+        if cancelled or ex.status == ExecutionStatus.RUNNING:
             now = datetime.utcnow()
-            return self.repo.update(
-                execution_id, status=ExecutionStatus.CANCELLED, finished_at=now
-            )
+            try:
+                return self.repo.update(
+                    execution_id,
+                    expected_status=(ExecutionStatus.PENDING, ExecutionStatus.RUNNING),
+                    status=ExecutionStatus.CANCELLED,
+                    finished_at=now,
+                )
+            except VersionConflictError:
+                # finished before the cancel landed; report the final state
+                return self.repo.get(execution_id)
         return ex
 
-    def list(self, limit: int = 100):
-        return list(self.repo.list(limit=limit))
+    def list(
+        self,
+        limit: int = 100,
+        after: Optional[str] = None,
+        status: Optional[ExecutionStatus] = None,
+        reservation_id: Optional[str] = None,
+    ):
+        return list(
+            self.repo.list(
+                limit=limit, after=after, status=status, reservation_id=reservation_id
+            )
+        )
 
     def get(self, execution_id: str):
         return self.repo.get(execution_id)
+
+    def _placement(self, ex: Execution) -> Tuple[str, str]:
+        # (bench_type, tenant) from the reservation the run belongs to
+        if self.reservations is not None:
+            res = self.reservations.get(ex.reservation_id)
+            if res is not None:
+                return res.bench_type, res.user_id
+        return DEFAULT_BENCH_TYPE, DEFAULT_TENANT
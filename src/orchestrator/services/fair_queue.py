@@ -0,0 +1,134 @@
+from __future__ import annotations
+from heapq import heappop, heappush
+from itertools import count
+from typing import Callable, Dict, Generic, List, Mapping, Optional, Tuple, TypeVar
+import time
+
+T = TypeVar("T")
+
+DEFAULT_TENANT = "default"
+
+
+class _Entry(Generic[T]):
+    __slots__ = ("key", "item", "tenant", "live")
+
+    def __init__(self, key: str, item: T, tenant: str) -> None:
+        self.key = key
+        self.item = item
+        self.tenant = tenant
+        self.live = True
+
+
+class _Tenant:
+    __slots__ = ("weight", "vtime", "heap", "live", "ready_seq")
+
+    def __init__(self, weight: float) -> None:
+        self.weight = weight
+        self.vtime = 0.0
+        self.heap: List[Tuple[float, int, _Entry]] = []
+        self.live = 0
+        # sequence of the tenant's only valid slot in the ready heap
+        self.ready_seq = -1
+
+
+class FairQueue(Generic[T]):
+    """Weighted fair queue across tenants with priority aging within a tenant.
+
+    Tenants are served in start-time fair queueing order: each dispatch
+    advances the tenant's virtual time by ``1 / weight`` and the backlogged
+    tenant with the lowest virtual time goes next, so a tenant with weight 2
+    gets twice the turns of a tenant with weight 1 and an idle tenant cannot
+    bank credit. Within a tenant, higher ``priority`` goes first, but every
+    ``aging_seconds`` of waiting is worth one priority level, so low-priority
+    work is never starved. Aging applies to all entries at the same rate, so
+    the rank ``enqueued_at / aging_seconds - priority`` is fixed at push time
+    and both levels are plain heaps: push and pop are O(log n). Removal is
+    lazy.
+    """
+
+    def __init__(
+        self,
+        weights: Optional[Mapping[str, float]] = None,
+        aging_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.weights = dict(weights or {})
+        self.aging_seconds = aging_seconds
+        self._clock = clock
+        self._seq = count()
+        self._vtime = 0.0  # virtual time of the last dispatch
+        self._tenants: Dict[str, _Tenant] = {}
+        self._ready: List[Tuple[float, int, str]] = []
+        self._entries: Dict[str, _Entry[T]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def push(
+        self, key: str, item: T, tenant: str = DEFAULT_TENANT, priority: int = 0
+    ) -> None:
+        if key in self._entries:
+            raise ValueError(f"{key} is already queued")
+        rank = self._clock() / self.aging_seconds - priority
+        entry = _Entry(key, item, tenant)
+        self._entries[key] = entry
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _Tenant(self.weights.get(tenant, 1.0))
+        heappush(state.heap, (rank, next(self._seq), entry))
+        state.live += 1
+        if state.live == 1:
+            # newly backlogged: no credit for the time spent idle
+            state.vtime = max(state.vtime, self._vtime)
+            self._schedule(tenant, state)
+
+    def pop(self) -> T:
+        """Remove and return the next item; raises IndexError when empty."""
+        while self._ready:
+            vtime, seq, tenant = heappop(self._ready)
+            state = self._tenants[tenant]
+            if seq != state.ready_seq:
+                continue  # rescheduled since
+            entry = self._pop_live(state)
+            if entry is None:
+                continue  # everything left was discarded
+            del self._entries[entry.key]
+            state.live -= 1
+            self._vtime = vtime
+            state.vtime = vtime + 1.0 / state.weight
+            if state.live:
+                self._schedule(tenant, state)
+            return entry.item
+        raise IndexError("pop from an empty FairQueue")
+
+    def discard(self, key: str) -> Optional[T]:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return None
+        entry.live = False
+        state = self._tenants[entry.tenant]
+        state.live -= 1
+        return entry.item
+
+    def clear(self) -> None:
+        self._tenants.clear()
+        self._ready.clear()
+        self._entries.clear()
+
+    def _schedule(self, tenant: str, state: _Tenant) -> None:
+        state.ready_seq = next(self._seq)
+        heappush(self._ready, (state.vtime, state.ready_seq, tenant))
+
+    @staticmethod
+    def _pop_live(state: _Tenant) -> Optional[_Entry]:
+        while state.heap:
+            entry = heappop(state.heap)[2]
+            if entry.live:
+                return entry
+        return None
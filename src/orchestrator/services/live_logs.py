@@ -0,0 +1,238 @@
+from __future__ import annotations
+from collections import OrderedDict, deque
+from pathlib import Path
+from threading import Lock
+from typing import Deque, Dict, List, Optional, Tuple, Union
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 1 << 20
+# writes are packed into blocks this big, so a read walks a handful of
+# blocks rather than one entry per output line
+BLOCK_SIZE = 64 << 10
+
+
+class LogSink:
+    """Output of one execution: a bounded in-memory tail plus a spill file.
+
+    Bytes are addressed by their offset from the start of the log. Memory
+    keeps roughly the last ``capacity`` bytes; older blocks are appended to
+    ``spill_path`` as they are evicted, so every offset stays readable. With
+    no spill path, evicted bytes are gone and reads skip ahead to the oldest
+    byte still held. Writers may be on any thread; readers await ``wait``
+    on their own event loop.
+    """
+
+    def __init__(self, capacity: int, spill_path: Optional[Path] = None) -> None:
+        self.capacity = capacity
+        self.spill_path = spill_path
+        self.closed = False
+        self._lock = Lock()
+        self._blocks: Deque[bytearray] = deque()
+        self._start = 0  # offset of the first byte still in memory
+        self._end = 0
+        self._spill_fd: Optional[int] = None
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def size(self) -> int:
+        return self._end
+
+    def write(self, data: bytes) -> None:
+        if not data:
+            return
+        with self._lock:
+            if self.closed:
+                return
+            last = self._blocks[-1] if self._blocks else None
+            if last is not None and len(last) + len(data) <= BLOCK_SIZE:
+                last += data
+            else:
+                self._blocks.append(bytearray(data))
+            self._end += len(data)
+            while self._end - self._start > self.capacity:
+                self._evict()
+            waiters, self._waiters = self._waiters, []
+        _wake(waiters)
+
+    def resolve(self, offset: int) -> int:
+        """Where a read from ``offset`` actually starts."""
+        with self._lock:
+            return self._resolve(offset)
+
+    def read(self, offset: int, limit: int) -> Tuple[int, bytes]:
+        """Up to ``limit`` bytes from ``offset``, as (start offset, data).
+
+        Only the offsets are taken under the lock; the copy, and the file
+        read for spilled bytes, happen outside it. Call it off the event loop.
+        """
+        with self._lock:
+            offset = self._resolve(offset)
+            start, end = self._start, self._end
+            # _resolve only leaves offset before start when it was spilled
+            spill = self.spill_path if offset < start else None
+            blocks = list(self._blocks) if spill is None else []
+        if spill is None:
+            return offset, _copy(blocks, start, offset, min(limit, end - offset))
+        try:
+            # a file of its own, so discard() may close the writer's fd
+            # meanwhile; the file is append-only, so pread needs no seek
+            with open(spill, "rb") as f:
+                return offset, os.pread(f.fileno(), min(limit, start - offset), offset)
+        except FileNotFoundError:
+            return offset, b""  # discarded meanwhile
+
+    async def wait(self, offset: int, timeout: Optional[float] = None) -> bool:
+        """Wait until the log grows past ``offset`` or is closed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._end > offset or self.closed:
+                return True
+            waiter: asyncio.Future = loop.create_future()
+            self._waiters.append((loop, waiter))
+        try:
+            await asyncio.wait_for(waiter, timeout)
+            return True
+        except asyncio.TimeoutError:
+            with self._lock:
+                if (loop, waiter) in self._waiters:
+                    self._waiters.remove((loop, waiter))
+                return self._end > offset or self.closed
+
+    def close(self) -> None:
+        """Mark the log complete; it stays readable until discarded."""
+        with self._lock:
+            self.closed = True
+            waiters, self._waiters = self._waiters, []
+        _wake(waiters)
+
+    def discard(self) -> None:
+        self.close()
+        with self._lock:
+            self._blocks.clear()
+            self._start = self._end
+            if self._spill_fd is not None:
+                os.close(self._spill_fd)
+                self._spill_fd = None
+                if self.spill_path is not None:
+                    self.spill_path.unlink(missing_ok=True)
+
+    def _resolve(self, offset: int) -> int:
+        offset = min(max(offset, 0), self._end)
+        if offset < self._start and self._spill_fd is None:
+            return self._start
+        return offset
+
+    def _evict(self) -> None:
+        # caller holds self._lock
+        block = self._blocks.popleft()
+        if self.spill_path is not None:
+            try:
+                if self._spill_fd is None:
+                    self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                    self._spill_fd = os.open(
+                        self.spill_path, os.O_CREAT | os.O_TRUNC | os.O_RDWR, 0o600
+                    )
+                os.write(self._spill_fd, block)
+            except OSError:
+                # keep the run going; the log just becomes memory-only
+                logger.exception("live log: cannot spill to %s", self.spill_path)
+                if self._spill_fd is not None:
+                    os.close(self._spill_fd)
+                    self._spill_fd = None
+                self.spill_path = None
+        self._start += len(block)
+
+
+def _copy(blocks: List[bytearray], pos: int, offset: int, limit: int) -> bytes:
+    # ``blocks`` starts at offset ``pos``; what was written after they were
+    # listed lies past ``limit``
+    parts = []
+    for block in blocks:
+        if limit <= 0:
+            break
+        if pos + len(block) > offset:
+            lo = max(0, offset - pos)
+            part = bytes(block[lo : lo + limit])
+            parts.append(part)
+            limit -= len(part)
+        pos += len(block)
+    return b"".join(parts)
+
+
+def _wake(waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]) -> None:
+    for loop, waiter in waiters:
+        try:
+            loop.call_soon_threadsafe(_resolve_waiter, waiter)
+        except RuntimeError:
+            pass  # reader's loop already closed
+
+
+def _resolve_waiter(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class LiveLogs:
+    """Registry of live log sinks, one per execution.
+
+    A runner opens the sink when it starts and finishes it on teardown;
+    opening a finished one starts the log afresh. Finished logs stay
+    tailable until ``keep_finished`` newer runs have finished; the oldest
+    are then dropped along with their spill files.
+    """
+
+    def __init__(
+        self,
+        capacity_bytes: int = DEFAULT_CAPACITY,
+        spill_dir: Optional[Union[str, Path]] = None,
+        keep_finished: int = 100,
+    ) -> None:
+        self.capacity_bytes = capacity_bytes
+        self.spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self.keep_finished = keep_finished
+        self._lock = Lock()
+        self._sinks: Dict[str, LogSink] = {}
+        self._finished: OrderedDict[str, None] = OrderedDict()
+
+    def open(self, execution_id: str) -> LogSink:
+        """The execution's sink, created on first use.
+
+        A finished sink is replaced by a fresh one: the execution is being
+        run again (e.g. retried after failing), and its old output goes.
+        """
+        with self._lock:
+            sink = self._sinks.get(execution_id)
+            if sink is not None and sink.closed:
+                self._finished.pop(execution_id, None)
+                # before the new sink can spill to the same path
+                sink.discard()
+                sink = None
+            if sink is None:
+                spill = None
+                if self.spill_dir is not None:
+                    spill = self.spill_dir / f"{execution_id}.log"
+                sink = self._sinks[execution_id] = LogSink(self.capacity_bytes, spill)
+            return sink
+
+    def get(self, execution_id: str) -> Optional[LogSink]:
+        with self._lock:
+            return self._sinks.get(execution_id)
+
+    def finish(self, execution_id: str) -> None:
+        dropped = []
+        with self._lock:
+            sink = self._sinks.get(execution_id)
+            if sink is None:
+                return
+            self._finished[execution_id] = None
+            self._finished.move_to_end(execution_id)
+            while len(self._finished) > self.keep_finished:
+                old, _ = self._finished.popitem(last=False)
+                dropped.append(self._sinks.pop(old))
+        sink.close()
+        for old_sink in dropped:
+            old_sink.discard()
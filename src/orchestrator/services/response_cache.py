@@ -0,0 +1,80 @@
+from __future__ import annotations
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, NamedTuple, Optional
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_SECONDS = 5.0
+
+
+class CachedResponse(NamedTuple):
+    etag: str
+    body: bytes
+    expires: float
+
+
+class ResponseCache:
+    """LRU of serialized GET responses, each kept at most ``ttl`` seconds.
+
+    Writers ``invalidate`` a record's key once the change is stored. A
+    reader that loaded the record before that must not cache what it
+    loaded, so it takes a ``token()`` first and ``put`` refuses if the key
+    was invalidated since. Recent invalidations are remembered in a second
+    LRU of the same size; past that, ``put`` refuses any read older than
+    the oldest invalidation forgotten. The TTL bounds how stale an entry can get when
+    the record is changed where no invalidation reaches this process, e.g.
+    by another worker sharing the SQLite store.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl: float = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = Lock()
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+        self._invalidated: "OrderedDict[Hashable, int]" = OrderedDict()
+        self._generation = 0
+        self._forgotten = 0
+
+    def token(self) -> int:
+        """Take before loading the record a ``put`` will cache."""
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, etag: str, body: bytes, token: int) -> None:
+        with self._lock:
+            if token < self._forgotten or self._invalidated.get(key, -1) > token:
+                return
+            self._entries[key] = CachedResponse(etag, body, self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._generation += 1
+            self._invalidated[key] = self._generation
+            self._invalidated.move_to_end(key)
+            if len(self._invalidated) > self.max_entries:
+                _, self._forgotten = self._invalidated.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -103,9 +103,17 @@ def test_execution_end_to_end():
 
         # start execution
         r = requests.post(f"{BASE_URL}/executions/{eid}/start", timeout=10)
-        assert r.status_code == 200, r.text
-        body = r.json()
-        assert "status" in body
+        assert r.status_code == 202, r.text
+        assert "status" in r.json()
+
+        # execution runs in the background; poll until it finishes
+        deadline = time.time() + 10
+        while True:
+            body = requests.get(f"{BASE_URL}/executions/{eid}", timeout=5).json()
+            if body["status"] in ("COMPLETED", "FAILED", "CANCELLED"):
+                break
+            assert time.time() < deadline, body
+            time.sleep(0.1)
         assert body.get("artifacts_uri") is not None
 
         # get execution
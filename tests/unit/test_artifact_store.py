@@ -0,0 +1,190 @@
+"""Artifact store (ADR-009) and artifact upload/download API tests."""
+
+import asyncio
+import hashlib
+import os
+import shlex
+import sys
+from datetime import datetime, timedelta, timezone
+from itertools import count
+from threading import Event
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.artifacts import (
+    ArtifactConflictError,
+    InvalidArtifactNameError,
+    LocalArtifactStore,
+)
+from orchestrator.deps import get_artifact_store
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.runners import LocalProcessRunner, run_lifecycle
+
+client = TestClient(app)
+_hours = count()
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def _put(store, eid, name, *parts):
+    return asyncio.run(store.put(eid, name, _chunks(*parts)))
+
+
+def test_put_streams_and_indexes(tmp_path):
+    store = LocalArtifactStore(tmp_path)
+    big = os.urandom(3 << 20)
+    art = _put(store, "ex1", "logs/stdout.log", big[: 1 << 19], big[1 << 19 :])
+
+    assert art.size == len(big)
+    assert art.sha256 == hashlib.sha256(big).hexdigest()
+    path = store.path("ex1", "logs/stdout.log")
+    assert path == tmp_path / "executions" / "ex1" / "logs" / "stdout.log"
+    assert path.read_bytes() == big
+    assert store.get("ex1", "logs/stdout.log") == art
+    assert store.get("ex1", "missing") is None
+    assert store.list("ex2") == []
+    assert not list((tmp_path / "tmp").iterdir())
+
+
+def test_identical_content_is_stored_once(tmp_path):
+    store = LocalArtifactStore(tmp_path)
+    a = _put(store, "ex1", "artifacts/results.json", b'{"ok": true}')
+    b = _put(store, "ex2", "artifacts/results.json", b'{"ok": true}')
+
+    assert a.sha256 == b.sha256
+    blobs = [p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]
+    assert len(blobs) == 1
+    assert os.path.samefile(
+        store.path("ex1", "artifacts/results.json"),
+        store.path("ex2", "artifacts/results.json"),
+    )
+
+
+def test_artifacts_are_immutable(tmp_path):
+    store = LocalArtifactStore(tmp_path)
+    first = _put(store, "ex1", "logs/runner.log", b"one")
+    # same bytes again: idempotent
+    assert _put(store, "ex1", "logs/runner.log", b"o", b"ne") == first
+    with pytest.raises(ArtifactConflictError):
+        _put(store, "ex1", "logs/runner.log", b"two")
+    # a file cannot become a directory or vice versa
+    with pytest.raises(ArtifactConflictError):
+        _put(store, "ex1", "logs/runner.log/inner", b"x")
+    with pytest.raises(ArtifactConflictError):
+        _put(store, "ex1", "logs", b"x")
+    assert [a.name for a in store.list("ex1")] == ["logs/runner.log"]
+    assert store.path("ex1", "logs/runner.log").read_bytes() == b"one"
+    # refused uploads leave no blob behind
+    assert len([p for p in (tmp_path / "blobs").rglob("*") if p.is_file()]) == 1
+    assert not any((tmp_path / "tmp").iterdir())
+
+
+@pytest.mark.parametrize(
+    "eid,name",
+    [
+        ("ex1", "../ex2/logs/a.log"),
+        ("ex1", "/etc/passwd"),
+        ("ex1", "logs//a.log"),
+        ("ex1", ""),
+        ("ex1", "logs\\a.log"),
+        ("..", "a.log"),
+        ("a/b", "a.log"),
+    ],
+)
+def test_rejects_unsafe_names(tmp_path, eid, name):
+    store = LocalArtifactStore(tmp_path)
+    with pytest.raises(InvalidArtifactNameError):
+        _put(store, eid, name, b"x")
+
+
+def test_local_runner_publishes_logs(tmp_path):
+    store = LocalArtifactStore(tmp_path / "store")
+    runner = LocalProcessRunner(tmp_path / "work", shards=2, store=store)
+    ex = InMemoryExecutionRepo().create(
+        ExecutionCreate(
+            reservation_id="r",
+            test_suite=f"{shlex.quote(sys.executable)} -c \"print('hi')\"",
+        )
+    )
+    result, bundle = asyncio.run(run_lifecycle(runner, ex, Event()))
+
+    assert result.passed
+    assert bundle.uri == store.uri(ex.id)
+    names = [a.name for a in store.list(ex.id)]
+    assert names == ["logs/shard-0.log", "logs/shard-1.log"]
+    # both shards logged the same bytes: one blob
+    blobs = [p for p in (tmp_path / "store" / "blobs").rglob("*") if p.is_file()]
+    assert len(blobs) == 1
+
+
+@pytest.fixture
+def api_store(tmp_path):
+    store = LocalArtifactStore(tmp_path)
+    app.dependency_overrides[get_artifact_store] = lambda: store
+    yield store
+    app.dependency_overrides.pop(get_artifact_store, None)
+
+
+def _execution_id():
+    start = datetime(2096, 1, 1, tzinfo=timezone.utc) + timedelta(hours=next(_hours))
+    res = client.post(
+        "/reservations",
+        json={
+            "user_id": "artifact-tester",
+            "bench_type": "ARTIFACT",
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    rid = res.json()["id"]
+    r = client.post("/executions", json={"reservation_id": rid, "test_suite": "s"})
+    return r.json()["id"]
+
+
+def test_upload_list_and_download(api_store):
+    eid = _execution_id()
+    body = bytes(range(256)) * 1024
+    r = client.put(f"/executions/{eid}/artifacts/logs/bench.log", content=body)
+    assert r.status_code == 201
+    assert r.json()["sha256"] == hashlib.sha256(body).hexdigest()
+    assert r.json()["size"] == len(body)
+
+    again = client.put(f"/executions/{eid}/artifacts/logs/bench.log", content=body)
+    assert again.status_code == 201 and again.json() == r.json()
+    clash = client.put(f"/executions/{eid}/artifacts/logs/bench.log", content=b"x")
+    assert clash.status_code == 409
+
+    listed = client.get(f"/executions/{eid}/artifacts")
+    assert listed.status_code == 200
+    assert [a["name"] for a in listed.json()] == ["logs/bench.log"]
+
+    full = client.get(f"/executions/{eid}/artifacts/logs/bench.log")
+    assert full.status_code == 200 and full.content == body
+    assert full.headers["etag"] == f'"{r.json()["sha256"]}"'
+    assert full.headers["accept-ranges"] == "bytes"
+
+    part = client.get(
+        f"/executions/{eid}/artifacts/logs/bench.log",
+        headers={"Range": "bytes=1000-1999"},
+    )
+    assert part.status_code == 206
+    assert part.content == body[1000:2000]
+    assert part.headers["content-range"] == f"bytes 1000-1999/{len(body)}"
+
+
+def test_artifact_api_errors(api_store):
+    eid = _execution_id()
+    assert client.get("/executions/nope/artifacts").status_code == 404
+    assert (
+        client.put("/executions/nope/artifacts/a.log", content=b"x").status_code == 404
+    )
+    missing = client.get(f"/executions/{eid}/artifacts/logs/none.log")
+    assert missing.status_code == 404
+    bad = client.put(f"/executions/{eid}/artifacts/logs//a.log", content=b"x")
+    assert bad.status_code == 400
@@ -0,0 +1,80 @@
+"""Benchmark harness and a tiny run of the suite, so it keeps working."""
+
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from orchestrator import deps
+from benchmarks.harness import Report, Result, compare, percentile, summarize
+
+
+def _result(name, ops, p95):
+    return Result(name, {"size": 1}, 10, ops, 1.0, p95, p95, 1.0)
+
+
+def test_percentiles_are_nearest_rank():
+    samples = list(range(1000, 101_000, 1000))  # 1..100 us
+    assert percentile(samples, 0.50) == 50
+    assert percentile(samples, 0.95) == 95
+    assert percentile(samples, 0.99) == 99
+    assert percentile([], 0.5) == 0
+    r = summarize("x", {}, [3000, 1000, 2000], 6000)
+    assert (r.p50_us, r.p99_us, r.mean_us, r.ops_per_sec) == (2, 3, 2, 500_000)
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = Report([_result("a", 1000, 10), _result("b", 1000, 10)])
+    current = Report(
+        [_result("a", 900, 11), _result("b", 800, 20), _result("new", 1, 1)]
+    )
+    baseline.results[0].bytes_per_item = 400
+    current.results[0].bytes_per_item = 500
+    changes = compare(current, baseline, tolerance=0.15)
+    assert [(c.key, c.metric) for c in changes] == [
+        ("a[size=1]", "bytes_per_item"),
+        ("b[size=1]", "ops_per_sec"),
+        ("b[size=1]", "p95_us"),
+    ]
+
+
+@pytest.fixture
+def fresh_app_state(monkeypatch):
+    # the load scenarios fill the app's repositories; keep that out of the
+    # state the other API tests share
+    for name in ("_repo", "_execution_repo", "_engine"):
+        monkeypatch.setattr(deps, name, None)
+    yield
+    deps.shutdown_engine()
+
+
+def test_suite_runs_and_compares_to_baseline(tmp_path, capsys, fresh_app_state):
+    out = tmp_path / "run.json"
+    args = ["--sizes", "0,50", "--ops", "20", "--requests", "10"]
+    args += ["--concurrency", "2", "--json", str(out)]
+    assert main(args) == 0
+    report = json.loads(out.read_text())
+    names = {r["name"] for r in report["results"]}
+    assert {
+        "executions.update",
+        "executions.memory",
+        "queue.receive_ack",
+        "executions.contention",
+        "dispatch.wait",
+        "overhead.asgi",
+        "POST /executions/{id}/start",
+    } <= names
+    memory = [r for r in report["results"] if r["name"] == "executions.memory"]
+    assert [r["params"]["size"] for r in memory] == [50]
+    assert memory[0]["bytes_per_item"] > 0
+    assert all(r["errors"] == 0 for r in report["results"])
+    assert report["meta"]["python"]
+
+    # a baseline ten times faster than this run must fail the comparison
+    faster = Report.load(str(out))
+    for r in faster.results:
+        r.ops_per_sec *= 10
+    (tmp_path / "fast.json").write_text(faster.to_json())
+    only = ["micro", "--only", "executions.get", "--sizes", "50", "--ops", "20"]
+    assert main(only + ["--baseline", str(tmp_path / "fast.json")]) == 1
+    assert "REGRESSION executions.get[size=50] ops_per_sec" in capsys.readouterr().out
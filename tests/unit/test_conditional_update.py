@@ -0,0 +1,105 @@
+"""Optimistic-concurrency update tests for both execution repositories."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.repository.execution_base import VersionConflictError
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.repository.sqlite import SQLiteDatabase, SQLiteExecutionRepo
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryExecutionRepo()
+    return SQLiteExecutionRepo(SQLiteDatabase(str(tmp_path / "cas.db")))
+
+
+def test_version_bumps_on_every_update(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    assert ex.version == 1
+    ex = repo.update(ex.id, test_suite="smoke")
+    assert ex.version == 2
+    assert repo.get(ex.id).version == 2
+
+
+def test_expected_version_mismatch_fails_fast(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    repo.update(ex.id, expected_version=1, test_suite="a")
+    with pytest.raises(VersionConflictError) as exc:
+        repo.update(ex.id, expected_version=1, test_suite="b")
+    assert exc.value.version == 2
+    assert repo.get(ex.id).test_suite == "a"
+
+
+def test_expected_status_guards_transition(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    repo.update(
+        ex.id,
+        expected_status=ExecutionStatus.PENDING,
+        status=ExecutionStatus.RUNNING,
+    )
+    with pytest.raises(VersionConflictError) as exc:
+        repo.update(
+            ex.id,
+            expected_status=ExecutionStatus.PENDING,
+            status=ExecutionStatus.RUNNING,
+        )
+    assert exc.value.status == ExecutionStatus.RUNNING
+    done = repo.update(
+        ex.id,
+        expected_status=(ExecutionStatus.PENDING, ExecutionStatus.RUNNING),
+        status=ExecutionStatus.CANCELLED,
+    )
+    assert done.status == ExecutionStatus.CANCELLED
+
+
+def test_concurrent_transitions_have_one_winner(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+
+    def claim(_):
+        try:
+            repo.update(
+                ex.id,
+                expected_status=ExecutionStatus.PENDING,
+                status=ExecutionStatus.RUNNING,
+            )
+            return True
+        except VersionConflictError:
+            return False
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        wins = list(pool.map(claim, range(32)))
+    assert wins.count(True) == 1
+    assert repo.get(ex.id).version == 2
+
+
+def test_unconditional_updates_are_not_lost(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: repo.update(ex.id, test_suite=str(i)), range(40)))
+    assert repo.get(ex.id).version == 41
+
+
+def test_update_validates_only_the_changes(repo):
+    ex = repo.create(ExecutionCreate(reservation_id="r1", parameters={"k": 1}))
+    updated = repo.update(ex.id, status="RUNNING", priority=3)
+    assert updated.status is ExecutionStatus.RUNNING
+    assert (updated.priority, updated.parameters) == (3, {"k": 1})
+    assert updated.updated_at >= ex.updated_at
+    for bad in ({"priority": 10}, {"status": "BOGUS"}, {"version": 7}, {"nope": 1}):
+        with pytest.raises(ValidationError):
+            repo.update(ex.id, **bad)
+    assert repo.get(ex.id).version == 2
+
+
+def test_update_leaves_the_previous_version_untouched():
+    repo = InMemoryExecutionRepo()
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    updated = repo.update(ex.id, status=ExecutionStatus.RUNNING)
+    assert updated is not ex
+    assert (ex.status, ex.version) == (ExecutionStatus.PENDING, 1)
+    assert repo.get(ex.id) == updated
@@ -0,0 +1,137 @@
+"""Execution event bus and SSE stream tests."""
+
+import asyncio
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from orchestrator.api.events import iter_events
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.repository.observed import ObservedExecutionRepo
+from orchestrator.services.event_bus import EventBus
+
+client = TestClient(app)
+
+
+def _repo(bus):
+    return ObservedExecutionRepo(InMemoryExecutionRepo(), bus.publish)
+
+
+def _create(repo, reservation_id="r1"):
+    return repo.create(ExecutionCreate(reservation_id=reservation_id))
+
+
+def test_repo_publishes_every_write():
+    seen = []
+    repo = ObservedExecutionRepo(InMemoryExecutionRepo(), seen.append)
+    ex = _create(repo)
+    repo.update(ex.id, status=ExecutionStatus.RUNNING)
+    assert repo.update("missing", status=ExecutionStatus.RUNNING) is None
+    assert [(e.id, e.version) for e in seen] == [(ex.id, 1), (ex.id, 2)]
+    assert repo.get(ex.id).status == ExecutionStatus.RUNNING
+
+
+def test_subscriptions_only_see_matching_changes():
+    async def scenario():
+        bus = EventBus()
+        repo = _repo(bus)
+        a = _create(repo, "ra")
+        by_id = bus.subscribe(execution_id=a.id)
+        by_res = bus.subscribe(reservation_id="rb")
+        everything = bus.subscribe()
+        b = _create(repo, "rb")
+        # published from a worker thread, as the engine does
+        t = threading.Thread(
+            target=repo.update, args=(a.id,), kwargs={"status": "RUNNING"}
+        )
+        t.start()
+        t.join()
+        got = [await s.get(1.0) for s in (by_id, by_res, everything)]
+        assert [[e.id for e in batch] for batch in got] == [
+            [a.id],
+            [b.id],
+            [b.id, a.id],
+        ]
+        for s in (by_id, by_res, everything):
+            s.close()
+        assert bus.subscribers() == 0
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_gets_latest_state_and_overflow_cuts_off():
+    async def scenario():
+        bus = EventBus(buffer_size=2)
+        repo = _repo(bus)
+        sub = bus.subscribe()
+        ex = _create(repo)
+        for status in ("RUNNING", "COMPLETED"):
+            repo.update(ex.id, status=status)
+        batch = await sub.get(1.0)
+        # three writes, one pending entry holding the newest version
+        assert [(e.id, e.status, e.version) for e in batch] == [
+            (ex.id, ExecutionStatus.COMPLETED, 3)
+        ]
+        assert await sub.get(0.01) == []
+
+        for _ in range(3):
+            _create(repo)
+        assert sub.overflowed and sub.closed
+        assert bus.subscribers() == 0
+        chunks = [chunk async for chunk in iter_events(sub)]
+        assert chunks == ["event: overflow\ndata: {}\n\n"]
+
+    asyncio.run(scenario())
+
+
+def test_iter_events_keepalive_and_terminal_stop():
+    async def scenario():
+        bus = EventBus()
+        repo = _repo(bus)
+        ex = _create(repo)
+        sub = bus.subscribe(execution_id=ex.id)
+        stream = iter_events(sub, [ex], until_terminal=True, keepalive=0.01)
+        first = await stream.__anext__()
+        assert json.loads(first.split("data: ", 1)[1])["status"] == "PENDING"
+        assert await stream.__anext__() == ": keepalive\n\n"
+        repo.update(ex.id, status=ExecutionStatus.CANCELLED)
+        rest = [chunk async for chunk in stream]
+        assert len(rest) == 1 and '"CANCELLED"' in rest[0]
+        assert bus.subscribers() == 0
+
+    asyncio.run(scenario())
+
+
+def test_execution_events_endpoint_streams_until_finished():
+    start = datetime(2097, 3, 1, tzinfo=timezone.utc)
+    res = client.post(
+        "/reservations",
+        json={
+            "user_id": "sse-watcher",
+            "bench_type": "SSE",
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    eid = client.post(
+        "/executions", json={"reservation_id": res.json()["id"], "test_suite": "s"}
+    ).json()["id"]
+    assert client.post(f"/executions/{eid}/start").status_code == 202
+
+    with client.stream("GET", f"/executions/{eid}/events") as r:
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("text/event-stream")
+        events = [
+            json.loads(line[len("data: ") :])
+            for line in r.iter_lines()
+            if line.startswith("data: ")
+        ]
+    assert events[-1]["status"] == "COMPLETED"
+    versions = [e["version"] for e in events]
+    assert versions == sorted(set(versions))
+
+    assert client.get("/executions/nope/events").status_code == 404
@@ -0,0 +1,161 @@
+"""Background execution engine tests."""
+
+import time
+from threading import Event
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.services.execution_engine import ExecutionEngine
+from orchestrator.services.execution_service import ExecutionService
+
+TERMINAL = (
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELLED,
+)
+
+
+def _wait(repo, eid, statuses, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        ex = repo.get(eid)
+        if ex.status in statuses:
+            return ex
+        time.sleep(0.005)
+    raise AssertionError(f"{eid} stuck in {repo.get(eid).status}")
+
+
+def _blocking_runner(release: Event):
+    def run(execution, cancel):
+        while not release.is_set():
+            if cancel.wait(0.005):
+                return None
+        return f"mem://{execution.id}"
+
+    return run
+
+
+def test_start_returns_immediately_and_completes():
+    repo = InMemoryExecutionRepo()
+    release = Event()
+    engine = ExecutionEngine(repo, runner=_blocking_runner(release))
+    svc = ExecutionService(repo=repo, engine=engine)
+    ex = svc.create(ExecutionCreate(reservation_id="r1"))
+
+    started = svc.start(ex.id)
+    assert started.status == ExecutionStatus.PENDING
+    _wait(repo, ex.id, (ExecutionStatus.RUNNING,))
+    release.set()
+    done = _wait(repo, ex.id, TERMINAL)
+    assert done.status == ExecutionStatus.COMPLETED
+    assert done.artifacts_uri == f"mem://{ex.id}"
+    engine.shutdown()
+
+
+def test_runner_error_marks_failed():
+    repo = InMemoryExecutionRepo()
+
+    def boom(execution, cancel):
+        raise RuntimeError("bench exploded")
+
+    engine = ExecutionEngine(repo, runner=boom)
+    svc = ExecutionService(repo=repo, engine=engine)
+    ex = svc.create(ExecutionCreate(reservation_id="r1"))
+    svc.start(ex.id)
+    assert _wait(repo, ex.id, TERMINAL).status == ExecutionStatus.FAILED
+    engine.shutdown()
+
+
+def test_stop_cancels_running_and_queued():
+    repo = InMemoryExecutionRepo()
+    release = Event()
+    engine = ExecutionEngine(
+        repo, runner=_blocking_runner(release), bench_limits={"default": 1}
+    )
+    svc = ExecutionService(repo=repo, engine=engine)
+    first = svc.create(ExecutionCreate(reservation_id="r1"))
+    second = svc.create(ExecutionCreate(reservation_id="r1"))
+    svc.start(first.id)
+    svc.start(second.id)
+    _wait(repo, first.id, (ExecutionStatus.RUNNING,))
+    # bench limit of 1 keeps the second one queued
+    assert repo.get(second.id).status == ExecutionStatus.PENDING
+
+    assert svc.stop(second.id).status == ExecutionStatus.CANCELLED
+    assert svc.stop(first.id).status == ExecutionStatus.CANCELLED
+    time.sleep(0.05)
+    assert repo.get(first.id).status == ExecutionStatus.CANCELLED
+    assert not engine.is_active(first.id)
+    assert not engine.is_active(second.id)
+    engine.shutdown()
+
+
+def test_bench_limit_bounds_concurrency():
+    repo = InMemoryExecutionRepo()
+    release = Event()
+    engine = ExecutionEngine(
+        repo,
+        runner=_blocking_runner(release),
+        max_workers=4,
+        bench_limits={"HIL": 2},
+    )
+    ids = [repo.create(ExecutionCreate(reservation_id="r")).id for _ in range(4)]
+    for eid in ids:
+        assert engine.submit(eid, "HIL")
+    assert not engine.submit(ids[0], "HIL")
+
+    _wait(repo, ids[1], (ExecutionStatus.RUNNING,))
+    time.sleep(0.05)
+    running = [eid for eid in ids if repo.get(eid).status == ExecutionStatus.RUNNING]
+    assert running == ids[:2]
+
+    release.set()
+    for eid in ids:
+        assert _wait(repo, eid, TERMINAL).status == ExecutionStatus.COMPLETED
+    engine.shutdown()
+
+
+def test_queued_runs_dispatch_by_priority():
+    repo = InMemoryExecutionRepo()
+    release = Event()
+    order = []
+
+    def run(execution, cancel):
+        order.append(execution.id)
+        release.wait(5)
+        return None
+
+    engine = ExecutionEngine(repo, runner=run, bench_limits={"HIL": 1})
+    ids = [
+        repo.create(ExecutionCreate(reservation_id="r", priority=p)).id
+        for p in (0, 0, 7, 3)
+    ]
+    for eid, p in zip(ids, (0, 0, 7, 3)):
+        assert engine.submit(eid, "HIL", "alice", p)
+    release.set()
+    for eid in ids:
+        _wait(repo, eid, TERMINAL)
+    # the first run was already dispatched; the rest go by priority
+    assert order == [ids[0], ids[2], ids[3], ids[1]]
+    engine.shutdown()
+
+
+def test_shutdown_fails_running_and_queued_runs():
+    repo = InMemoryExecutionRepo()
+    engine = ExecutionEngine(repo, runner=_blocking_runner(Event()), max_workers=1)
+    svc = ExecutionService(repo=repo, engine=engine)
+    running, queued = (svc.create(ExecutionCreate(reservation_id="r1")) for _ in "ab")
+    svc.start(running.id)
+    _wait(repo, running.id, (ExecutionStatus.RUNNING,))
+    svc.start(queued.id)
+
+    engine.shutdown()
+    for eid in (running.id, queued.id):
+        ex = repo.get(eid)
+        assert ex.status == ExecutionStatus.FAILED
+        assert ex.finished_at is not None
+    # a failed run can be started again on a new engine
+    svc = ExecutionService(repo=repo, engine=ExecutionEngine(repo))
+    svc.start(queued.id)
+    assert _wait(repo, queued.id, TERMINAL).status == ExecutionStatus.COMPLETED
+    svc.engine.shutdown()
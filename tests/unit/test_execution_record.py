@@ -0,0 +1,74 @@
+"""Compact storage of the in-memory execution repository."""
+
+from datetime import datetime, timezone
+
+from orchestrator.models.execution import Execution, ExecutionCreate, ExecutionStatus
+from orchestrator.repository.execution_record import ExecutionRecord
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+
+
+def test_round_trip_is_exact():
+    repo = InMemoryExecutionRepo()
+    ex = repo.create(
+        ExecutionCreate(
+            reservation_id="r1", commit_sha="abc", parameters={"k": [1]}, priority=4
+        )
+    )
+    assert repo.get(ex.id) == ex
+    empty = repo.create(ExecutionCreate(reservation_id="r1"))
+    assert repo.get(empty.id).parameters == {}
+
+
+def test_timestamps_keep_their_timezone():
+    repo = InMemoryExecutionRepo()
+    ex = repo.create(ExecutionCreate(reservation_id="r1"))
+    aware = datetime(2030, 5, 6, 7, 8, 9, 123456, tzinfo=timezone.utc)
+    naive = datetime(2030, 5, 6, 7, 8, 9, 654321)
+    repo.update(ex.id, started_at=aware, finished_at=naive)
+    got = repo.get(ex.id)
+    assert got.started_at == aware and got.started_at.tzinfo is not None
+    assert got.finished_at == naive and got.finished_at.tzinfo is None
+    assert repo.update(ex.id, finished_at=None).finished_at is None
+
+
+def test_records_are_compact_and_share_strings():
+    repo = InMemoryExecutionRepo()
+    a, b = repo.create_many(
+        [ExecutionCreate(reservation_id="".join(["res", "-1"])) for _ in range(2)]
+    )
+    ra, rb = repo._store.get(a.id), repo._store.get(b.id)
+    assert not hasattr(ra, "__dict__")
+    assert ra.reservation_id is rb.reservation_id
+    assert isinstance(ra.created_at, int)
+    assert ra.status is ExecutionStatus.PENDING
+
+
+def test_reads_are_independent_copies():
+    repo = InMemoryExecutionRepo()
+    ex = repo.create(ExecutionCreate(reservation_id="r1", parameters={"k": 1}))
+    repo.get(ex.id).parameters["k"] = 2
+    assert repo.get(ex.id).parameters == {"k": 1}
+    assert ExecutionRecord.pack(ex).unpack() == ex
+
+
+def test_returned_models_do_not_share_parameters_with_the_store():
+    repo = InMemoryExecutionRepo()
+    (created,) = repo.create_many(
+        [ExecutionCreate(reservation_id="r1", parameters={"k": 1})]
+    )
+    created.parameters["k"] = 2
+    assert repo.get(created.id).parameters == {"k": 1}
+    updated = repo.update(created.id, parameters={"k": 3})
+    updated.parameters["k"] = 4
+    assert repo.get(created.id).parameters == {"k": 3}
+
+
+def test_unpacked_models_match_what_was_stored():
+    repo = InMemoryExecutionRepo()
+    ex = repo.create(ExecutionCreate(reservation_id="r1", priority=3))
+    got = repo.get(ex.id)
+    assert got == ex and got.model_fields_set == set(Execution.model_fields)
+    assert list(vars(got)) == list(Execution.model_fields)
+    assert got.model_dump_json() == ex.model_dump_json()
+    got.test_suite = "changed"  # still an ordinary, mutable model
+    assert repo.get(ex.id).test_suite is None
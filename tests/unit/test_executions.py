@@ -1,14 +1,27 @@
 from fastapi.testclient import TestClient
 from orchestrator.main import app
 from datetime import datetime, timezone, timedelta
+import json
+import time
 
 client = TestClient(app)
 
+TERMINAL = ("COMPLETED", "FAILED", "CANCELLED")
+
 
 def iso_now():
     return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
 
 
+def wait_for_terminal(eid, timeout=5.0):
+    deadline = time.time() + timeout
+    while True:
+        body = client.get(f"/executions/{eid}").json()
+        if body["status"] in TERMINAL or time.time() > deadline:
+            return body
+        time.sleep(0.01)
+
+
 def test_create_start_complete_execution():
     # create a reservation first (reuse existing reservation flow)
     start = iso_now()
@@ -19,7 +32,7 @@ def test_create_start_complete_execution():
     )
     res = client.post(
         "/reservations",
-        json={"user_id": "tester", "bench_type": "SIL", "start": start, "end": end},
+        json={"user_id": "tester", "bench_type": "HIL", "start": start, "end": end},
     )
     assert res.status_code == 201
     reservation = res.json()
@@ -35,16 +48,13 @@ def test_create_start_complete_execution():
 
     # start execution
     r = client.post(f"/executions/{eid}/start")
-    assert r.status_code == 200
-    exe2 = r.json()
-    assert exe2["status"] in (
-        "RUNNING",
-        "COMPLETED",
-        "FAILED",
-        "CANCELLED",
-        "COMPLETED",
-    )
-    # completed artifacts present for simulated run
+    assert r.status_code == 202
+    assert r.json()["status"] in ("PENDING", "RUNNING", "COMPLETED")
+
+    # runs in the background; completed artifacts present for simulated run
+    exe2 = wait_for_terminal(eid)
+    assert exe2["status"] == "COMPLETED"
+    assert exe2["started_at"] is not None and exe2["finished_at"] is not None
     assert "artifacts_uri" in exe2 and exe2["artifacts_uri"] is not None
 
     # get execution
@@ -58,3 +68,85 @@ def test_create_start_complete_execution():
     assert r.status_code == 200
     items = r.json()
     assert any(it["id"] == eid for it in items)
+
+
+def test_list_executions_cursor_and_filters():
+    start = datetime.now(timezone.utc) + timedelta(days=60)
+    res = client.post(
+        "/reservations",
+        json={
+            "user_id": "pager",
+            "bench_type": "HIL-page",
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    rid = res.json()["id"]
+    ids = [
+        client.post("/executions", json={"reservation_id": rid}).json()["id"]
+        for _ in range(4)
+    ]
+    client.post(f"/executions/{ids[1]}/start")
+    wait_for_terminal(ids[1])
+
+    r = client.get("/executions", params={"reservation_id": rid, "limit": 3})
+    assert [it["id"] for it in r.json()] == ids[:3]
+    r = client.get(
+        "/executions", params={"reservation_id": rid, "after": ids[2], "limit": 3}
+    )
+    assert [it["id"] for it in r.json()] == ids[3:]
+
+    r = client.get("/executions", params={"reservation_id": rid, "status": "PENDING"})
+    assert [it["id"] for it in r.json()] == [ids[0], ids[2], ids[3]]
+
+    r = client.get("/executions", params={"after": "missing"})
+    assert r.status_code == 400
+
+
+def test_batch_create_and_start_executions():
+    payload = {
+        "items": [{"reservation_id": "batch-r", "test_suite": str(i)} for i in range(3)]
+    }
+    r = client.post("/executions:batch", json=payload)
+    assert r.status_code == 201
+    results = r.json()["results"]
+    assert [it["index"] for it in results] == [0, 1, 2]
+    assert all(it["status"] == 201 for it in results)
+    assert [it["execution"]["test_suite"] for it in results] == ["0", "1", "2"]
+    ids = [it["id"] for it in results]
+
+    r = client.post("/executions:batchStart", json={"ids": ids + ["missing"]})
+    assert r.status_code == 200
+    results = r.json()["results"]
+    assert [it["status"] for it in results] == [202, 202, 202, 404]
+    for eid in ids:
+        assert wait_for_terminal(eid)["status"] == "COMPLETED"
+
+
+def test_batch_create_executions_validates_whole_batch():
+    r = client.post(
+        "/executions:batch",
+        json={"items": [{"reservation_id": "ok"}, {"reservation_id": ""}]},
+    )
+    assert r.status_code == 422
+    assert client.post("/executions:batch", json={"items": []}).status_code == 422
+
+
+def test_export_executions_streams_ndjson():
+    created = client.post(
+        "/executions:batch",
+        json={"items": [{"reservation_id": "export-r"} for _ in range(3)]},
+    ).json()["results"]
+    r = client.get("/executions/export", params={"reservation_id": "export-r"})
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in r.text.splitlines()]
+    assert sorted(row["id"] for row in rows) == sorted(it["id"] for it in created)
+
+
+def test_start_works_after_a_lifespan_restart():
+    for _ in range(2):
+        with TestClient(app) as c:
+            eid = c.post("/executions", json={"reservation_id": "restart"}).json()
+            r = c.post(f"/executions/{eid['id']}/start")
+            assert r.status_code == 202
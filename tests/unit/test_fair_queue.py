@@ -0,0 +1,105 @@
+"""Weighted fair, priority-aging dispatch queue tests."""
+
+import pytest
+
+from orchestrator import deps
+from orchestrator.services.fair_queue import FairQueue
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _drain(q):
+    out = []
+    while q:
+        out.append(q.pop())
+    return out
+
+
+def test_priority_orders_within_tenant_fifo_on_ties():
+    q = FairQueue(clock=FakeClock())
+    for key, prio in (("a", 0), ("b", 5), ("c", 0), ("d", 5)):
+        q.push(key, key, "t", prio)
+    assert _drain(q) == ["b", "d", "a", "c"]
+    with pytest.raises(IndexError):
+        q.pop()
+
+
+def test_round_robin_across_equal_tenants():
+    q = FairQueue(clock=FakeClock())
+    for i in range(4):
+        q.push(f"a{i}", f"a{i}", "alice")
+    q.push("b0", "b0", "bob")
+    q.push("b1", "b1", "bob")
+    # alice's backlog does not starve bob even though it arrived first
+    assert _drain(q) == ["a0", "b0", "a1", "b1", "a2", "a3"]
+
+
+def test_weights_share_dispatches():
+    q = FairQueue(weights={"big": 3}, clock=FakeClock())
+    for i in range(30):
+        q.push(f"big{i}", "big", "big")
+        q.push(f"small{i}", "small", "small")
+    first = [q.pop() for _ in range(20)]
+    assert first.count("big") == 15
+    assert first.count("small") == 5
+
+
+def test_idle_tenant_does_not_bank_credit():
+    q = FairQueue(clock=FakeClock())
+    for i in range(10):
+        q.push(f"a{i}", "a", "alice")
+    for _ in range(6):
+        q.pop()
+    # bob was idle while alice ran; he gets his fair share from now on,
+    # not six turns in a row
+    for i in range(4):
+        q.push(f"b{i}", "b", "bob")
+    assert [q.pop() for _ in range(4)] == ["b", "a", "b", "a"]
+
+
+def test_aging_lifts_old_low_priority_work():
+    clock = FakeClock()
+    q = FairQueue(aging_seconds=10.0, clock=clock)
+    q.push("old", "old", "t", priority=0)
+    clock.now = 25.0  # worth 2.5 levels
+    q.push("two", "two", "t", priority=2)
+    q.push("three", "three", "t", priority=3)
+    assert _drain(q) == ["three", "old", "two"]
+
+
+def test_discard_is_lazy_and_keeps_fairness():
+    q = FairQueue(clock=FakeClock())
+    q.push("a0", "a0", "alice")
+    q.push("a1", "a1", "alice")
+    q.push("b0", "b0", "bob")
+    assert q.discard("a0") == "a0"
+    assert q.discard("a0") is None
+    assert "a0" not in q and "a1" in q
+    assert len(q) == 2
+    # bob's only job is discarded and re-queued: one live slot, no duplicates
+    q.discard("b0")
+    q.push("b0", "b0", "bob")
+    assert _drain(q) == ["a1", "b0"]
+    with pytest.raises(ValueError):
+        q.push("x", "x")
+        q.push("x", "x")
+
+
+@pytest.mark.parametrize("raw", ["alice=0", "alice=2,bob=-1", "alice=nan"])
+def test_tenant_weights_must_be_positive(raw):
+    with pytest.raises(ValueError):
+        deps._parse_weights(raw)
+
+
+def test_priority_aging_must_be_positive(monkeypatch):
+    monkeypatch.setattr(deps, "_engine", None)
+    monkeypatch.setenv("ORCHESTRATOR_PRIORITY_AGING_SECONDS", "0")
+    with pytest.raises(ValueError, match="AGING"):
+        deps.get_engine(deps.get_execution_repo())
+    assert deps._engine is None
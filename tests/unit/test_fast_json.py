@@ -0,0 +1,84 @@
+"""Fast JSON response mode: same bodies and status codes as the default path."""
+
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator import deps
+from orchestrator.api.responses import model_response
+from orchestrator.main import app
+from orchestrator.models.execution import Execution
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def fast(monkeypatch):
+    def use(enabled):
+        monkeypatch.setattr(deps, "_fast_json", enabled)
+
+    return use
+
+
+def _reservation(hours):
+    start = datetime(2097, 1, 1, tzinfo=timezone.utc) + timedelta(hours=hours)
+    return {
+        "user_id": "fast-json",
+        "bench_type": "FASTJSON",
+        "start": start.isoformat(),
+        "end": (start + timedelta(hours=1)).isoformat(),
+    }
+
+
+def test_responses_match_default_mode(fast):
+    fast(True)
+    created = client.post("/reservations", json=_reservation(0))
+    assert created.status_code == 201
+    assert created.headers["content-type"] == "application/json"
+    rid = created.json()["id"]
+    ex = client.post("/executions", json={"reservation_id": rid, "priority": 3})
+    assert ex.status_code == 201
+    eid = ex.json()["id"]
+    assert client.post(f"/executions/{eid}/start").status_code == 202
+
+    paths = [
+        f"/reservations/{rid}",
+        "/reservations?bench_type=FASTJSON",
+        f"/executions?reservation_id={rid}",
+        f"/executions/{eid}/stop",
+    ]
+    for path in paths:
+        method = client.post if path.endswith("/stop") else client.get
+        fast(True)
+        quick = method(path)
+        fast(False)
+        default = method(path)
+        assert quick.status_code == default.status_code == 200, path
+        assert quick.json() == default.json(), path
+
+    fast(True)
+    batch = client.post(
+        "/executions:batch", json={"items": [{"reservation_id": rid}] * 2}
+    )
+    assert batch.status_code == 201
+    assert [r["status"] for r in batch.json()["results"]] == [201, 201]
+    started = client.post(":batchStart".join(["/executions", ""]), json={"ids": ["x"]})
+    assert started.json()["results"][0]["status"] == 404
+
+
+def test_errors_keep_the_default_path(fast):
+    fast(True)
+    assert client.get("/executions/missing").status_code == 404
+    assert client.get("/executions?after=not-a-ulid").status_code == 400
+    assert client.post("/reservations", json={"user_id": ""}).status_code == 422
+
+
+def test_model_response_passes_through_when_off(fast):
+    fast(False)
+    items = []
+    assert model_response(items, List[Execution]) is items
+    fast(True)
+    r = model_response([], List[Execution], status_code=202)
+    assert (r.status_code, r.body) == (202, b"[]")
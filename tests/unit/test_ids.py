@@ -0,0 +1,51 @@
+"""ULID generation tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from orchestrator import ids
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+
+
+def test_ulids_are_well_formed_and_monotonic():
+    gen = ids.ULIDGenerator()
+    values = [gen.new() for _ in range(1000)]
+    assert all(ids.is_ulid(v) for v in values)
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_ulids_unique_across_threads():
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lambda _: ids.new_ulid(), range(2000)))
+    assert len(set(values)) == 2000
+
+
+def test_timestamp_round_trip():
+    before = datetime.now(timezone.utc) - timedelta(milliseconds=1)
+    value = ids.new_ulid()
+    assert before <= ids.datetime_of(value) <= datetime.now(timezone.utc)
+    assert ids.timestamp_ms(ids.lower_bound(before)) == int(before.timestamp() * 1000)
+    assert ids.lower_bound(before) < value
+
+
+def test_encode_matches_spec_examples():
+    assert ids.encode(0) == "0" * 26
+    assert ids.encode((1 << 128) - 1) == "7" + "Z" * 25
+    assert not ids.is_ulid("8" + "0" * 25)
+    assert not ids.is_ulid("0" * 25 + "U")
+
+
+def test_created_between_uses_id_order():
+    repo = InMemoryExecutionRepo()
+    first = repo.create(ExecutionCreate(reservation_id="r"))
+    mid = ids.datetime_of(first.id) + timedelta(milliseconds=1)
+    later = [repo.create(ExecutionCreate(reservation_id="r")) for _ in range(3)]
+    # force the later ones past `mid` regardless of clock resolution
+    later = [e for e in later if e.id >= ids.lower_bound(mid)]
+
+    window = repo.created_between(mid, mid + timedelta(days=1))
+    assert [e.id for e in window] == [e.id for e in later]
+    early = repo.created_between(mid - timedelta(days=1), mid)
+    assert first.id in [e.id for e in early]
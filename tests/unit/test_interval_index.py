@@ -0,0 +1,82 @@
+"""Interval index and overlap lookup tests."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from orchestrator.models.reservation import ReservationCreate
+from orchestrator.repository.base import ReservationConflictError
+from orchestrator.repository.in_memory import InMemoryReservationRepo
+from orchestrator.repository.interval_index import IntervalIndex, to_timestamp
+
+
+def test_index_overlapping_and_remove():
+    idx = IntervalIndex()
+    idx.add("SIL", 0, 10, "a")
+    idx.add("SIL", 20, 30, "b")
+    idx.add("SIL", 10, 20, "c")
+    idx.add("HIL", 0, 100, "h")
+
+    assert idx.overlapping("SIL", 5, 25) == ["a", "c", "b"]
+    assert idx.overlapping("SIL", 30, 40) == []
+    assert idx.has_overlap("SIL", 9, 11)
+    assert not idx.has_overlap("XIL", 0, 100)
+
+    with pytest.raises(ValueError):
+        idx.add("SIL", 25, 35, "d")
+
+    assert idx.remove("SIL", 20, "b")
+    assert not idx.remove("SIL", 20, "b")
+    idx.add("SIL", 25, 35, "d")
+    assert idx.overlapping("SIL", 21, 26) == ["d"]
+
+
+def test_to_timestamp_treats_naive_as_utc():
+    aware = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    assert to_timestamp(aware.replace(tzinfo=None)) == to_timestamp(aware)
+
+
+def test_repo_find_overlapping_and_conflict():
+    repo = InMemoryReservationRepo()
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    first = repo.create(
+        ReservationCreate(
+            user_id="u", bench_type="SIL", start=start, end=start + timedelta(hours=1)
+        )
+    )
+
+    with pytest.raises(ReservationConflictError) as exc:
+        repo.create(
+            ReservationCreate(
+                user_id="u",
+                bench_type="SIL",
+                start=start + timedelta(minutes=30),
+                end=start + timedelta(hours=2),
+            )
+        )
+    assert exc.value.conflicting_id == first.id
+
+    found = repo.find_overlapping("SIL", start - timedelta(hours=1), start)
+    assert found == []
+    found = repo.find_overlapping(
+        "SIL", start.replace(tzinfo=None), start + timedelta(minutes=1)
+    )
+    assert [r.id for r in found] == [first.id]
+
+
+def test_index_free_gap_and_first_fit():
+    idx = IntervalIndex()
+    idx.add("SIL", 10, 20, "a")
+    idx.add("SIL", 25, 40, "b")
+
+    assert idx.free_gap("SIL", 20, 25) == (20, 25)
+    assert idx.free_gap("SIL", 0, 5) == (float("-inf"), 10)
+    assert idx.free_gap("SIL", 15, 22) is None
+    assert idx.free_gap("XIL", 0, 5) == (float("-inf"), float("inf"))
+
+    assert idx.first_fit("SIL", 0, 10) == 0
+    assert idx.first_fit("SIL", 5, 10) == 40
+    assert idx.first_fit("SIL", 12, 5) == 20
+    assert idx.first_fit("SIL", 12, 6) == 40
+    assert idx.first_fit("SIL", 12, 6, give_up_at=30) is None
+    assert idx.last_end("SIL") == 40 and idx.last_end("XIL") == float("-inf")
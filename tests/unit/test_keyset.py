@@ -0,0 +1,53 @@
+"""Keyset index pagination tests."""
+
+import pytest
+
+from orchestrator.ids import encode
+from orchestrator.repository.keyset import InvalidCursorError, KeysetIndex
+
+IDS = [encode(i) for i in range(6)]
+
+
+def _index():
+    idx = KeysetIndex("status", "owner")
+    for i, rid in enumerate(IDS):
+        idx.add(
+            rid,
+            status="odd" if i % 2 else "even",
+            owner="a" if i < 3 else "b",
+        )
+    return idx
+
+
+def test_page_walks_in_key_order():
+    idx = _index()
+    assert idx.page(2) == IDS[:2]
+    assert idx.page(2, after=IDS[1]) == IDS[2:4]
+    assert idx.page(10, after=IDS[5]) == []
+
+
+def test_page_with_filters():
+    idx = _index()
+    assert idx.page(10, status="odd") == IDS[1::2]
+    assert idx.page(10, status="even", owner="b") == [IDS[4]]
+    assert idx.page(1, after=IDS[1], status="odd") == [IDS[3]]
+    assert idx.page(10, status="unknown") == []
+
+
+def test_page_with_bounds():
+    idx = _index()
+    assert idx.page(10, lo=IDS[2], hi=IDS[4]) == IDS[2:4]
+    assert idx.page(10, lo=IDS[1], hi=IDS[5], status="odd") == [IDS[1], IDS[3]]
+    assert idx.page(1, after=IDS[2], lo=IDS[1]) == [IDS[3]]
+
+
+def test_set_and_remove_update_buckets():
+    idx = _index()
+    idx.set(IDS[0], "status", "odd")
+    assert idx.page(10, status="odd") == [IDS[0], IDS[1], IDS[3], IDS[5]]
+    idx.remove(IDS[3])
+    assert idx.page(10, status="odd") == [IDS[0], IDS[1], IDS[5]]
+    # a deleted id still positions the cursor
+    assert idx.page(10, after=IDS[3]) == [IDS[4], IDS[5]]
+    with pytest.raises(InvalidCursorError):
+        idx.page(10, after="not-a-ulid")
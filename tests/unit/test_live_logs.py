@@ -0,0 +1,215 @@
+"""Live log ring buffer, tailing and log API tests."""
+
+import asyncio
+import shlex
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.api.logs import iter_log
+from orchestrator.deps import get_live_logs
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.runners import LocalProcessRunner, run_lifecycle
+from orchestrator.services.live_logs import BLOCK_SIZE, LiveLogs, LogSink
+
+client = TestClient(app)
+_hours = count()
+
+
+def _lines(n, width=100):
+    return b"".join(b"%06d %s\n" % (i, b"x" * (width - 8)) for i in range(n))
+
+
+def _read_all(sink, offset=0):
+    out = b""
+    while True:
+        start, data = sink.read(offset, 10_000)
+        if not data:
+            return out
+        assert start == offset
+        out += data
+        offset += len(data)
+
+
+def test_ring_spills_evicted_blocks(tmp_path):
+    sink = LogSink(capacity=4 * BLOCK_SIZE, spill_path=tmp_path / "x.log")
+    payload = _lines(10_000)
+    for i in range(0, len(payload), 100):
+        sink.write(payload[i : i + 100])
+
+    assert sink.size == len(payload)
+    in_memory = sink.size - sink._start
+    assert 0 < in_memory <= 4 * BLOCK_SIZE
+    assert len(sink._blocks) <= 5  # small writes are packed into blocks
+    assert _read_all(sink) == payload
+    assert _read_all(sink, 12_345) == payload[12_345:]
+    assert (tmp_path / "x.log").stat().st_size == sink._start
+    assert sink.read(len(payload) + 10, 10) == (len(payload), b"")
+
+
+def test_ring_without_spill_skips_lost_bytes():
+    sink = LogSink(capacity=BLOCK_SIZE)
+    payload = _lines(5_000)
+    for i in range(0, len(payload), 1000):
+        sink.write(payload[i : i + 1000])
+    oldest = sink.resolve(0)
+    assert oldest > 0
+    start, data = sink.read(0, 100)
+    assert start == oldest and data == payload[oldest : oldest + 100]
+
+
+def test_finished_logs_are_retained_then_dropped(tmp_path):
+    logs = LiveLogs(capacity_bytes=10, spill_dir=tmp_path, keep_finished=1)
+    for eid in ("a", "b"):
+        logs.open(eid).write(b"0123456789" * 200)
+    assert (tmp_path / "a.log").exists()
+    logs.finish("a")
+    assert logs.get("a").closed
+    logs.get("a").write(b"ignored after close")
+    assert logs.get("a").size == 2000
+    logs.finish("b")
+    assert logs.get("a") is None and not (tmp_path / "a.log").exists()
+    assert logs.get("b") is not None
+
+
+def test_reopening_a_finished_log_starts_afresh(tmp_path):
+    logs = LiveLogs(capacity_bytes=10, spill_dir=tmp_path, keep_finished=1)
+    first = logs.open("a")
+    first.write(b"run1\n" * 10)
+    logs.finish("a")
+
+    # retried after failing: the new run's output must not be dropped
+    second = logs.open("a")
+    assert second is not first and first.closed and not second.closed
+    second.write(b"run2\n" * 10)
+    assert _read_all(second) == b"run2\n" * 10
+    assert logs.get("a") is second
+
+    # no longer counted as finished, so finishing "b" keeps it
+    logs.open("b")
+    logs.finish("b")
+    assert logs.get("a") is second and (tmp_path / "a.log").exists()
+
+
+def test_spilled_read_after_discard_is_empty(tmp_path):
+    sink = LogSink(capacity=BLOCK_SIZE, spill_path=tmp_path / "x.log")
+    sink.write(_lines(2_000))
+    sink.write(_lines(2_000))
+    assert sink.read(0, 10)[1] == _lines(1)[:10]
+    sink.discard()
+    assert not (tmp_path / "x.log").exists()
+    assert sink.read(0, 10) == (sink.size, b"")
+
+
+def test_follow_yields_whole_lines_until_closed():
+    sink = LogSink(capacity=1 << 20)
+
+    async def not_finished():
+        return False
+
+    def writer():
+        for part in (b"one\ntw", b"o\n", b"thr", b"ee\n", b"tail"):
+            time.sleep(0.02)
+            sink.write(part)
+        sink.close()
+
+    async def scenario():
+        threading.Thread(target=writer).start()
+        return [c async for c in iter_log(sink, 0, True, not_finished, 0.01)]
+
+    chunks = asyncio.run(scenario())
+    assert b"".join(chunks) == b"one\ntwo\nthree\ntail"
+    # nothing but the final, closed-log chunk ends mid-line
+    assert all(c.endswith(b"\n") for c in chunks[:-1])
+
+
+def test_follow_stops_when_run_is_over():
+    sink = LogSink(capacity=1 << 20)
+    sink.write(b"partial")
+    checks = []
+
+    async def finished():
+        checks.append(1)
+        return len(checks) >= 2
+
+    async def scenario():
+        return [c async for c in iter_log(sink, 0, True, finished, 0.01)]
+
+    assert asyncio.run(scenario()) == []
+    assert len(checks) == 2
+
+
+def test_local_runner_writes_live_log(tmp_path):
+    logs = LiveLogs()
+    runner = LocalProcessRunner(tmp_path, shards=2, logs=logs)
+    code = "import os; print('shard', os.environ['ORCHESTRATOR_SHARD_INDEX'])"
+    ex = InMemoryExecutionRepo().create(
+        ExecutionCreate(
+            reservation_id="r",
+            test_suite=f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}",
+        )
+    )
+    asyncio.run(run_lifecycle(runner, ex, threading.Event()))
+
+    sink = logs.get(ex.id)
+    assert sink.closed
+    lines = sorted(_read_all(sink).decode().splitlines())
+    assert lines == ["[shard 0] shard 0", "[shard 1] shard 1"]
+
+
+@pytest.fixture
+def api_logs():
+    logs = LiveLogs()
+    app.dependency_overrides[get_live_logs] = lambda: logs
+    yield logs
+    app.dependency_overrides.pop(get_live_logs, None)
+
+
+def _execution_id():
+    start = datetime(2098, 1, 1, tzinfo=timezone.utc) + timedelta(hours=next(_hours))
+    res = client.post(
+        "/reservations",
+        json={
+            "user_id": "log-tailer",
+            "bench_type": "LOGS",
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    r = client.post("/executions", json={"reservation_id": res.json()["id"]})
+    return r.json()["id"]
+
+
+def test_logs_endpoint_reads_from_offset(api_logs):
+    eid = _execution_id()
+    assert client.get(f"/executions/{eid}/logs").status_code == 404
+    assert client.get("/executions/nope/logs").status_code == 404
+
+    sink = api_logs.open(eid)
+    sink.write(b"alpha\nbeta\n")
+    r = client.get(f"/executions/{eid}/logs")
+    assert r.status_code == 200
+    assert r.text == "alpha\nbeta\n"
+    assert r.headers["x-log-offset"] == "0"
+
+    r = client.get(f"/executions/{eid}/logs", params={"offset": 6})
+    assert r.text == "beta\n" and r.headers["x-log-offset"] == "6"
+
+    sink.write(b"gamma")
+    sink.close()
+    r = client.get(f"/executions/{eid}/logs", params={"offset": 11, "follow": True})
+    assert r.text == "gamma"
+
+
+def test_following_a_run_without_a_log_does_not_open_one(api_logs):
+    eid = _execution_id()
+    r = client.get(f"/executions/{eid}/logs", params={"follow": True})
+    assert r.status_code == 404
+    assert api_logs.get(eid) is None
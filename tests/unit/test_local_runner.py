@@ -0,0 +1,171 @@
+"""Runner adapter lifecycle and local subprocess runner tests."""
+
+import asyncio
+import shlex
+import sys
+import time
+from threading import Event, Timer
+from types import SimpleNamespace
+
+import pytest
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.runners import (
+    ExecutionError,
+    LocalProcessRunner,
+    ProvisionError,
+    RunnerFactory,
+    as_engine_runner,
+    run_lifecycle,
+)
+from orchestrator.runners import local
+from orchestrator.services.execution_engine import ExecutionEngine
+
+
+def _suite(code):
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+def _execution(code=None, **parameters):
+    repo = InMemoryExecutionRepo()
+    return repo.create(
+        ExecutionCreate(
+            reservation_id="r",
+            test_suite=None if code is None else _suite(code),
+            parameters=parameters,
+        )
+    )
+
+
+def _run(runner, execution, cancel=None):
+    return asyncio.run(run_lifecycle(runner, execution, cancel or Event()))
+
+
+def test_runs_suite_and_streams_output(tmp_path):
+    lines = []
+    runner = LocalProcessRunner(
+        tmp_path, on_output=lambda eid, shard, line: lines.append((shard, line))
+    )
+    ex = _execution("import sys; print('hello'); print('oops', file=sys.stderr)")
+
+    result, bundle = _run(runner, ex)
+
+    assert result.passed
+    assert [s.exit_code for s in result.shards] == [0]
+    assert lines == [(0, "hello"), (0, "oops")]
+    log = tmp_path / ex.id / "shard-0.log"
+    assert log.read_text() == "hello\noops\n"
+    assert bundle.uri == (tmp_path / ex.id).resolve().as_uri()
+    assert log in bundle.files
+
+
+def test_shards_run_in_parallel(tmp_path):
+    code = (
+        "import os, sys, time; time.sleep(0.4); "
+        "print(os.environ['ORCHESTRATOR_SHARD_INDEX'], "
+        "os.environ['ORCHESTRATOR_SHARD_COUNT'], sys.argv[1])"
+    )
+    runner = LocalProcessRunner(tmp_path, shards=2)
+    ex = _execution(code, shards=4)
+    ex.test_suite += " {shard}/{shards}"
+
+    t0 = time.perf_counter()
+    result, _ = _run(runner, ex)
+    elapsed = time.perf_counter() - t0
+
+    assert result.passed and len(result.shards) == 4
+    assert elapsed < 1.2  # 4 x 0.4s run concurrently
+    for i in range(4):
+        text = (tmp_path / ex.id / f"shard-{i}.log").read_text()
+        assert text == f"{i} 4 {i}/4\n"
+
+
+def test_failing_shard_fails_run(tmp_path):
+    code = "import os, sys; sys.exit(int(os.environ['ORCHESTRATOR_SHARD_INDEX']))"
+    result, _ = _run(LocalProcessRunner(tmp_path, shards=2), _execution(code))
+    assert not result.passed
+    assert [s.exit_code for s in result.shards] == [0, 1]
+
+
+def test_timeout_kills_process_tree(tmp_path):
+    code = (
+        "import subprocess, sys, time; "
+        "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); "
+        "print('started', flush=True); time.sleep(30)"
+    )
+    runner = LocalProcessRunner(tmp_path, timeout_seconds=0.3)
+    t0 = time.perf_counter()
+    result, _ = _run(runner, _execution(code))
+    assert result.timed_out and not result.passed
+    assert time.perf_counter() - t0 < 5
+
+
+def test_kill_skips_shards_already_reaped(monkeypatch):
+    killed = []
+    monkeypatch.setattr(local.os, "killpg", lambda pid, sig: killed.append(pid))
+    done = SimpleNamespace(pid=101, returncode=0, kill=lambda: killed.append(101))
+    live = SimpleNamespace(pid=102, returncode=None, kill=lambda: killed.append(102))
+    local._kill([done, live])
+    assert killed == [102]
+
+
+def test_cancel_stops_run(tmp_path):
+    cancel = Event()
+    Timer(0.2, cancel.set).start()
+    result, _ = _run(
+        LocalProcessRunner(tmp_path), _execution("import time; time.sleep(30)"), cancel
+    )
+    assert result.cancelled and not result.timed_out
+
+
+def test_provision_and_launch_errors(tmp_path):
+    runner = LocalProcessRunner(tmp_path)
+    with pytest.raises(ProvisionError):
+        _run(runner, _execution())
+    ex = _execution()
+    ex.test_suite = "definitely-not-a-real-binary --flag"
+    with pytest.raises(ExecutionError):
+        _run(runner, ex)
+    with pytest.raises(ProvisionError, match="parameters.shards"):
+        _run(runner, _execution("pass", shards="many"))
+    for timeout in ("30", -1, True, [5], float("nan")):
+        with pytest.raises(ProvisionError, match="parameters.timeout_seconds"):
+            _run(runner, _execution("pass", timeout_seconds=timeout))
+
+
+def test_requested_shards_are_capped(tmp_path):
+    runner = LocalProcessRunner(tmp_path, shards=2, max_shards=3)
+    result, _ = _run(runner, _execution("pass", shards=1000))
+    assert len(result.shards) == 3
+    assert LocalProcessRunner(tmp_path, shards=4, max_shards=1).max_shards == 4
+
+
+def test_factory_and_engine_integration(tmp_path):
+    adapter = RunnerFactory.create("local", artifacts_dir=tmp_path)
+    with pytest.raises(ValueError):
+        RunnerFactory.create("warp-drive")
+
+    repo = InMemoryExecutionRepo()
+    engine = ExecutionEngine(repo, runner=as_engine_runner(adapter))
+    ok = repo.create(ExecutionCreate(reservation_id="r", test_suite=_suite("pass")))
+    bad = repo.create(
+        ExecutionCreate(reservation_id="r", test_suite=_suite("raise SystemExit(3)"))
+    )
+    engine.submit(ok.id, "SIL")
+    engine.submit(bad.id, "SIL")
+
+    deadline = time.time() + 10
+    while time.time() < deadline:
+        states = {repo.get(ok.id).status, repo.get(bad.id).status}
+        if not states & {ExecutionStatus.PENDING, ExecutionStatus.RUNNING}:
+            break
+        time.sleep(0.02)
+    engine.shutdown()
+
+    done, failed = repo.get(ok.id), repo.get(bad.id)
+    assert done.status == ExecutionStatus.COMPLETED
+    assert done.artifacts_uri == (tmp_path / ok.id).resolve().as_uri()
+    assert failed.status == ExecutionStatus.FAILED
+    # logs of a failed run are still reachable
+    assert failed.artifacts_uri == (tmp_path / bad.id).resolve().as_uri()
@@ -0,0 +1,159 @@
+"""JSON logging, correlation ids and debug sampling tests."""
+
+import io
+import json
+import logging
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator import deps
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.observability import log
+from orchestrator.observability.log import (
+    DebugSampler,
+    JsonFormatter,
+    correlation_id,
+    execution_id,
+)
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.services.execution_engine import ExecutionEngine
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def json_logs():
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    stream = io.StringIO()
+
+    def lines():
+        log.shutdown()  # flush the listener
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    log.configure(level=logging.DEBUG, stream=stream)
+    yield lines
+    log.shutdown()
+    root.handlers, level = saved
+    root.setLevel(level)
+
+
+def test_json_logging_is_opt_in(monkeypatch):
+    configured = []
+    monkeypatch.setattr(log, "configure", lambda **kw: configured.append(kw))
+    monkeypatch.delenv("ORCHESTRATOR_LOG_FORMAT", raising=False)
+    deps.setup_logging()
+    assert configured == []
+    monkeypatch.setenv("ORCHESTRATOR_LOG_FORMAT", "JSON")
+    monkeypatch.setenv("ORCHESTRATOR_LOG_LEVEL", "debug")
+    deps.setup_logging()
+    assert configured == [{"level": logging.DEBUG, "debug_sample_rate": 1.0}]
+
+
+def test_formatter_fields():
+    record = logging.LogRecord("svc", logging.ERROR, __file__, 1, "x=%d", (3,), None)
+    record.correlation_id = "c1"
+    record.execution_id = None
+    record.bench_type = "SIL"
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["message"] == "x=3" and entry["level"] == "ERROR"
+    assert entry["correlation_id"] == "c1" and "execution_id" not in entry
+    assert entry["bench_type"] == "SIL"
+    assert entry["ts"].endswith("+00:00")
+
+
+def test_records_carry_context_and_tracebacks(json_logs):
+    logger = logging.getLogger("orchestrator.test")
+    token = correlation_id.set("req-1")
+    try:
+        payload = {"n": 1}
+        logger.info("payload %s", payload, extra={"bench_type": "HIL"})
+        payload["n"] = 2  # formatted when logged, not when written
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            logger.exception("failed")
+    finally:
+        correlation_id.reset(token)
+    logger.warning("outside")
+
+    info, error, outside = json_logs()
+    assert info["message"] == "payload {'n': 1}"
+    assert info["correlation_id"] == "req-1" and info["bench_type"] == "HIL"
+    assert "RuntimeError: boom" in error["exc_info"]
+    assert "correlation_id" not in outside
+
+
+def test_debug_sampling_is_per_correlation_id():
+    sampler = DebugSampler(0.5)
+
+    def kept(cid, level=logging.DEBUG, sampler=sampler):
+        record = logging.LogRecord("x", level, __file__, 1, "m", None, None)
+        token = correlation_id.set(cid)
+        try:
+            return sampler.filter(record)
+        finally:
+            correlation_id.reset(token)
+
+    decisions = [kept(f"req-{i}") for i in range(2000)]
+    assert 800 < sum(decisions) < 1200
+    assert [kept(f"req-{i}") for i in range(2000)] == decisions
+    assert all(kept(f"req-{i}", logging.INFO) for i in range(100))
+    assert kept(None)  # outside any request or run
+    assert not kept("req-1", sampler=DebugSampler(0))
+
+
+def test_correlation_header_is_echoed_or_generated():
+    r = client.get("/ping", headers={"X-Correlation-ID": "abc-123"})
+    assert r.headers["x-correlation-id"] == "abc-123"
+
+    generated = client.get("/ping").headers["x-correlation-id"]
+    assert len(generated) == 26
+    assert client.get("/ping").headers["x-correlation-id"] != generated
+
+    bad = client.get("/ping", headers={"X-Correlation-ID": "has space"})
+    assert bad.headers["x-correlation-id"] != "has space"
+    long = client.get("/ping", headers={"X-Correlation-ID": "x" * 129})
+    assert len(long.headers["x-correlation-id"]) == 26
+
+
+def test_request_logs_carry_correlation_id(json_logs):
+    @app.get("/_test/log")
+    def noisy():
+        logging.getLogger("orchestrator.test").info("inside handler")
+        return {}
+
+    try:
+        client.get("/_test/log", headers={"X-Correlation-ID": "trace-me"})
+    finally:
+        app.router.routes.pop()
+    (entry,) = [e for e in json_logs() if e["message"] == "inside handler"]
+    assert entry["correlation_id"] == "trace-me"
+
+
+def test_engine_runs_under_submitting_request_ids(json_logs):
+    seen = []
+    done = threading.Event()
+
+    def runner(ex, cancel):
+        seen.append((correlation_id.get(), execution_id.get()))
+        logging.getLogger("orchestrator.test").info("running")
+        done.set()
+
+    repo = InMemoryExecutionRepo()
+    engine = ExecutionEngine(repo, runner=runner, max_workers=1)
+    ex = repo.create(ExecutionCreate(reservation_id="r"))
+    token = correlation_id.set("submitter")
+    try:
+        engine.submit(ex.id, "SIL")
+    finally:
+        correlation_id.reset(token)
+    assert done.wait(5)
+    engine.shutdown()
+
+    assert seen == [("submitter", ex.id)]
+    (entry,) = [e for e in json_logs() if e["message"] == "running"]
+    assert entry["correlation_id"] == "submitter" and entry["execution_id"] == ex.id
@@ -0,0 +1,152 @@
+"""Metrics registry, instrumentation and /metrics endpoint tests."""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator.main import app
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.observability.metrics import (
+    REPOSITORY_LOCK_WAIT,
+    Counter,
+    Gauge,
+    Histogram,
+    Registry,
+)
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.repository.striped import TimedLock
+from orchestrator.repository.timed import TimedRepository
+from orchestrator.services.execution_engine import ExecutionEngine
+
+client = TestClient(app)
+
+
+def test_text_format():
+    registry = Registry()
+    c = Counter("jobs_total", "Jobs seen.", ("kind",), registry=registry)
+    c.labels("a").inc()
+    c.labels('we"ird\\').inc(2.5)
+    g = Gauge("depth", "Queue depth.", registry=registry)
+    g.set(3)
+    g.dec()
+    h = Histogram("lat_seconds", "Latency.", buckets=(0.1, 1.0), registry=registry)
+    for v in (0.05, 0.1, 0.5, 7):
+        h.observe(v)
+
+    assert registry.render() == (
+        "# HELP jobs_total Jobs seen.\n"
+        "# TYPE jobs_total counter\n"
+        'jobs_total{kind="a"} 1\n'
+        'jobs_total{kind="we\\"ird\\\\"} 2.5\n'
+        "# HELP depth Queue depth.\n"
+        "# TYPE depth gauge\n"
+        "depth 2\n"
+        "# HELP lat_seconds Latency.\n"
+        "# TYPE lat_seconds histogram\n"
+        'lat_seconds_bucket{le="0.1"} 2\n'
+        'lat_seconds_bucket{le="1"} 3\n'
+        'lat_seconds_bucket{le="+Inf"} 4\n'
+        "lat_seconds_sum 7.65\n"
+        "lat_seconds_count 4\n"
+    )
+    with pytest.raises(ValueError):
+        Counter("jobs_total", "again", registry=registry)
+    with pytest.raises(ValueError):
+        c.labels("a", "b")
+
+
+def test_callback_gauge_reads_live_state():
+    registry = Registry()
+    state = {"SIL": 2}
+    g = Gauge("backlog", "b", ("bench_type",), registry=registry)
+    g.set_function(lambda: (((k,), v) for k, v in state.items()))
+    state["HIL"] = 1
+    assert 'backlog{bench_type="HIL"} 1' in registry.render()
+
+
+def test_histogram_is_exact_under_threads():
+    h = Histogram("t", "t", buckets=(1.0,), registry=None)
+
+    def work():
+        for _ in range(10_000):
+            h.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert h.labels().counts == [40_000, 0]
+
+
+def test_timed_lock_reports_only_contention():
+    waits = []
+    lock = TimedLock(waits.append)
+    with lock:
+        pass
+    assert waits == []
+
+    lock.acquire()
+    threading.Timer(0.05, lock.release).start()
+    with lock:
+        pass
+    assert len(waits) == 1 and waits[0] >= 0.03
+
+
+def test_timed_repository_and_lock_wait_metric():
+    registry = Registry()
+    hist = Histogram("ops", "ops", ("repository", "operation"), registry=registry)
+    import orchestrator.repository.timed as timed
+
+    original = timed.REPOSITORY_OPERATION_DURATION
+    timed.REPOSITORY_OPERATION_DURATION = hist
+    try:
+        repo = TimedRepository(InMemoryExecutionRepo(), "executions")
+    finally:
+        timed.REPOSITORY_OPERATION_DURATION = original
+    ex = repo.create(ExecutionCreate(reservation_id="r"))
+    assert repo.get(ex.id).id == ex.id
+    text = registry.render()
+    assert 'ops_count{repository="executions",operation="create"} 1' in text
+    assert 'ops_count{repository="executions",operation="get"} 1' in text
+    assert isinstance(REPOSITORY_LOCK_WAIT.labels("executions").sum, float)
+
+
+def test_engine_reports_queue_depth():
+    release = threading.Event()
+    repo = InMemoryExecutionRepo()
+    engine = ExecutionEngine(
+        repo, runner=lambda ex, cancel: release.wait(5) and None, max_workers=1
+    )
+    ids = [repo.create(ExecutionCreate(reservation_id="r")).id for _ in range(3)]
+    for eid in ids:
+        engine.submit(eid, "SIL")
+    deadline = time.time() + 5
+    while engine.running() != {"SIL": 1} and time.time() < deadline:
+        time.sleep(0.01)
+    assert engine.queued() == {"SIL": 2}
+    release.set()
+    engine.shutdown()
+
+
+def test_metrics_endpoint():
+    client.get("/ping")
+    client.get("/no/such/route")
+    r = client.post("/executions", json={"reservation_id": "metrics-test"})
+    client.post(f"/executions/{r.json()['id']}/stop")
+
+    res = client.get("/metrics")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = res.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/ping",status="200"}'
+        in text
+    )
+    assert 'route="<unmatched>",status="404"' in text
+    assert 'route="/executions/{execution_id}/stop"' in text
+    assert 'repository_operation_duration_seconds_count{repository="executions"' in text
+    assert 'execution_transitions_total{status="PENDING"}' in text
+    assert "# TYPE queue_backlog gauge" in text
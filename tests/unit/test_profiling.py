@@ -0,0 +1,150 @@
+"""Request profiler and admin profile endpoint tests."""
+
+import asyncio
+import sys
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator import deps
+from orchestrator.main import app
+from orchestrator.observability.profiling import (
+    Profiler,
+    attribute,
+    attribute_steps,
+)
+
+client = TestClient(app)
+TOKEN = "s3cret"
+
+
+def _burn_profiled(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def _burn_other(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def test_samples_only_the_profiled_context():
+    profiler = Profiler(interval=0.001)
+
+    async def work(burn):
+        for _ in range(20):
+            burn(0.005)
+            await asyncio.sleep(0)
+        await asyncio.to_thread(attribute(burn), 0.05)
+
+    async def profiled():
+        with profiler.profile("GET", "/x"):
+            await attribute_steps(work(_burn_profiled))
+
+    async def scenario():
+        await asyncio.gather(profiled(), attribute_steps(work(_burn_other)))
+
+    asyncio.run(scenario())
+    (profile,) = profiler.profiles()
+    text = profile.collapsed()
+    assert profile.samples > 0 and profile.duration_ms > 0
+    assert "_burn_profiled" in text and "_burn_other" not in text
+    # frames below the attaching call (event loop, pool worker) are dropped
+    assert "run_forever" not in text and "_worker" not in text
+    assert "work" in text
+    for line in text.splitlines():
+        stack, n = line.rsplit(" ", 1)
+        assert int(n) > 0 and stack
+
+
+def test_leaves_the_switch_interval_alone():
+    before = sys.getswitchinterval()
+    with Profiler(interval=0.0001).profile("GET", "/x"):
+        _burn_profiled(0.01)
+        assert sys.getswitchinterval() == before
+
+
+def test_attribute_passes_through_outside_a_profile():
+    calls = []
+    wrapped = attribute(lambda x: calls.append(x) or x)
+    assert wrapped(1) == 1 and calls == [1]
+
+
+def test_keeps_last_n_and_samples_one_in_n():
+    profiler = Profiler(keep=2, sample_every=3)
+    assert [profiler.sampled() for _ in range(6)] == [False, False, True] * 2
+    ids = []
+    for i in range(3):
+        with profiler.profile("GET", f"/{i}") as p:
+            ids.append(p.id)
+    assert [p.id for p in profiler.profiles()] == ids[:0:-1]
+    assert profiler.get(ids[0]) is None
+    assert not Profiler().sampled()
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    profiler = Profiler(interval=0.001, token=TOKEN)
+    monkeypatch.setattr(deps, "_profiler", profiler)
+    monkeypatch.setattr(deps, "_profiler_loaded", True)
+
+    @app.get("/_test/slow")
+    def slow():
+        _burn_profiled(0.1)
+        return {}
+
+    yield profiler
+    app.router.routes.pop()
+
+
+def test_x_profile_header_captures_request(profiler):
+    client.get("/_test/slow")
+    client.get("/_test/slow", headers={"X-Profile": "wrong"})
+    assert profiler.profiles() == []
+
+    client.get("/_test/slow", headers={"X-Profile": TOKEN})
+    admin = {"X-Admin-Token": TOKEN}
+    listed = client.get("/admin/profiles", headers=admin).json()
+    assert len(listed) == 1
+    summary = listed[0]
+    assert summary["route"] == "/_test/slow" and summary["status"] == 200
+    assert summary["duration_ms"] >= 100 and summary["samples"] > 0
+
+    r = client.get(f"/admin/profiles/{summary['id']}", headers=admin)
+    assert r.status_code == 200 and r.headers["content-type"].startswith("text/plain")
+    assert "_burn_profiled" in r.text
+    assert client.get("/admin/profiles/nope", headers=admin).status_code == 404
+
+    client.get("/_test/slow", headers={"X-Profile": TOKEN})
+    client.get("/ping", headers={"X-Profile": TOKEN})
+    merged = client.get(
+        "/admin/profiles:merged", params={"route": "/_test/slow"}, headers=admin
+    ).text
+    samples = sum(int(line.rsplit(" ", 1)[1]) for line in merged.splitlines())
+    assert samples == sum(
+        p.samples for p in profiler.profiles() if p.route == "/_test/slow"
+    )
+    assert "ping" not in merged
+
+
+def test_admin_endpoints_need_the_token(profiler):
+    assert client.get("/admin/profiles").status_code == 403
+    bad = client.get("/admin/profiles", headers={"X-Admin-Token": "no"})
+    assert bad.status_code == 403
+
+    profiler.token = None
+    r = client.get("/admin/profiles", headers={"X-Admin-Token": TOKEN})
+    assert r.status_code == 404
+
+
+def test_profiling_off_by_default(monkeypatch):
+    monkeypatch.setattr(deps, "_profiler", None)
+    monkeypatch.setattr(deps, "_profiler_loaded", False)
+    monkeypatch.delenv("ORCHESTRATOR_ADMIN_TOKEN", raising=False)
+    monkeypatch.delenv("ORCHESTRATOR_PROFILE_SAMPLE_EVERY", raising=False)
+    assert deps.get_profiler() is None
+    assert client.get("/ping", headers={"X-Profile": TOKEN}).status_code == 200
+    assert client.get("/admin/profiles").status_code == 404
@@ -46,3 +46,95 @@ def test_create_get_list_delete_reservation():
     # confirm 404 after delete
     r = client.get(f"/reservations/{rid}")
     assert r.status_code == 404
+
+
+def test_overlapping_reservation_conflicts():
+    start = datetime.utcnow() + timedelta(days=30)
+    payload = {
+        "user_id": "bob",
+        "bench_type": "SIL-conflict",
+        "start": iso(start),
+        "end": iso(start + timedelta(hours=2)),
+    }
+    r = client.post("/reservations", json=payload)
+    assert r.status_code == 201
+    rid = r.json()["id"]
+
+    # overlapping window on the same bench type is rejected
+    clash = dict(payload, start=iso(start + timedelta(hours=1)))
+    clash["end"] = iso(start + timedelta(hours=3))
+    r = client.post("/reservations", json=clash)
+    assert r.status_code == 409
+    assert rid in r.json()["detail"]
+
+    # back-to-back window and other bench types are fine
+    adjacent = dict(payload, start=payload["end"])
+    adjacent["end"] = iso(start + timedelta(hours=3))
+    r = client.post("/reservations", json=adjacent)
+    assert r.status_code == 201
+    r = client.post("/reservations", json=dict(clash, bench_type="HIL-conflict"))
+    assert r.status_code == 201
+
+    # deleting frees the window again
+    assert client.delete(f"/reservations/{rid}").status_code == 204
+    r = client.post("/reservations", json=payload)
+    assert r.status_code == 201
+
+
+def test_list_reservations_cursor_and_filters():
+    base = datetime.utcnow() + timedelta(days=60)
+    ids = []
+    for i in range(5):
+        start = base + timedelta(hours=i)
+        r = client.post(
+            "/reservations",
+            json={
+                "user_id": "res-pager" if i % 2 == 0 else "res-other",
+                "bench_type": "SIL-page",
+                "start": iso(start),
+                "end": iso(start + timedelta(hours=1)),
+            },
+        )
+        assert r.status_code == 201
+        ids.append(r.json()["id"])
+
+    r = client.get("/reservations", params={"bench_type": "SIL-page", "limit": 2})
+    first = [it["id"] for it in r.json()]
+    assert first == ids[:2]
+    r = client.get(
+        "/reservations",
+        params={"bench_type": "SIL-page", "limit": 10, "after": first[-1]},
+    )
+    assert [it["id"] for it in r.json()] == ids[2:]
+
+    r = client.get("/reservations", params={"user_id": "res-pager", "limit": 10})
+    assert [it["id"] for it in r.json()] == ids[0::2]
+
+    r = client.get("/reservations", params={"after": "missing"})
+    assert r.status_code == 400
+
+
+def test_batch_create_and_delete_reservations():
+    start = datetime.utcnow() + timedelta(days=90)
+
+    def item(hours):
+        return {
+            "user_id": "batcher",
+            "bench_type": "SIL-batch",
+            "start": iso(start + timedelta(hours=hours)),
+            "end": iso(start + timedelta(hours=hours + 1)),
+        }
+
+    # third item overlaps the first one in the same batch
+    r = client.post("/reservations:batch", json={"items": [item(0), item(1), item(0)]})
+    assert r.status_code == 201
+    results = r.json()["results"]
+    assert [it["status"] for it in results] == [201, 201, 409]
+    assert results[0]["id"] in results[2]["detail"]
+    ids = [it["id"] for it in results[:2]]
+    assert client.get(f"/reservations/{ids[1]}").status_code == 200
+
+    r = client.request("DELETE", "/reservations:batch", json={"ids": ids + ["nope"]})
+    assert r.status_code == 200
+    assert [it["status"] for it in r.json()["results"]] == [204, 204, 404]
+    assert client.get(f"/reservations/{ids[0]}").status_code == 404
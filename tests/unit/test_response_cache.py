@@ -0,0 +1,116 @@
+"""Response cache, ETags and conditional GETs of single records."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+
+from orchestrator import deps
+from orchestrator.main import app
+from orchestrator.services.response_cache import ResponseCache
+
+client = TestClient(app)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResponseCache(max_entries=100, ttl=60)
+    monkeypatch.setattr(deps, "_response_cache", cache)
+    monkeypatch.setattr(deps, "_response_cache_loaded", True)
+    return cache
+
+
+def _reservation(hours):
+    start = datetime(2098, 1, 1, tzinfo=timezone.utc) + timedelta(hours=hours)
+    body = {
+        "user_id": "etag",
+        "bench_type": "ETAG",
+        "start": start.isoformat(),
+        "end": (start + timedelta(hours=1)).isoformat(),
+    }
+    return client.post("/reservations", json=body).json()["id"]
+
+
+def test_lru_and_ttl():
+    clock = Clock()
+    cache = ResponseCache(max_entries=2, ttl=10, clock=clock)
+    for key in "abc":
+        cache.put(key, f'"{key}"', key.encode(), cache.token())
+    assert cache.get("a") is None and len(cache) == 2
+    assert cache.get("b").body == b"b"
+    cache.put("d", '"d"', b"d", cache.token())
+    assert cache.get("c") is None and cache.get("b") is not None
+    clock.now = 10
+    assert cache.get("b") is None
+
+
+def test_put_after_invalidation_is_refused():
+    cache = ResponseCache(max_entries=2, ttl=10)
+    token = cache.token()
+    cache.invalidate("a")  # a write landed while "a" was being read
+    cache.put("a", '"old"', b"old", token)
+    assert cache.get("a") is None
+    cache.put("a", '"new"', b"new", cache.token())
+    assert cache.get("a").body == b"new"
+
+    stale = cache.token()
+    for key in "xyz":  # "x" falls out of the invalidation memory
+        cache.invalidate(key)
+    cache.put("x", '"old"', b"old", stale)
+    assert cache.get("x") is None
+
+
+def test_etag_and_not_modified(cache):
+    eid = client.post("/executions", json={"reservation_id": "r-etag"}).json()["id"]
+    first = client.get(f"/executions/{eid}")
+    assert first.status_code == 200
+    tag = first.headers["etag"]
+    assert tag.startswith('"1-')
+    assert first.json()["id"] == eid
+
+    for header in (tag, f"W/{tag}", f'"nope", {tag}', "*"):
+        again = client.get(f"/executions/{eid}", headers={"If-None-Match": header})
+        assert again.status_code == 304, header
+        assert again.content == b"" and again.headers["etag"] == tag
+    assert client.get(f"/executions/{eid}", headers={"If-None-Match": '"x"'}).json()
+
+
+def test_writes_invalidate_the_cached_body(cache):
+    eid = client.post("/executions", json={"reservation_id": "r-etag"}).json()["id"]
+    tag = client.get(f"/executions/{eid}").headers["etag"]
+    assert len(cache) == 1
+    deps.get_execution_repo().update(eid, test_suite="smoke")
+    assert len(cache) == 0
+    fresh = client.get(f"/executions/{eid}", headers={"If-None-Match": tag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"].startswith('"2-')
+    assert fresh.json()["test_suite"] == "smoke"
+
+
+def test_reservation_delete_invalidates(cache):
+    rid, other = _reservation(0), _reservation(1)
+    for r in (rid, other):
+        assert client.get(f"/reservations/{r}").headers["etag"].startswith('"1-')
+    assert len(cache) == 2
+    assert client.delete(f"/reservations/{rid}").status_code == 204
+    assert client.get(f"/reservations/{rid}").status_code == 404
+    client.request("DELETE", "/reservations:batch", json={"ids": [other]})
+    assert client.get(f"/reservations/{other}").status_code == 404
+
+
+def test_without_cache_etags_still_work(monkeypatch):
+    monkeypatch.setattr(deps, "_response_cache", None)
+    monkeypatch.setattr(deps, "_response_cache_loaded", True)
+    rid = _reservation(2)
+    tag = client.get(f"/reservations/{rid}").headers["etag"]
+    r = client.get(f"/reservations/{rid}", headers={"If-None-Match": tag})
+    assert r.status_code == 304
+    assert client.get("/reservations/missing").status_code == 404
@@ -0,0 +1,198 @@
+"""Bench pool capacity scheduling tests."""
+
+from datetime import datetime, timedelta, timezone
+import random
+
+import pytest
+
+from orchestrator.main import app
+from orchestrator.models.reservation import ReservationCreate
+from orchestrator.repository.base import ReservationConflictError
+from orchestrator.repository.in_memory import InMemoryReservationRepo
+from orchestrator.repository.sqlite import SQLiteDatabase, SQLiteReservationRepo
+from orchestrator.scheduler import BenchPool, CapacityScheduler, best_fit
+from fastapi.testclient import TestClient
+
+client = TestClient(app)
+
+START = datetime(2031, 3, 1, tzinfo=timezone.utc)
+
+
+def test_pool_of_size_and_unpooled_types():
+    pool = BenchPool.of_size({"SIL": 3})
+    assert pool.benches("SIL") == ("SIL-01", "SIL-02", "SIL-03")
+    assert pool.benches("HIL") == (None,)
+    assert pool.inventory() == {"SIL": ["SIL-01", "SIL-02", "SIL-03"]}
+
+
+def test_assign_fills_benches_then_conflicts():
+    sched = CapacityScheduler(BenchPool.of_size({"SIL": 2}))
+    assert sched.assign("SIL", 0, 10, "a") == "SIL-01"
+    assert sched.assign("SIL", 5, 15, "b") == "SIL-02"
+    with pytest.raises(ReservationConflictError) as exc:
+        sched.assign("SIL", 8, 12, "c")
+    assert exc.value.conflicting_id == "a"
+    assert sorted(sched.overlapping("SIL", 8, 12)) == ["a", "b"]
+
+    assert sched.release("SIL", "SIL-01", 0, "a")
+    assert sched.assign("SIL", 8, 12, "c") == "SIL-01"
+
+
+def test_assign_prefers_tightest_gap():
+    sched = CapacityScheduler(BenchPool.of_size({"SIL": 2}))
+    assert sched.assign("SIL", 0, 10, "a") == "SIL-01"
+    assert sched.assign("SIL", 5, 15, "b") == "SIL-02"
+    # both gaps open-ended: hug the booking ending closest before the start
+    assert sched.assign("SIL", 20, 30, "c") == "SIL-02"
+    # SIL-02 gap [15, 20) is bounded, SIL-01 gap [10, inf) is not
+    assert sched.assign("SIL", 16, 19, "d") == "SIL-02"
+    assert sched.assign("SIL", 40, 50, "e") == "SIL-02"
+    assert sched.assign("SIL", 11, 12, "f") == "SIL-01"
+
+
+def test_next_slot_across_benches():
+    sched = CapacityScheduler(BenchPool.of_size({"SIL": 2}))
+    sched.assign("SIL", 0, 10, "a")
+    sched.assign("SIL", 12, 20, "b")
+    sched.assign("SIL", 0, 15, "c")
+    # SIL-01 has a 2-long gap at 10, SIL-02 is free from 15
+    assert sched.next_slot("SIL", 2, 0) == (10, "SIL-01")
+    assert sched.next_slot("SIL", 3, 0) == (15, "SIL-02")
+    assert sched.next_slot("SIL", 3, 30) == (30, "SIL-01")
+    assert sched.next_slot("HIL", 3, 7) == (7, None)
+
+
+def test_scheduler_matches_a_scan_of_every_bench():
+    # the frontier only narrows which benches are looked at: the answers are
+    # those of checking every bench of the pool
+    rng = random.Random(7)
+    sched = CapacityScheduler(BenchPool.of_size({"SIL": 6}))
+    benches = sched.pool.benches("SIL")
+    calendars = sched._calendars
+    booked = {}
+    for n in range(600):
+        if booked and rng.random() < 0.3:
+            rid = rng.choice(sorted(booked))
+            bench_id, start = booked.pop(rid)
+            assert sched.release("SIL", bench_id, start, rid)
+            continue
+        start = rng.randrange(200)
+        end = start + rng.randrange(1, 20)
+        gaps = []
+        for bench_id in benches:
+            gap = calendars.free_gap(("SIL", bench_id), start, end)
+            if gap is not None:
+                gaps.append((bench_id, gap[0], gap[1]))
+        rid = f"r{n}"
+        if not gaps:
+            with pytest.raises(ReservationConflictError):
+                sched.assign("SIL", start, end, rid)
+        else:
+            bench_id = sched.assign("SIL", start, end, rid)
+            assert bench_id == best_fit(start, gaps)
+            booked[rid] = (bench_id, start)
+
+        length, not_before = rng.randrange(1, 30), rng.randrange(220)
+        slot, bench_id = sched.next_slot("SIL", length, not_before)
+        assert slot == min(
+            calendars.first_fit(("SIL", b), not_before, length) for b in benches
+        )
+        assert calendars.free_gap(("SIL", bench_id), slot, slot + length)
+
+
+def _create(bench, hours, length=1):
+    start = START + timedelta(hours=hours)
+    return ReservationCreate(
+        user_id="sched",
+        bench_type=bench,
+        start=start,
+        end=start + timedelta(hours=length),
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def repo(request, tmp_path):
+    pool = BenchPool.of_size({"SIL": 2})
+    if request.param == "memory":
+        yield InMemoryReservationRepo(pool=pool)
+        return
+    db = SQLiteDatabase(str(tmp_path / "orchestrator.db"))
+    yield SQLiteReservationRepo(db, pool)
+    db.close()
+
+
+def test_repo_assigns_benches_and_finds_slots(repo):
+    a = repo.create(_create("SIL", 0, length=2))
+    b = repo.create(_create("SIL", 1, length=2))
+    assert (a.bench_id, b.bench_id) == ("SIL-01", "SIL-02")
+    assert repo.get(b.id).bench_id == "SIL-02"
+    with pytest.raises(ReservationConflictError):
+        repo.create(_create("SIL", 1))
+    assert [
+        r.id for r in repo.find_overlapping("SIL", START, START + timedelta(hours=5))
+    ] == [
+        a.id,
+        b.id,
+    ]
+
+    # SIL-02 is still free for the hour before b starts
+    slot = repo.next_slot("SIL", timedelta(hours=1), START)
+    assert (slot.bench_id, slot.start, slot.end) == (
+        "SIL-02",
+        START,
+        START + timedelta(hours=1),
+    )
+    slot = repo.next_slot("SIL", timedelta(hours=2), START)
+    assert (slot.bench_id, slot.start) == ("SIL-01", START + timedelta(hours=2))
+
+    assert repo.delete(a.id)
+    slot = repo.next_slot("SIL", timedelta(hours=1), START)
+    assert (slot.bench_id, slot.start) == ("SIL-01", START)
+
+    # a type without a pool is a single bench
+    solo = repo.create(_create("XIL", 0))
+    assert solo.bench_id is None
+    with pytest.raises(ReservationConflictError):
+        repo.create(_create("XIL", 0))
+
+
+def test_next_slot_endpoint():
+    bench = "NEXTSLOT"
+    start = START + timedelta(days=30)
+    r = client.post(
+        "/reservations",
+        json={
+            "user_id": "slotter",
+            "bench_type": bench,
+            "start": start.isoformat(),
+            "end": (start + timedelta(hours=1)).isoformat(),
+        },
+    )
+    assert r.status_code == 201
+    r = client.get(
+        "/reservations/next-slot",
+        params={
+            "bench_type": bench,
+            "duration_seconds": 1800,
+            "not_before": (start + timedelta(minutes=10)).isoformat(),
+        },
+    )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["bench_type"] == bench and body["bench_id"] is None
+    got = datetime.fromisoformat(body["start"].replace("Z", "+00:00"))
+    assert got == start + timedelta(hours=1)
+
+    r = client.get(
+        "/reservations/next-slot", params={"bench_type": bench, "duration_seconds": 0}
+    )
+    assert r.status_code == 422
+
+
+def test_next_slot_rejects_out_of_range_windows():
+    def get(**params):
+        params.setdefault("bench_type", "NEXTSLOT")
+        return client.get("/reservations/next-slot", params=params).status_code
+
+    assert get(duration_seconds=10**12) == 422
+    assert get(duration_seconds=3600, not_before="9999-12-31T23:30:00+00:00") == 400
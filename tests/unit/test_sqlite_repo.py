@@ -0,0 +1,139 @@
+"""SQLite repository backend tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.models.reservation import ReservationCreate
+from orchestrator.repository.base import ReservationConflictError
+from orchestrator.repository.keyset import InvalidCursorError
+from orchestrator.repository.sqlite import (
+    SQLiteDatabase,
+    SQLiteExecutionRepo,
+    SQLiteReservationRepo,
+)
+
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db(tmp_path):
+    database = SQLiteDatabase(str(tmp_path / "orchestrator.db"))
+    yield database
+    database.close()
+
+
+def _reservation(bench="SIL", hours=0, length=1, user="u"):
+    start = START + timedelta(hours=hours)
+    return ReservationCreate(
+        user_id=user,
+        bench_type=bench,
+        start=start,
+        end=start + timedelta(hours=length),
+    )
+
+
+def test_wal_mode_enabled(db):
+    mode = db.connection().execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+def test_reservation_crud_conflict_and_overlap(db):
+    repo = SQLiteReservationRepo(db)
+    a = repo.create(_reservation(hours=0))
+    b = repo.create(_reservation(hours=1))
+    repo.create(_reservation(bench="HIL", hours=0))
+
+    with pytest.raises(ReservationConflictError) as exc:
+        repo.create(_reservation(hours=1, length=2))
+    assert exc.value.conflicting_id == b.id
+
+    assert repo.get(a.id) == a
+    found = repo.find_overlapping("SIL", START, START + timedelta(minutes=90))
+    assert [r.id for r in found] == [a.id, b.id]
+    assert (
+        repo.find_overlapping(
+            "SIL", START + timedelta(hours=2), START + timedelta(days=1)
+        )
+        == []
+    )
+
+    assert repo.delete(a.id)
+    assert not repo.delete(a.id)
+    assert repo.get(a.id) is None
+    repo.create(_reservation(hours=0))
+
+
+def test_reservation_list_pages_and_filters(db):
+    repo = SQLiteReservationRepo(db)
+    ids = [repo.create(_reservation(hours=i, user=f"u{i % 2}")).id for i in range(5)]
+    assert [r.id for r in repo.list(limit=2)] == ids[:2]
+    assert [r.id for r in repo.list(limit=10, after=ids[1])] == ids[2:]
+    assert [r.id for r in repo.list(user_id="u0")] == ids[0::2]
+    with pytest.raises(InvalidCursorError):
+        repo.list(after="missing")
+
+
+def test_execution_update_filters_and_durability(db, tmp_path):
+    repo = SQLiteExecutionRepo(db)
+    ids = [repo.create(ExecutionCreate(reservation_id="r1")).id for _ in range(3)]
+    repo.create(ExecutionCreate(reservation_id="r2"))
+
+    updated = repo.update(ids[1], status=ExecutionStatus.RUNNING)
+    assert updated.status == ExecutionStatus.RUNNING
+    assert repo.update("missing", status=ExecutionStatus.RUNNING) is None
+
+    running = repo.list(status=ExecutionStatus.RUNNING)
+    assert [e.id for e in running] == [ids[1]]
+    pending = repo.list(status=ExecutionStatus.PENDING, reservation_id="r1")
+    assert [e.id for e in pending] == [ids[0], ids[2]]
+
+    # a second handle on the same file sees the committed state
+    other = SQLiteExecutionRepo(SQLiteDatabase(db.path))
+    assert other.get(ids[1]).status == ExecutionStatus.RUNNING
+    assert other.delete(ids[0])
+    assert repo.get(ids[0]) is None
+
+
+def test_concurrent_writers_use_own_connections(db):
+    repo = SQLiteExecutionRepo(db)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        created = list(
+            pool.map(
+                lambda i: repo.create(ExecutionCreate(reservation_id=f"r{i}")).id,
+                range(64),
+            )
+        )
+    assert len(set(created)) == 64
+    assert len(list(repo.list(limit=1000))) == 64
+
+
+def test_batch_create_and_delete(db):
+    reservations = SQLiteReservationRepo(db)
+    results = reservations.create_many(
+        [_reservation(hours=0), _reservation(hours=1), _reservation(hours=0)]
+    )
+    assert isinstance(results[2], ReservationConflictError)
+    assert results[2].conflicting_id == results[0].id
+    assert reservations.delete_many([results[0].id, "missing"]) == [True, False]
+
+    executions = SQLiteExecutionRepo(db)
+    created = executions.create_many(
+        [ExecutionCreate(reservation_id="r1") for _ in range(3)]
+    )
+    assert [e.id for e in executions.list(reservation_id="r1")] == sorted(
+        e.id for e in created
+    )
+
+
+def test_created_between_scans_id_range(db):
+    repo = SQLiteExecutionRepo(db)
+    created = [repo.create(ExecutionCreate(reservation_id="r")) for _ in range(3)]
+    lo, hi = created[0].created_at, created[-1].created_at + timedelta(seconds=1)
+    window = repo.created_between(lo - timedelta(seconds=1), hi, limit=2)
+    assert [e.id for e in window] == [e.id for e in created[:2]]
+    rest = repo.created_between(lo - timedelta(seconds=1), hi, after=window[-1].id)
+    assert [e.id for e in rest] == [created[2].id]
+    assert list(repo.created_between(hi, hi + timedelta(days=1))) == []
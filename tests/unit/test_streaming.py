@@ -0,0 +1,28 @@
+"""NDJSON export streaming tests."""
+
+import json
+
+from orchestrator.api.streaming import iter_ndjson
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+
+
+def test_iter_ndjson_walks_all_pages_in_order():
+    repo = InMemoryExecutionRepo()
+    ids = [repo.create(ExecutionCreate(reservation_id="r")).id for _ in range(5)]
+    calls = []
+
+    def fetch(limit, after):
+        calls.append(after)
+        return list(repo.list(limit=limit, after=after))
+
+    chunks = list(iter_ndjson(fetch, chunk_size=2))
+    assert len(chunks) == 3
+    rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+    assert [row["id"] for row in rows] == [e.id for e in repo.list(limit=10)]
+    assert sorted(ids) == sorted(row["id"] for row in rows)
+    assert calls[0] is None and len(calls) == 3
+
+
+def test_iter_ndjson_empty():
+    assert list(iter_ndjson(lambda limit, after: [], chunk_size=2)) == []
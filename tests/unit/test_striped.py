@@ -0,0 +1,67 @@
+"""Striped store and concurrent in-memory repository tests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from orchestrator.models.execution import ExecutionCreate
+from orchestrator.models.reservation import ReservationCreate
+from orchestrator.repository.base import ReservationConflictError
+from orchestrator.repository.in_memory import InMemoryReservationRepo
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.repository.striped import LockStripes, StripedStore
+
+
+def test_striped_store_basics():
+    store = StripedStore(stripes=4)
+    for i in range(10):
+        with store.lock(f"k{i}"):
+            store.put(f"k{i}", i)
+    assert len(store) == 10
+    assert store.get("k3") == 3
+    assert store.get("missing") is None
+    with store.lock("k3"):
+        assert store.pop("k3") == 3
+    assert sorted(store.values()) == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+
+
+def test_lock_stripes_are_stable():
+    locks = LockStripes(stripes=4)
+    assert locks("SIL") is locks("SIL")
+
+
+def test_concurrent_execution_creates_are_all_indexed():
+    repo = InMemoryExecutionRepo(stripes=4)
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        ids = list(
+            pool.map(
+                lambda i: repo.create(ExecutionCreate(reservation_id=f"r{i % 3}")).id,
+                range(300),
+            )
+        )
+    assert len(set(ids)) == 300
+    assert len(list(repo.list(limit=1000))) == 300
+    assert len(list(repo.list(limit=1000, reservation_id="r0"))) == 100
+
+
+def test_concurrent_reservations_admit_one_per_window():
+    repo = InMemoryReservationRepo(stripes=4)
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    def book(i):
+        bench = f"B{i % 4}"
+        try:
+            repo.create(
+                ReservationCreate(
+                    user_id="u",
+                    bench_type=bench,
+                    start=start,
+                    end=start + timedelta(hours=1),
+                )
+            )
+            return bench
+        except ReservationConflictError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        won = [b for b in pool.map(book, range(64)) if b]
+    assert sorted(won) == ["B0", "B1", "B2", "B3"]
@@ -0,0 +1,102 @@
+"""In-memory task queue tests (ADR-006)."""
+
+from orchestrator.queue import InMemoryTaskQueue, TaskEnvelope, TaskType
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _queue(**kwargs):
+    clock = FakeClock()
+    return InMemoryTaskQueue(clock=clock, **kwargs), clock
+
+
+def _task(**kwargs):
+    return TaskEnvelope(execution_id="e1", type=TaskType.RUN, **kwargs)
+
+
+def test_push_receive_ack_in_visibility_order():
+    q, clock = _queue()
+    later, first = _task(), _task()
+    q.push(later, delay=5)
+    q.push(first)
+
+    msgs = q.receive(max_messages=10)
+    assert [m.task.task_id for m in msgs] == [first.task_id]
+    assert msgs[0].task.attempt == 1
+    assert q.ack(msgs[0].receipt)
+    assert not q.ack(msgs[0].receipt)
+
+    clock.now = 5
+    assert [m.task.task_id for m in q.receive()] == [later.task_id]
+    assert len(q) == 1
+
+
+def test_batch_receive_limits_count():
+    q, _ = _queue()
+    for _ in range(5):
+        q.push(_task())
+    assert len(q.receive(max_messages=3)) == 3
+    assert len(q.receive(max_messages=3)) == 2
+    assert q.receive(max_messages=3) == []
+
+
+def test_visibility_timeout_redelivers_and_stales_old_receipt():
+    q, clock = _queue(visibility_timeout=10)
+    q.push(_task())
+    first = q.receive()[0]
+    clock.now = 9
+    assert q.receive() == []
+    assert q.extend_visibility(first.receipt, 5)
+    clock.now = 13
+    assert q.receive() == []
+    clock.now = 14
+    second = q.receive()[0]
+    assert second.task.attempt == 2
+    assert not q.ack(first.receipt)
+    assert q.ack(second.receipt)
+
+
+def test_nack_backs_off_then_dead_letters():
+    q, clock = _queue(backoff_base=1.0, backoff_max=3.0)
+    task = _task(max_attempts=3)
+    q.push(task)
+
+    msg = q.receive()[0]
+    assert q.nack(msg.receipt)
+    assert q.receive() == []
+    clock.now = 1
+    msg = q.receive()[0]
+    assert q.nack(msg.receipt)
+    clock.now = 2.5
+    assert q.receive() == []
+    clock.now = 3
+    msg = q.receive()[0]
+    assert msg.task.attempt == 3
+    assert q.nack(msg.receipt)
+
+    assert len(q) == 0
+    assert [t.task_id for t in q.dead_letters()] == [task.task_id]
+    assert q.backoff(10) == 3.0
+
+
+def test_expired_final_attempt_goes_to_dlq():
+    q, clock = _queue(visibility_timeout=1)
+    task = _task(max_attempts=1)
+    q.push(task)
+    q.receive()
+    clock.now = 1
+    assert q.receive() == []
+    assert q.dead_letters()[0].task_id == task.task_id
+
+
+def test_envelope_to_dict_is_json_ready():
+    data = _task(payload={"suite": "smoke"}).to_dict()
+    assert data["type"] == "run"
+    assert isinstance(data["created_at"], str)
+    assert data["payload"] == {"suite": "smoke"}
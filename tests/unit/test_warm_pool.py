@@ -0,0 +1,141 @@
+"""Warm runner pool tests against a slow-provisioning mock backend."""
+
+import asyncio
+import time
+from threading import Event
+
+from orchestrator.models.execution import ExecutionCreate, ExecutionStatus
+from orchestrator.observability.metrics import WARM_POOL_ACQUIRE_DURATION
+from orchestrator.repository.in_memory_execution import InMemoryExecutionRepo
+from orchestrator.runners import (
+    LocalMockRunner,
+    MockSlotProvider,
+    WarmPool,
+    as_engine_runner,
+    run_lifecycle,
+)
+from orchestrator.services.execution_engine import ExecutionEngine
+
+PROVISION = 0.3
+
+
+def _timed_acquire(pool, bench_type):
+    t0 = time.perf_counter()
+    slot = asyncio.run(pool.acquire(bench_type))
+    return slot, time.perf_counter() - t0
+
+
+def test_hit_is_fast_and_pool_refills():
+    provider = MockSlotProvider(PROVISION)
+    pool = WarmPool(provider, {"SIL": 2})
+    try:
+        assert pool.wait_ready(5)
+        slot, elapsed = _timed_acquire(pool, "SIL")
+        assert slot.warm and elapsed < PROVISION / 3
+        assert pool.wait_ready(5)  # topped back up in the background
+        stats = pool.stats()
+        assert (stats.hits, stats.misses) == (1, 0)
+        assert stats.ready == {"SIL": 2}
+        assert stats.acquire_count == 1 and stats.acquire_p99 < PROVISION / 3
+    finally:
+        pool.close()
+
+
+def test_miss_provisions_on_demand():
+    provider = MockSlotProvider(PROVISION)
+    pool = WarmPool(provider, {"SIL": 1})
+    try:
+        # unpooled bench type: always a cold start
+        slot, elapsed = _timed_acquire(pool, "HIL")
+        assert not slot.warm and elapsed >= PROVISION * 0.9
+        # pooled type drained faster than it refills
+        assert pool.wait_ready(5)
+        first, _ = _timed_acquire(pool, "SIL")
+        second, elapsed = _timed_acquire(pool, "SIL")
+        assert first.warm and not second.warm
+        stats = pool.stats()
+        assert (stats.hits, stats.misses) == (1, 2)
+    finally:
+        pool.close()
+
+
+def test_acquire_latency_is_observed_per_bench_type():
+    pool = WarmPool(MockSlotProvider(0.0), {})
+    acquired = WARM_POOL_ACQUIRE_DURATION.labels("ACQ")
+    before = sum(acquired.counts)
+    try:
+        asyncio.run(pool.acquire("ACQ"))
+        asyncio.run(pool.acquire("ACQ"))
+    finally:
+        pool.close()
+    assert sum(acquired.counts) == before + 2
+
+
+def test_release_reuses_until_full_and_close_destroys_idle():
+    provider = MockSlotProvider(0.0)
+    pool = WarmPool(provider, {"SIL": 1})
+    assert pool.wait_ready(5)
+    slot = asyncio.run(pool.acquire("SIL"))
+    assert pool.wait_ready(5)
+    # pool already refilled: the returned slot is surplus
+    asyncio.run(pool.release(slot))
+    assert provider.destroyed == 1
+    assert pool.stats().ready == {"SIL": 1}
+    pool.close()
+    assert provider.destroyed == 2
+    assert provider.created == 2
+
+
+def test_failed_provisioning_is_retried():
+    class Flaky(MockSlotProvider):
+        async def create(self, bench_type):
+            if self.created == 0:
+                self.created += 1
+                raise RuntimeError("capacity error")
+            return await super().create(bench_type)
+
+    pool = WarmPool(Flaky(), {"SIL": 1}, retry_seconds=0.05)
+    try:
+        assert pool.wait_ready(5)
+    finally:
+        pool.close()
+
+
+def test_mock_runner_uses_pool_through_engine():
+    provider = MockSlotProvider(PROVISION)
+    pool = WarmPool(provider, {"SIL": 2})
+    assert pool.wait_ready(5)
+    repo = InMemoryExecutionRepo()
+    runner = LocalMockRunner(provider, pool)
+    engine = ExecutionEngine(
+        repo, runner=as_engine_runner(runner, lambda ex: "SIL"), max_workers=2
+    )
+    ids = [repo.create(ExecutionCreate(reservation_id="r")).id for _ in range(2)]
+    t0 = time.perf_counter()
+    for eid in ids:
+        engine.submit(eid, "SIL")
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        if all(repo.get(e).status == ExecutionStatus.COMPLETED for e in ids):
+            break
+        time.sleep(0.01)
+    elapsed = time.perf_counter() - t0
+    engine.shutdown()
+    try:
+        assert all(repo.get(e).status == ExecutionStatus.COMPLETED for e in ids)
+        assert elapsed < PROVISION  # no cold start on the execution path
+        assert pool.stats().hits == 2
+    finally:
+        pool.close()
+
+
+def test_mock_runner_without_pool_and_cancel():
+    provider = MockSlotProvider(0.0)
+    runner = LocalMockRunner(provider, run_seconds=5)
+    ex = InMemoryExecutionRepo().create(ExecutionCreate(reservation_id="r"))
+    cancel = Event()
+    cancel.set()
+    result, bundle = asyncio.run(run_lifecycle(runner, ex, cancel, "SIL"))
+    assert result.cancelled
+    assert bundle.uri.endswith(f"{ex.id}/artifacts.tar.gz")
+    assert (provider.created, provider.destroyed) == (1, 1)